@@ -0,0 +1,57 @@
+"""
+Per-row decode cost of a synthetic FetchResults page: the get_value()
+probing loop against RowDecoder's schema-resolved accessors.
+
+    python benchmarks/bench_decode.py [rows] [columns]
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pyhs2.TCLIService.ttypes import TRow, TColumnValue, TI32Value, TI64Value, TDoubleValue, TStringValue
+from pyhs2.decoders import RowDecoder, get_value
+
+CELLS = [
+    ('INT_TYPE', lambda i: TColumnValue(i32Val=TI32Value(i))),
+    ('BIGINT_TYPE', lambda i: TColumnValue(i64Val=TI64Value(i))),
+    ('DOUBLE_TYPE', lambda i: TColumnValue(doubleVal=TDoubleValue(i * 0.5))),
+    ('STRING_TYPE', lambda i: TColumnValue(stringVal=TStringValue(str(i)))),
+]
+
+
+def make_page(nrows, ncols):
+    cells = [CELLS[c % len(CELLS)] for c in xrange(ncols)]
+    rows = [TRow(colVals=[make(r) for _, make in cells]) for r in xrange(nrows)]
+    return [typeName for typeName, _ in cells], rows
+
+
+def decode_probing(rows):
+    out = []
+    for row in rows:
+        rowData = []
+        for col in row.colVals:
+            rowData.append(get_value(col))
+        out.append(rowData)
+    return out
+
+
+def main():
+    nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    ncols = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    types, rows = make_page(nrows, ncols)
+    decoder = RowDecoder.from_types(types)
+    assert decoder.decode_rows(rows) == decode_probing(rows)
+
+    probing = min(timeit.repeat(lambda: decode_probing(rows), number=1, repeat=5))
+    dispatch = min(timeit.repeat(lambda: decoder.decode_rows(rows), number=1, repeat=5))
+    print 'rows=%d columns=%d' % (nrows, ncols)
+    print 'get_value probing: %.3f us/row' % (probing / nrows * 1e6)
+    print 'RowDecoder:        %.3f us/row' % (dispatch / nrows * 1e6)
+    print 'speedup:           %.2fx' % (probing / dispatch)
+
+
+if __name__ == '__main__':
+    main()
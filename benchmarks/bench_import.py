@@ -0,0 +1,108 @@
+"""
+Cold-start cost of importing the sync client, before and after a change:
+the pyhs2 package of a baseline git revision (the repository's first
+commit by default) against the working tree. Each measurement runs in a
+fresh interpreter and reports the best time and the modules it loaded.
+
+    python benchmarks/bench_import.py [--baseline REV] [--repeat N]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+before = set(m for m in sys.modules if sys.modules[m] is not None)
+start = time.time()
+try:
+    %s
+except ImportError as e:
+    sys.stdout.write('error %%s' %% e)
+    sys.exit()
+elapsed = time.time() - start
+loaded = [m for m in sys.modules if sys.modules[m] is not None and m not in before]
+heavy = sorted(m for m in ('tornado', 'sasl', 'pyhs2.TCLIServiceTornado', 'pyhs2.cache', 'pyhs2.converters',
+                           'pyhs2.prefetch', 'pyhs2.instrumentation', 'uuid') if sys.modules.get(m))
+sys.stdout.write('%%f %%d %%s' %% (elapsed, len(loaded), ','.join(heavy)))
+"""
+
+CASES = [
+    ('sync', 'import pyhs2; from pyhs2.connections import Connection'),
+    ('tornado', 'import pyhs2; from pyhs2.connections_tornado import TornadoConnection'),
+]
+
+
+def first_commit():
+    return subprocess.check_output(['git', 'rev-list', '--max-parents=0', 'HEAD'], cwd=ROOT).split()[-1]
+
+
+def export_tree(rev, directory):
+    """Write the pyhs2 package as of rev into directory."""
+    archive = subprocess.Popen(['git', 'archive', rev, 'pyhs2'], cwd=ROOT, stdout=subprocess.PIPE)
+    subprocess.check_call(['tar', '-x', '-C', directory], stdin=archive.stdout)
+    if archive.wait():
+        raise subprocess.CalledProcessError(archive.returncode, 'git archive')
+
+
+def compile_tree(root):
+    # Bytecode may not be written on import (PYTHONDONTWRITEBYTECODE), and
+    # compiling must not be counted as importing.
+    subprocess.check_call([sys.executable, '-m', 'compileall', '-q', os.path.join(root, 'pyhs2')],
+                          stdout=open(os.devnull, 'w'))
+
+
+def measure(root, statement, repeat):
+    """
+    (best seconds, modules loaded, heavy modules among them), or the import
+    error's message when statement fails in that tree.
+    """
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    best = None
+    for _ in xrange(repeat):
+        out = subprocess.check_output([sys.executable, '-c', PROBE % statement], env=env, cwd=root)
+        if out.startswith('error '):
+            return out[len('error '):]
+        elapsed, count, heavy = out.split(' ', 2)
+        if best is None or float(elapsed) < best[0]:
+            best = (float(elapsed), int(count), heavy)
+    return best
+
+
+def report(label, result):
+    if isinstance(result, str):
+        print '  %-9s import fails: %s' % (label, result)
+    else:
+        elapsed, count, heavy = result
+        print '  %-9s %7.1f ms  %4d modules  heavy: %s' % (label, elapsed * 1000, count, heavy or '-')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pyhs2 import cost, baseline revision vs working tree')
+    parser.add_argument('--baseline', help='git revision to compare with, default the first commit')
+    parser.add_argument('--repeat', type=int, default=10, help='runs per measurement; the best is kept')
+    options = parser.parse_args()
+    baseline = options.baseline or first_commit()
+    directory = tempfile.mkdtemp(prefix='pyhs2-baseline-')
+    try:
+        export_tree(baseline, directory)
+        compile_tree(directory)
+        compile_tree(ROOT)
+        for name, statement in CASES:
+            before = measure(directory, statement, options.repeat)
+            after = measure(ROOT, statement, options.repeat)
+            print '%s (%s)' % (name, statement)
+            report('before', before)
+            report('after', after)
+            if not isinstance(before, str) and not isinstance(after, str):
+                print '  saves %.1f ms and %d modules' % ((before[0] - after[0]) * 1000, before[1] - after[1])
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Time and per-row memory of each row factory when materializing a columnar
+result set (the rows are built from in-memory column buffers, so only the
+row construction is measured).
+
+    python benchmarks/bench_rows.py [rows] [columns]
+"""
+import os
+import sys
+import time
+from itertools import islice
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pyhs2.decoders import rows_from_columns
+from pyhs2.rows import dict_rows, list_rows, named_rows, tuple_rows
+
+FACTORIES = [('list', list_rows), ('tuple', tuple_rows), ('named', named_rows), ('dict', dict_rows)]
+
+
+def make_columns(nrows, ncols):
+    return [[i if c % 2 else str(i) for i in xrange(nrows)] for c in xrange(ncols)]
+
+
+def row_size(row):
+    # Only the row object itself: the values are shared by every factory.
+    return sys.getsizeof(row)
+
+
+def main():
+    nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    ncols = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    columns = make_columns(nrows, ncols)
+    names = ['t.col%d' % c for c in xrange(ncols)]
+    print 'rows=%d columns=%d' % (nrows, ncols)
+    print '%-7s %10s %10s %12s' % ('factory', 'us/row', 'bytes/row', 'MB total')
+    baseline = None
+    for label, factory in FACTORIES:
+        make = factory(names)
+        best = None
+        for _ in xrange(3):
+            start = time.time()
+            rows = list(rows_from_columns(columns, make))
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        size = sum(row_size(row) for row in islice(rows, 1000)) / 1000.0
+        del rows
+        print '%-7s %10.3f %10.1f %12.1f' % (label, best / nrows * 1e6, size, size * nrows / 1e6)
+        if baseline is None:
+            baseline = (best, size)
+        else:
+            print '       %.2fx time, %.2fx memory vs list' % (best / baseline[0], size / baseline[1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+Benchmark suite run against FakeHiveServer2, the in-process HiveServer2
+stand-in from pyhs2.testing, over local sockets. Results are printed as
+JSON (or written to --output) so CI can diff them across commits.
+
+    python benchmarks/run.py [--rows N] [--width N] [--repeat N] [--latency S] [--only fetch,handshake] [--output FILE]
+
+Benchmarks:
+    fetch         rows/s and MB/s of Cursor.fetchall, per row factory
+    get_value     per-cell decode cost, get_value probing vs RowDecoder
+    sasl_framing  fetch throughput over PLAIN SASL framing vs NOSASL
+    handshake     Connection.__init__ + close latency, NOSASL and PLAIN
+    tornado       fetch throughput of the sync, aio and Tornado clients (PLAIN)
+
+Timings are the best of --repeat runs; the server shares the client's
+process and GIL, so compare numbers from the same machine only.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import the checkout's pyhs2 without installing it or setting PYTHONPATH.
+sys.path.insert(0, ROOT)
+
+import bench_decode
+from pyhs2.connections import Connection
+from pyhs2.decoders import RowDecoder
+from pyhs2.rows import dict_rows, list_rows, tuple_rows
+from pyhs2.testing import FakeHiveServer2, PlainConnection, PlainSasl
+
+try:
+    from tornado import gen
+    from tornado.ioloop import IOLoop
+except ImportError:
+    gen = IOLoop = None
+
+QUERY = 'SELECT * FROM bench'
+
+
+def best_of(repeat, func):
+    """Run func() repeat times; return the fastest time and its result."""
+    best = None
+    for _ in xrange(repeat):
+        start = time.time()
+        result = func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, result)
+    return best
+
+
+def throughput(seconds, rows, nbytes):
+    return {
+        'seconds': round(seconds, 6),
+        'rows': rows,
+        'bytes': nbytes,
+        'rows_per_s': round(rows / seconds, 1),
+        'mb_per_s': round(nbytes / seconds / 1e6, 3),
+    }
+
+
+def start_server(options, authMechanism='NOSASL'):
+    server = FakeHiveServer2(authMechanism=authMechanism, latency=options.latency)
+    server.add_table('bench', width=options.width, rows=options.rows)
+    return server.start()
+
+
+def timed_fetch(server, cursor):
+    """Execute QUERY and fetch every row; returns (rows, bytes received)."""
+    sent = server.bytesSent
+    cursor.execute(QUERY)
+    rows = len(cursor.fetchall())
+    return rows, server.bytesSent - sent
+
+
+def connect(server, factory=Connection):
+    return factory(host=server.host, port=server.port, authMechanism=server.authMechanism,
+                   user='bench', password='bench')
+
+
+def bench_fetch(options):
+    results = {}
+    server = start_server(options)
+    try:
+        with connect(server) as conn:
+            for label, factory in [('list', list_rows), ('tuple', tuple_rows), ('dict', dict_rows)]:
+                with conn.cursor() as cursor:
+                    cursor.rowFactory = factory
+                    seconds, (rows, nbytes) = best_of(options.repeat, lambda: timed_fetch(server, cursor))
+                results[label] = throughput(seconds, rows, nbytes)
+    finally:
+        server.stop()
+    return results
+
+
+def bench_get_value(options):
+    types, rows = bench_decode.make_page(min(options.rows, 10000), options.width)
+    decoder = RowDecoder.from_types(types)
+    cells = float(len(rows) * options.width)
+    probing = min(timeit.repeat(lambda: bench_decode.decode_probing(rows), number=1, repeat=options.repeat))
+    dispatch = min(timeit.repeat(lambda: decoder.decode_rows(rows), number=1, repeat=options.repeat))
+    return {
+        'cells': int(cells),
+        'get_value_ns_per_cell': round(probing / cells * 1e9, 1),
+        'row_decoder_ns_per_cell': round(dispatch / cells * 1e9, 1),
+        'speedup': round(probing / dispatch, 2),
+    }
+
+
+def bench_sasl_framing(options):
+    results = {}
+    for label, authMechanism in [('nosasl', 'NOSASL'), ('plain', 'PLAIN')]:
+        server = start_server(options, authMechanism)
+        try:
+            with connect(server, PlainConnection) as conn:
+                with conn.cursor() as cursor:
+                    seconds, (rows, nbytes) = best_of(options.repeat, lambda: timed_fetch(server, cursor))
+            results[label] = throughput(seconds, rows, nbytes)
+        finally:
+            server.stop()
+    results['time_overhead'] = round(results['plain']['seconds'] / results['nosasl']['seconds'] - 1, 4)
+    results['framing_bytes'] = results['plain']['bytes'] - results['nosasl']['bytes']
+    return results
+
+
+def latencies(iterations, func):
+    samples = []
+    for _ in xrange(iterations):
+        start = time.time()
+        func()
+        samples.append(time.time() - start)
+    samples.sort()
+    return {
+        'iterations': iterations,
+        'min_ms': round(samples[0] * 1e3, 3),
+        'median_ms': round(samples[len(samples) // 2] * 1e3, 3),
+        'max_ms': round(samples[-1] * 1e3, 3),
+    }
+
+
+def bench_handshake(options):
+    iterations = options.repeat * 20
+    results = {}
+    for label, authMechanism in [('nosasl', 'NOSASL'), ('plain', 'PLAIN')]:
+        server = start_server(options, authMechanism)
+        try:
+            results[label] = latencies(iterations, lambda: connect(server, PlainConnection).close())
+        finally:
+            server.stop()
+    return results
+
+
+def bench_tornado(options):
+    # The Tornado transport always frames messages, which only the PLAIN
+    # server does, so all three clients are timed over PLAIN.
+    if gen is None:
+        return {'skipped': 'tornado is not installed'}
+    from pyhs2.aio import AsyncConnection
+    from pyhs2.connections_tornado import TornadoConnection
+
+    class PlainAsyncConnection(PlainSasl, AsyncConnection):
+        pass
+
+    class PlainTornadoConnection(PlainSasl, TornadoConnection):
+        pass
+
+    def sync_fetch(server):
+        with connect(server, PlainConnection) as conn:
+            with conn.cursor() as cursor:
+                return timed_fetch(server, cursor)
+
+    @gen.coroutine
+    def aio_fetch(server):
+        conn = connect(server, PlainAsyncConnection)
+        yield conn.open()
+        try:
+            sent = server.bytesSent
+            cursor = conn.cursor()
+            yield cursor.execute(QUERY)
+            rows = yield cursor.fetchall()
+            yield cursor.close()
+            raise gen.Return((len(rows), server.bytesSent - sent))
+        finally:
+            yield conn.close()
+
+    @gen.coroutine
+    def tornado_fetch(server):
+        conn = connect(server, PlainTornadoConnection)
+        yield gen.Task(conn.connect, database=None, configuration=None)
+        sent = server.bytesSent
+        cursor = conn.cursor()
+        yield gen.Task(cursor.execute, QUERY)
+        rows = yield gen.Task(cursor.fetch)
+        yield gen.Task(cursor.close)
+        nbytes = server.bytesSent - sent
+        yield gen.Task(conn.close)
+        raise gen.Return((len(rows), nbytes))
+
+    results = {}
+    server = start_server(options, 'PLAIN')
+    try:
+        loop = IOLoop.current()
+        for label, run in [('sync', lambda: sync_fetch(server)),
+                           ('aio', lambda: loop.run_sync(lambda: aio_fetch(server))),
+                           ('tornado', lambda: loop.run_sync(lambda: tornado_fetch(server)))]:
+            seconds, (rows, nbytes) = best_of(options.repeat, run)
+            results[label] = throughput(seconds, rows, nbytes)
+    finally:
+        server.stop()
+    return results
+
+
+BENCHMARKS = [
+    ('fetch', bench_fetch),
+    ('get_value', bench_get_value),
+    ('sasl_framing', bench_sasl_framing),
+    ('handshake', bench_handshake),
+    ('tornado', bench_tornado),
+]
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                       stderr=open(os.devnull, 'w')).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='pyhs2 benchmarks against FakeHiveServer2')
+    parser.add_argument('--rows', type=int, default=100000, help='rows in the benchmark table')
+    parser.add_argument('--width', type=int, default=10, help='columns in the benchmark table')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement; the best is kept')
+    parser.add_argument('--latency', type=float, default=0, help='seconds the server sleeps per call')
+    parser.add_argument('--only', help='comma-separated benchmark names, default all')
+    parser.add_argument('--output', help='write the JSON here instead of stdout')
+    options = parser.parse_args(argv)
+    names = [name for name, _ in BENCHMARKS]
+    options.only = options.only.split(',') if options.only else names
+    unknown = set(options.only) - set(names)
+    if unknown:
+        parser.error('unknown benchmarks: %s' % ', '.join(sorted(unknown)))
+    return options
+
+
+def main(argv=None):
+    options = parse_args(sys.argv[1:] if argv is None else argv)
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': int(time.time()),
+            'rows': options.rows,
+            'width': options.width,
+            'repeat': options.repeat,
+            'latency': options.latency,
+        },
+        'results': {},
+    }
+    for name, bench in BENCHMARKS:
+        if name in options.only:
+            report['results'][name] = bench(options)
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print output
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 import datetime
 from tornado import gen, ioloop
-from pyhs2.connections import TornadoConnection
+from pyhs2.connections_tornado import TornadoConnection
 
 # fill in your server settings...
 HIVE_SERVER_SETTINGS = dict(
@@ -21,6 +21,10 @@ PRIMITIVE_TYPES = set([
     8,
     9,
     15,
+    16,
+    17,
+    18,
+    19,
 ])
 COMPLEX_TYPES = set([
     10,
@@ -49,4 +53,11 @@ TYPE_NAMES = {
     12 : "STRUCT",
     13 : "UNIONTYPE",
     15 : "DECIMAL",
+    16 : "NULL",
+    17 : "DATE",
+    18 : "VARCHAR",
+    19 : "CHAR",
 }
+CHARACTER_MAXIMUM_LENGTH = "characterMaximumLength"
+PRECISION = "precision"
+SCALE = "scale"
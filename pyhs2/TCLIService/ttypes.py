@@ -18,13 +18,28 @@ except:
 
 class TProtocolVersion:
   HIVE_CLI_SERVICE_PROTOCOL_V1 = 0
+  HIVE_CLI_SERVICE_PROTOCOL_V2 = 1
+  HIVE_CLI_SERVICE_PROTOCOL_V3 = 2
+  HIVE_CLI_SERVICE_PROTOCOL_V4 = 3
+  HIVE_CLI_SERVICE_PROTOCOL_V5 = 4
+  HIVE_CLI_SERVICE_PROTOCOL_V6 = 5
 
   _VALUES_TO_NAMES = {
     0: "HIVE_CLI_SERVICE_PROTOCOL_V1",
+    1: "HIVE_CLI_SERVICE_PROTOCOL_V2",
+    2: "HIVE_CLI_SERVICE_PROTOCOL_V3",
+    3: "HIVE_CLI_SERVICE_PROTOCOL_V4",
+    4: "HIVE_CLI_SERVICE_PROTOCOL_V5",
+    5: "HIVE_CLI_SERVICE_PROTOCOL_V6",
   }
 
   _NAMES_TO_VALUES = {
     "HIVE_CLI_SERVICE_PROTOCOL_V1": 0,
+    "HIVE_CLI_SERVICE_PROTOCOL_V2": 1,
+    "HIVE_CLI_SERVICE_PROTOCOL_V3": 2,
+    "HIVE_CLI_SERVICE_PROTOCOL_V4": 3,
+    "HIVE_CLI_SERVICE_PROTOCOL_V5": 4,
+    "HIVE_CLI_SERVICE_PROTOCOL_V6": 5,
   }
 
 class TTypeId:
@@ -44,6 +59,10 @@ class TTypeId:
   UNION_TYPE = 13
   USER_DEFINED_TYPE = 14
   DECIMAL_TYPE = 15
+  NULL_TYPE = 16
+  DATE_TYPE = 17
+  VARCHAR_TYPE = 18
+  CHAR_TYPE = 19
 
   _VALUES_TO_NAMES = {
     0: "BOOLEAN_TYPE",
@@ -62,6 +81,10 @@ class TTypeId:
     13: "UNION_TYPE",
     14: "USER_DEFINED_TYPE",
     15: "DECIMAL_TYPE",
+    16: "NULL_TYPE",
+    17: "DATE_TYPE",
+    18: "VARCHAR_TYPE",
+    19: "CHAR_TYPE",
   }
 
   _NAMES_TO_VALUES = {
@@ -81,6 +104,10 @@ class TTypeId:
     "UNION_TYPE": 13,
     "USER_DEFINED_TYPE": 14,
     "DECIMAL_TYPE": 15,
+    "NULL_TYPE": 16,
+    "DATE_TYPE": 17,
+    "VARCHAR_TYPE": 18,
+    "CHAR_TYPE": 19,
   }
 
 class TStatusCode:
@@ -114,6 +141,7 @@ class TOperationState:
   CLOSED_STATE = 4
   ERROR_STATE = 5
   UKNOWN_STATE = 6
+  PENDING_STATE = 7
 
   _VALUES_TO_NAMES = {
     0: "INITIALIZED_STATE",
@@ -123,6 +151,7 @@ class TOperationState:
     4: "CLOSED_STATE",
     5: "ERROR_STATE",
     6: "UKNOWN_STATE",
+    7: "PENDING_STATE",
   }
 
   _NAMES_TO_VALUES = {
@@ -133,6 +162,7 @@ class TOperationState:
     "CLOSED_STATE": 4,
     "ERROR_STATE": 5,
     "UKNOWN_STATE": 6,
+    "PENDING_STATE": 7,
   }
 
 class TOperationType:
@@ -346,19 +376,167 @@ class TFetchOrientation:
   }
 
 
+class TTypeQualifierValue:
+  """
+  Attributes:
+   - i32Value
+   - stringValue
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'i32Value', None, None, ), # 1
+    (2, TType.STRING, 'stringValue', None, None, ), # 2
+  )
+
+  def __init__(self, i32Value=None, stringValue=None,):
+    self.i32Value = i32Value
+    self.stringValue = stringValue
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.i32Value = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.stringValue = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TTypeQualifierValue')
+    if self.i32Value is not None:
+      oprot.writeFieldBegin('i32Value', TType.I32, 1)
+      oprot.writeI32(self.i32Value)
+      oprot.writeFieldEnd()
+    if self.stringValue is not None:
+      oprot.writeFieldBegin('stringValue', TType.STRING, 2)
+      oprot.writeString(self.stringValue)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TTypeQualifiers:
+  """
+  Attributes:
+   - qualifiers
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.MAP, 'qualifiers', (TType.STRING,None,TType.STRUCT,(TTypeQualifierValue, TTypeQualifierValue.thrift_spec)), None, ), # 1
+  )
+
+  def __init__(self, qualifiers=None,):
+    self.qualifiers = qualifiers
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.MAP:
+          self.qualifiers = {}
+          (_ktype1, _vtype2, _size0 ) = iprot.readMapBegin()
+          for _i4 in xrange(_size0):
+            _key5 = iprot.readString();
+            _val6 = TTypeQualifierValue()
+            _val6.read(iprot)
+            self.qualifiers[_key5] = _val6
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TTypeQualifiers')
+    if self.qualifiers is not None:
+      oprot.writeFieldBegin('qualifiers', TType.MAP, 1)
+      oprot.writeMapBegin(TType.STRING, TType.STRUCT, len(self.qualifiers))
+      for kiter7,viter8 in self.qualifiers.items():
+        oprot.writeString(kiter7)
+        viter8.write(oprot)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.qualifiers is None:
+      raise TProtocol.TProtocolException(message='Required field qualifiers is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 class TPrimitiveTypeEntry:
   """
   Attributes:
    - type
+   - typeQualifiers
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.I32, 'type', None, None, ), # 1
+    (2, TType.STRUCT, 'typeQualifiers', (TTypeQualifiers, TTypeQualifiers.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, type=None,):
+  def __init__(self, type=None, typeQualifiers=None,):
     self.type = type
+    self.typeQualifiers = typeQualifiers
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -374,6 +552,12 @@ class TPrimitiveTypeEntry:
           self.type = iprot.readI32();
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.typeQualifiers = TTypeQualifiers()
+          self.typeQualifiers.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -388,6 +572,10 @@ class TPrimitiveTypeEntry:
       oprot.writeFieldBegin('type', TType.I32, 1)
       oprot.writeI32(self.type)
       oprot.writeFieldEnd()
+    if self.typeQualifiers is not None:
+      oprot.writeFieldBegin('typeQualifiers', TType.STRUCT, 2)
+      self.typeQualifiers.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -572,11 +760,11 @@ class TStructTypeEntry:
       if fid == 1:
         if ftype == TType.MAP:
           self.nameToTypePtr = {}
-          (_ktype1, _vtype2, _size0 ) = iprot.readMapBegin() 
-          for _i4 in xrange(_size0):
-            _key5 = iprot.readString();
-            _val6 = iprot.readI32();
-            self.nameToTypePtr[_key5] = _val6
+          (_ktype10, _vtype11, _size9 ) = iprot.readMapBegin()
+          for _i13 in xrange(_size9):
+            _key14 = iprot.readString();
+            _val15 = iprot.readI32();
+            self.nameToTypePtr[_key14] = _val15
           iprot.readMapEnd()
         else:
           iprot.skip(ftype)
@@ -593,9 +781,9 @@ class TStructTypeEntry:
     if self.nameToTypePtr is not None:
       oprot.writeFieldBegin('nameToTypePtr', TType.MAP, 1)
       oprot.writeMapBegin(TType.STRING, TType.I32, len(self.nameToTypePtr))
-      for kiter7,viter8 in self.nameToTypePtr.items():
-        oprot.writeString(kiter7)
-        oprot.writeI32(viter8)
+      for kiter16,viter17 in self.nameToTypePtr.items():
+        oprot.writeString(kiter16)
+        oprot.writeI32(viter17)
       oprot.writeMapEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -644,11 +832,11 @@ class TUnionTypeEntry:
       if fid == 1:
         if ftype == TType.MAP:
           self.nameToTypePtr = {}
-          (_ktype10, _vtype11, _size9 ) = iprot.readMapBegin() 
-          for _i13 in xrange(_size9):
-            _key14 = iprot.readString();
-            _val15 = iprot.readI32();
-            self.nameToTypePtr[_key14] = _val15
+          (_ktype19, _vtype20, _size18 ) = iprot.readMapBegin()
+          for _i22 in xrange(_size18):
+            _key23 = iprot.readString();
+            _val24 = iprot.readI32();
+            self.nameToTypePtr[_key23] = _val24
           iprot.readMapEnd()
         else:
           iprot.skip(ftype)
@@ -665,9 +853,9 @@ class TUnionTypeEntry:
     if self.nameToTypePtr is not None:
       oprot.writeFieldBegin('nameToTypePtr', TType.MAP, 1)
       oprot.writeMapBegin(TType.STRING, TType.I32, len(self.nameToTypePtr))
-      for kiter16,viter17 in self.nameToTypePtr.items():
-        oprot.writeString(kiter16)
-        oprot.writeI32(viter17)
+      for kiter25,viter26 in self.nameToTypePtr.items():
+        oprot.writeString(kiter25)
+        oprot.writeI32(viter26)
       oprot.writeMapEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -904,11 +1092,11 @@ class TTypeDesc:
       if fid == 1:
         if ftype == TType.LIST:
           self.types = []
-          (_etype21, _size18) = iprot.readListBegin()
-          for _i22 in xrange(_size18):
-            _elem23 = TTypeEntry()
-            _elem23.read(iprot)
-            self.types.append(_elem23)
+          (_etype30, _size27) = iprot.readListBegin()
+          for _i31 in xrange(_size27):
+            _elem32 = TTypeEntry()
+            _elem32.read(iprot)
+            self.types.append(_elem32)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -925,8 +1113,8 @@ class TTypeDesc:
     if self.types is not None:
       oprot.writeFieldBegin('types', TType.LIST, 1)
       oprot.writeListBegin(TType.STRUCT, len(self.types))
-      for iter24 in self.types:
-        iter24.write(oprot)
+      for iter33 in self.types:
+        iter33.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -1078,11 +1266,11 @@ class TTableSchema:
       if fid == 1:
         if ftype == TType.LIST:
           self.columns = []
-          (_etype28, _size25) = iprot.readListBegin()
-          for _i29 in xrange(_size25):
-            _elem30 = TColumnDesc()
-            _elem30.read(iprot)
-            self.columns.append(_elem30)
+          (_etype37, _size34) = iprot.readListBegin()
+          for _i38 in xrange(_size34):
+            _elem39 = TColumnDesc()
+            _elem39.read(iprot)
+            self.columns.append(_elem39)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -1099,8 +1287,8 @@ class TTableSchema:
     if self.columns is not None:
       oprot.writeFieldBegin('columns', TType.LIST, 1)
       oprot.writeListBegin(TType.STRUCT, len(self.columns))
-      for iter31 in self.columns:
-        iter31.write(oprot)
+      for iter40 in self.columns:
+        iter40.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -1543,37 +1731,22 @@ class TStringValue:
   def __ne__(self, other):
     return not (self == other)
 
-class TColumn:
+class TBoolColumn:
   """
   Attributes:
-   - boolColumn
-   - byteColumn
-   - i16Column
-   - i32Column
-   - i64Column
-   - doubleColumn
-   - stringColumn
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.LIST, 'boolColumn', (TType.STRUCT,(TBoolValue, TBoolValue.thrift_spec)), None, ), # 1
-    (2, TType.LIST, 'byteColumn', (TType.STRUCT,(TByteValue, TByteValue.thrift_spec)), None, ), # 2
-    (3, TType.LIST, 'i16Column', (TType.STRUCT,(TI16Value, TI16Value.thrift_spec)), None, ), # 3
-    (4, TType.LIST, 'i32Column', (TType.STRUCT,(TI32Value, TI32Value.thrift_spec)), None, ), # 4
-    (5, TType.LIST, 'i64Column', (TType.STRUCT,(TI64Value, TI64Value.thrift_spec)), None, ), # 5
-    (6, TType.LIST, 'doubleColumn', (TType.STRUCT,(TDoubleValue, TDoubleValue.thrift_spec)), None, ), # 6
-    (7, TType.LIST, 'stringColumn', (TType.STRUCT,(TStringValue, TStringValue.thrift_spec)), None, ), # 7
+    (1, TType.LIST, 'values', (TType.BOOL,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, boolColumn=None, byteColumn=None, i16Column=None, i32Column=None, i64Column=None, doubleColumn=None, stringColumn=None,):
-    self.boolColumn = boolColumn
-    self.byteColumn = byteColumn
-    self.i16Column = i16Column
-    self.i32Column = i32Column
-    self.i64Column = i64Column
-    self.doubleColumn = doubleColumn
-    self.stringColumn = stringColumn
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1586,79 +1759,17 @@ class TColumn:
         break
       if fid == 1:
         if ftype == TType.LIST:
-          self.boolColumn = []
-          (_etype35, _size32) = iprot.readListBegin()
-          for _i36 in xrange(_size32):
-            _elem37 = TBoolValue()
-            _elem37.read(iprot)
-            self.boolColumn.append(_elem37)
+          self.values = []
+          (_etype300, _size301) = iprot.readListBegin()
+          for _i302 in xrange(_size301):
+            _elem303 = iprot.readBool();
+            self.values.append(_elem303)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.LIST:
-          self.byteColumn = []
-          (_etype41, _size38) = iprot.readListBegin()
-          for _i42 in xrange(_size38):
-            _elem43 = TByteValue()
-            _elem43.read(iprot)
-            self.byteColumn.append(_elem43)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.LIST:
-          self.i16Column = []
-          (_etype47, _size44) = iprot.readListBegin()
-          for _i48 in xrange(_size44):
-            _elem49 = TI16Value()
-            _elem49.read(iprot)
-            self.i16Column.append(_elem49)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.LIST:
-          self.i32Column = []
-          (_etype53, _size50) = iprot.readListBegin()
-          for _i54 in xrange(_size50):
-            _elem55 = TI32Value()
-            _elem55.read(iprot)
-            self.i32Column.append(_elem55)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.LIST:
-          self.i64Column = []
-          (_etype59, _size56) = iprot.readListBegin()
-          for _i60 in xrange(_size56):
-            _elem61 = TI64Value()
-            _elem61.read(iprot)
-            self.i64Column.append(_elem61)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 6:
-        if ftype == TType.LIST:
-          self.doubleColumn = []
-          (_etype65, _size62) = iprot.readListBegin()
-          for _i66 in xrange(_size62):
-            _elem67 = TDoubleValue()
-            _elem67.read(iprot)
-            self.doubleColumn.append(_elem67)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 7:
-        if ftype == TType.LIST:
-          self.stringColumn = []
-          (_etype71, _size68) = iprot.readListBegin()
-          for _i72 in xrange(_size68):
-            _elem73 = TStringValue()
-            _elem73.read(iprot)
-            self.stringColumn.append(_elem73)
-          iprot.readListEnd()
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -1670,60 +1781,26 @@ class TColumn:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TColumn')
-    if self.boolColumn is not None:
-      oprot.writeFieldBegin('boolColumn', TType.LIST, 1)
-      oprot.writeListBegin(TType.STRUCT, len(self.boolColumn))
-      for iter74 in self.boolColumn:
-        iter74.write(oprot)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
-    if self.byteColumn is not None:
-      oprot.writeFieldBegin('byteColumn', TType.LIST, 2)
-      oprot.writeListBegin(TType.STRUCT, len(self.byteColumn))
-      for iter75 in self.byteColumn:
-        iter75.write(oprot)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
-    if self.i16Column is not None:
-      oprot.writeFieldBegin('i16Column', TType.LIST, 3)
-      oprot.writeListBegin(TType.STRUCT, len(self.i16Column))
-      for iter76 in self.i16Column:
-        iter76.write(oprot)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
-    if self.i32Column is not None:
-      oprot.writeFieldBegin('i32Column', TType.LIST, 4)
-      oprot.writeListBegin(TType.STRUCT, len(self.i32Column))
-      for iter77 in self.i32Column:
-        iter77.write(oprot)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
-    if self.i64Column is not None:
-      oprot.writeFieldBegin('i64Column', TType.LIST, 5)
-      oprot.writeListBegin(TType.STRUCT, len(self.i64Column))
-      for iter78 in self.i64Column:
-        iter78.write(oprot)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
-    if self.doubleColumn is not None:
-      oprot.writeFieldBegin('doubleColumn', TType.LIST, 6)
-      oprot.writeListBegin(TType.STRUCT, len(self.doubleColumn))
-      for iter79 in self.doubleColumn:
-        iter79.write(oprot)
+    oprot.writeStructBegin('TBoolColumn')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.BOOL, len(self.values))
+      for iter304 in self.values:
+        oprot.writeBool(iter304)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.stringColumn is not None:
-      oprot.writeFieldBegin('stringColumn', TType.LIST, 7)
-      oprot.writeListBegin(TType.STRUCT, len(self.stringColumn))
-      for iter80 in self.stringColumn:
-        iter80.write(oprot)
-      oprot.writeListEnd()
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -1738,37 +1815,22 @@ class TColumn:
   def __ne__(self, other):
     return not (self == other)
 
-class TColumnValue:
+class TByteColumn:
   """
   Attributes:
-   - boolVal
-   - byteVal
-   - i16Val
-   - i32Val
-   - i64Val
-   - doubleVal
-   - stringVal
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'boolVal', (TBoolValue, TBoolValue.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'byteVal', (TByteValue, TByteValue.thrift_spec), None, ), # 2
-    (3, TType.STRUCT, 'i16Val', (TI16Value, TI16Value.thrift_spec), None, ), # 3
-    (4, TType.STRUCT, 'i32Val', (TI32Value, TI32Value.thrift_spec), None, ), # 4
-    (5, TType.STRUCT, 'i64Val', (TI64Value, TI64Value.thrift_spec), None, ), # 5
-    (6, TType.STRUCT, 'doubleVal', (TDoubleValue, TDoubleValue.thrift_spec), None, ), # 6
-    (7, TType.STRUCT, 'stringVal', (TStringValue, TStringValue.thrift_spec), None, ), # 7
+    (1, TType.LIST, 'values', (TType.BYTE,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, boolVal=None, byteVal=None, i16Val=None, i32Val=None, i64Val=None, doubleVal=None, stringVal=None,):
-    self.boolVal = boolVal
-    self.byteVal = byteVal
-    self.i16Val = i16Val
-    self.i32Val = i32Val
-    self.i64Val = i64Val
-    self.doubleVal = doubleVal
-    self.stringVal = stringVal
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1780,45 +1842,18 @@ class TColumnValue:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRUCT:
-          self.boolVal = TBoolValue()
-          self.boolVal.read(iprot)
+        if ftype == TType.LIST:
+          self.values = []
+          (_etype305, _size306) = iprot.readListBegin()
+          for _i307 in xrange(_size306):
+            _elem308 = iprot.readByte();
+            self.values.append(_elem308)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.byteVal = TByteValue()
-          self.byteVal.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRUCT:
-          self.i16Val = TI16Value()
-          self.i16Val.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.STRUCT:
-          self.i32Val = TI32Value()
-          self.i32Val.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.STRUCT:
-          self.i64Val = TI64Value()
-          self.i64Val.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 6:
-        if ftype == TType.STRUCT:
-          self.doubleVal = TDoubleValue()
-          self.doubleVal.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 7:
-        if ftype == TType.STRUCT:
-          self.stringVal = TStringValue()
-          self.stringVal.read(iprot)
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -1830,39 +1865,26 @@ class TColumnValue:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TColumnValue')
-    if self.boolVal is not None:
-      oprot.writeFieldBegin('boolVal', TType.STRUCT, 1)
-      self.boolVal.write(oprot)
-      oprot.writeFieldEnd()
-    if self.byteVal is not None:
-      oprot.writeFieldBegin('byteVal', TType.STRUCT, 2)
-      self.byteVal.write(oprot)
+    oprot.writeStructBegin('TByteColumn')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.BYTE, len(self.values))
+      for iter309 in self.values:
+        oprot.writeByte(iter309)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.i16Val is not None:
-      oprot.writeFieldBegin('i16Val', TType.STRUCT, 3)
-      self.i16Val.write(oprot)
-      oprot.writeFieldEnd()
-    if self.i32Val is not None:
-      oprot.writeFieldBegin('i32Val', TType.STRUCT, 4)
-      self.i32Val.write(oprot)
-      oprot.writeFieldEnd()
-    if self.i64Val is not None:
-      oprot.writeFieldBegin('i64Val', TType.STRUCT, 5)
-      self.i64Val.write(oprot)
-      oprot.writeFieldEnd()
-    if self.doubleVal is not None:
-      oprot.writeFieldBegin('doubleVal', TType.STRUCT, 6)
-      self.doubleVal.write(oprot)
-      oprot.writeFieldEnd()
-    if self.stringVal is not None:
-      oprot.writeFieldBegin('stringVal', TType.STRUCT, 7)
-      self.stringVal.write(oprot)
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -1877,19 +1899,22 @@ class TColumnValue:
   def __ne__(self, other):
     return not (self == other)
 
-class TRow:
+class TI16Column:
   """
   Attributes:
-   - colVals
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.LIST, 'colVals', (TType.STRUCT,(TColumnValue, TColumnValue.thrift_spec)), None, ), # 1
+    (1, TType.LIST, 'values', (TType.I16,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, colVals=None,):
-    self.colVals = colVals
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1902,15 +1927,19 @@ class TRow:
         break
       if fid == 1:
         if ftype == TType.LIST:
-          self.colVals = []
-          (_etype84, _size81) = iprot.readListBegin()
-          for _i85 in xrange(_size81):
-            _elem86 = TColumnValue()
-            _elem86.read(iprot)
-            self.colVals.append(_elem86)
+          self.values = []
+          (_etype310, _size311) = iprot.readListBegin()
+          for _i312 in xrange(_size311):
+            _elem313 = iprot.readI16();
+            self.values.append(_elem313)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1920,20 +1949,26 @@ class TRow:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TRow')
-    if self.colVals is not None:
-      oprot.writeFieldBegin('colVals', TType.LIST, 1)
-      oprot.writeListBegin(TType.STRUCT, len(self.colVals))
-      for iter87 in self.colVals:
-        iter87.write(oprot)
+    oprot.writeStructBegin('TI16Column')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.I16, len(self.values))
+      for iter314 in self.values:
+        oprot.writeI16(iter314)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.colVals is None:
-      raise TProtocol.TProtocolException(message='Required field colVals is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -1948,25 +1983,22 @@ class TRow:
   def __ne__(self, other):
     return not (self == other)
 
-class TRowSet:
+class TI32Column:
   """
   Attributes:
-   - startRowOffset
-   - rows
-   - columns
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.I64, 'startRowOffset', None, None, ), # 1
-    (2, TType.LIST, 'rows', (TType.STRUCT,(TRow, TRow.thrift_spec)), None, ), # 2
-    (3, TType.LIST, 'columns', (TType.STRUCT,(TColumn, TColumn.thrift_spec)), None, ), # 3
+    (1, TType.LIST, 'values', (TType.I32,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, startRowOffset=None, rows=None, columns=None,):
-    self.startRowOffset = startRowOffset
-    self.rows = rows
-    self.columns = columns
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1978,30 +2010,18 @@ class TRowSet:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.I64:
-          self.startRowOffset = iprot.readI64();
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
         if ftype == TType.LIST:
-          self.rows = []
-          (_etype91, _size88) = iprot.readListBegin()
-          for _i92 in xrange(_size88):
-            _elem93 = TRow()
-            _elem93.read(iprot)
-            self.rows.append(_elem93)
+          self.values = []
+          (_etype315, _size316) = iprot.readListBegin()
+          for _i317 in xrange(_size316):
+            _elem318 = iprot.readI32();
+            self.values.append(_elem318)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.LIST:
-          self.columns = []
-          (_etype97, _size94) = iprot.readListBegin()
-          for _i98 in xrange(_size94):
-            _elem99 = TColumn()
-            _elem99.read(iprot)
-            self.columns.append(_elem99)
-          iprot.readListEnd()
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2013,33 +2033,26 @@ class TRowSet:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TRowSet')
-    if self.startRowOffset is not None:
-      oprot.writeFieldBegin('startRowOffset', TType.I64, 1)
-      oprot.writeI64(self.startRowOffset)
-      oprot.writeFieldEnd()
-    if self.rows is not None:
-      oprot.writeFieldBegin('rows', TType.LIST, 2)
-      oprot.writeListBegin(TType.STRUCT, len(self.rows))
-      for iter100 in self.rows:
-        iter100.write(oprot)
+    oprot.writeStructBegin('TI32Column')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.I32, len(self.values))
+      for iter319 in self.values:
+        oprot.writeI32(iter319)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.columns is not None:
-      oprot.writeFieldBegin('columns', TType.LIST, 3)
-      oprot.writeListBegin(TType.STRUCT, len(self.columns))
-      for iter101 in self.columns:
-        iter101.write(oprot)
-      oprot.writeListEnd()
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.startRowOffset is None:
-      raise TProtocol.TProtocolException(message='Required field startRowOffset is unset!')
-    if self.rows is None:
-      raise TProtocol.TProtocolException(message='Required field rows is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -2054,31 +2067,22 @@ class TRowSet:
   def __ne__(self, other):
     return not (self == other)
 
-class TStatus:
+class TI64Column:
   """
   Attributes:
-   - statusCode
-   - infoMessages
-   - sqlState
-   - errorCode
-   - errorMessage
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.I32, 'statusCode', None, None, ), # 1
-    (2, TType.LIST, 'infoMessages', (TType.STRING,None), None, ), # 2
-    (3, TType.STRING, 'sqlState', None, None, ), # 3
-    (4, TType.I32, 'errorCode', None, None, ), # 4
-    (5, TType.STRING, 'errorMessage', None, None, ), # 5
+    (1, TType.LIST, 'values', (TType.I64,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, statusCode=None, infoMessages=None, sqlState=None, errorCode=None, errorMessage=None,):
-    self.statusCode = statusCode
-    self.infoMessages = infoMessages
-    self.sqlState = sqlState
-    self.errorCode = errorCode
-    self.errorMessage = errorMessage
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2090,33 +2094,18 @@ class TStatus:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.I32:
-          self.statusCode = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
         if ftype == TType.LIST:
-          self.infoMessages = []
-          (_etype105, _size102) = iprot.readListBegin()
-          for _i106 in xrange(_size102):
-            _elem107 = iprot.readString();
-            self.infoMessages.append(_elem107)
+          self.values = []
+          (_etype320, _size321) = iprot.readListBegin()
+          for _i322 in xrange(_size321):
+            _elem323 = iprot.readI64();
+            self.values.append(_elem323)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRING:
-          self.sqlState = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.I32:
-          self.errorCode = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
+      elif fid == 2:
         if ftype == TType.STRING:
-          self.errorMessage = iprot.readString();
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2128,36 +2117,26 @@ class TStatus:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TStatus')
-    if self.statusCode is not None:
-      oprot.writeFieldBegin('statusCode', TType.I32, 1)
-      oprot.writeI32(self.statusCode)
-      oprot.writeFieldEnd()
-    if self.infoMessages is not None:
-      oprot.writeFieldBegin('infoMessages', TType.LIST, 2)
-      oprot.writeListBegin(TType.STRING, len(self.infoMessages))
-      for iter108 in self.infoMessages:
-        oprot.writeString(iter108)
+    oprot.writeStructBegin('TI64Column')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.I64, len(self.values))
+      for iter324 in self.values:
+        oprot.writeI64(iter324)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.sqlState is not None:
-      oprot.writeFieldBegin('sqlState', TType.STRING, 3)
-      oprot.writeString(self.sqlState)
-      oprot.writeFieldEnd()
-    if self.errorCode is not None:
-      oprot.writeFieldBegin('errorCode', TType.I32, 4)
-      oprot.writeI32(self.errorCode)
-      oprot.writeFieldEnd()
-    if self.errorMessage is not None:
-      oprot.writeFieldBegin('errorMessage', TType.STRING, 5)
-      oprot.writeString(self.errorMessage)
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.statusCode is None:
-      raise TProtocol.TProtocolException(message='Required field statusCode is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -2172,22 +2151,22 @@ class TStatus:
   def __ne__(self, other):
     return not (self == other)
 
-class THandleIdentifier:
+class TDoubleColumn:
   """
   Attributes:
-   - guid
-   - secret
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'guid', None, None, ), # 1
-    (2, TType.STRING, 'secret', None, None, ), # 2
+    (1, TType.LIST, 'values', (TType.DOUBLE,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, guid=None, secret=None,):
-    self.guid = guid
-    self.secret = secret
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2199,13 +2178,18 @@ class THandleIdentifier:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.guid = iprot.readString();
+        if ftype == TType.LIST:
+          self.values = []
+          (_etype325, _size326) = iprot.readListBegin()
+          for _i327 in xrange(_size326):
+            _elem328 = iprot.readDouble();
+            self.values.append(_elem328)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRING:
-          self.secret = iprot.readString();
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2217,23 +2201,26 @@ class THandleIdentifier:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('THandleIdentifier')
-    if self.guid is not None:
-      oprot.writeFieldBegin('guid', TType.STRING, 1)
-      oprot.writeString(self.guid)
+    oprot.writeStructBegin('TDoubleColumn')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.DOUBLE, len(self.values))
+      for iter329 in self.values:
+        oprot.writeDouble(iter329)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.secret is not None:
-      oprot.writeFieldBegin('secret', TType.STRING, 2)
-      oprot.writeString(self.secret)
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.guid is None:
-      raise TProtocol.TProtocolException(message='Required field guid is unset!')
-    if self.secret is None:
-      raise TProtocol.TProtocolException(message='Required field secret is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -2248,19 +2235,22 @@ class THandleIdentifier:
   def __ne__(self, other):
     return not (self == other)
 
-class TSessionHandle:
+class TStringColumn:
   """
   Attributes:
-   - sessionId
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'sessionId', (THandleIdentifier, THandleIdentifier.thrift_spec), None, ), # 1
+    (1, TType.LIST, 'values', (TType.STRING,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, sessionId=None,):
-    self.sessionId = sessionId
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2272,9 +2262,18 @@ class TSessionHandle:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRUCT:
-          self.sessionId = THandleIdentifier()
-          self.sessionId.read(iprot)
+        if ftype == TType.LIST:
+          self.values = []
+          (_etype330, _size331) = iprot.readListBegin()
+          for _i332 in xrange(_size331):
+            _elem333 = iprot.readString();
+            self.values.append(_elem333)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2286,17 +2285,26 @@ class TSessionHandle:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TSessionHandle')
-    if self.sessionId is not None:
-      oprot.writeFieldBegin('sessionId', TType.STRUCT, 1)
-      self.sessionId.write(oprot)
+    oprot.writeStructBegin('TStringColumn')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRING, len(self.values))
+      for iter334 in self.values:
+        oprot.writeString(iter334)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.sessionId is None:
-      raise TProtocol.TProtocolException(message='Required field sessionId is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -2311,28 +2319,22 @@ class TSessionHandle:
   def __ne__(self, other):
     return not (self == other)
 
-class TOperationHandle:
+class TBinaryColumn:
   """
   Attributes:
-   - operationId
-   - operationType
-   - hasResultSet
-   - modifiedRowCount
+   - values
+   - nulls
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'operationId', (THandleIdentifier, THandleIdentifier.thrift_spec), None, ), # 1
-    (2, TType.I32, 'operationType', None, None, ), # 2
-    (3, TType.BOOL, 'hasResultSet', None, None, ), # 3
-    (4, TType.DOUBLE, 'modifiedRowCount', None, None, ), # 4
+    (1, TType.LIST, 'values', (TType.STRING,None), None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
   )
 
-  def __init__(self, operationId=None, operationType=None, hasResultSet=None, modifiedRowCount=None,):
-    self.operationId = operationId
-    self.operationType = operationType
-    self.hasResultSet = hasResultSet
-    self.modifiedRowCount = modifiedRowCount
+  def __init__(self, values=None, nulls=None,):
+    self.values = values
+    self.nulls = nulls
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2344,24 +2346,18 @@ class TOperationHandle:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRUCT:
-          self.operationId = THandleIdentifier()
-          self.operationId.read(iprot)
+        if ftype == TType.LIST:
+          self.values = []
+          (_etype335, _size336) = iprot.readListBegin()
+          for _i337 in xrange(_size336):
+            _elem338 = iprot.readString();
+            self.values.append(_elem338)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I32:
-          self.operationType = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.BOOL:
-          self.hasResultSet = iprot.readBool();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.DOUBLE:
-          self.modifiedRowCount = iprot.readDouble();
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2373,33 +2369,26 @@ class TOperationHandle:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TOperationHandle')
-    if self.operationId is not None:
-      oprot.writeFieldBegin('operationId', TType.STRUCT, 1)
-      self.operationId.write(oprot)
-      oprot.writeFieldEnd()
-    if self.operationType is not None:
-      oprot.writeFieldBegin('operationType', TType.I32, 2)
-      oprot.writeI32(self.operationType)
-      oprot.writeFieldEnd()
-    if self.hasResultSet is not None:
-      oprot.writeFieldBegin('hasResultSet', TType.BOOL, 3)
-      oprot.writeBool(self.hasResultSet)
+    oprot.writeStructBegin('TBinaryColumn')
+    if self.values is not None:
+      oprot.writeFieldBegin('values', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRING, len(self.values))
+      for iter339 in self.values:
+        oprot.writeString(iter339)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.modifiedRowCount is not None:
-      oprot.writeFieldBegin('modifiedRowCount', TType.DOUBLE, 4)
-      oprot.writeDouble(self.modifiedRowCount)
+    if self.nulls is not None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.operationId is None:
-      raise TProtocol.TProtocolException(message='Required field operationId is unset!')
-    if self.operationType is None:
-      raise TProtocol.TProtocolException(message='Required field operationType is unset!')
-    if self.hasResultSet is None:
-      raise TProtocol.TProtocolException(message='Required field hasResultSet is unset!')
+    if self.values is None:
+      raise TProtocol.TProtocolException(message='Required field values is unset!')
+    if self.nulls is None:
+      raise TProtocol.TProtocolException(message='Required field nulls is unset!')
     return
 
 
@@ -2414,28 +2403,40 @@ class TOperationHandle:
   def __ne__(self, other):
     return not (self == other)
 
-class TOpenSessionReq:
+class TColumn:
   """
   Attributes:
-   - client_protocol
-   - username
-   - password
-   - configuration
+   - boolVal
+   - byteVal
+   - i16Val
+   - i32Val
+   - i64Val
+   - doubleVal
+   - stringVal
+   - binaryVal
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.I32, 'client_protocol', None,     0, ), # 1
-    (2, TType.STRING, 'username', None, None, ), # 2
-    (3, TType.STRING, 'password', None, None, ), # 3
-    (4, TType.MAP, 'configuration', (TType.STRING,None,TType.STRING,None), None, ), # 4
+    (1, TType.STRUCT, 'boolVal', (TBoolColumn, TBoolColumn.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'byteVal', (TByteColumn, TByteColumn.thrift_spec), None, ), # 2
+    (3, TType.STRUCT, 'i16Val', (TI16Column, TI16Column.thrift_spec), None, ), # 3
+    (4, TType.STRUCT, 'i32Val', (TI32Column, TI32Column.thrift_spec), None, ), # 4
+    (5, TType.STRUCT, 'i64Val', (TI64Column, TI64Column.thrift_spec), None, ), # 5
+    (6, TType.STRUCT, 'doubleVal', (TDoubleColumn, TDoubleColumn.thrift_spec), None, ), # 6
+    (7, TType.STRUCT, 'stringVal', (TStringColumn, TStringColumn.thrift_spec), None, ), # 7
+    (8, TType.STRUCT, 'binaryVal', (TBinaryColumn, TBinaryColumn.thrift_spec), None, ), # 8
   )
 
-  def __init__(self, client_protocol=thrift_spec[1][4], username=None, password=None, configuration=None,):
-    self.client_protocol = client_protocol
-    self.username = username
-    self.password = password
-    self.configuration = configuration
+  def __init__(self, boolVal=None, byteVal=None, i16Val=None, i32Val=None, i64Val=None, doubleVal=None, stringVal=None, binaryVal=None,):
+    self.boolVal = boolVal
+    self.byteVal = byteVal
+    self.i16Val = i16Val
+    self.i32Val = i32Val
+    self.i64Val = i64Val
+    self.doubleVal = doubleVal
+    self.stringVal = stringVal
+    self.binaryVal = binaryVal
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2447,29 +2448,1368 @@ class TOpenSessionReq:
       if ftype == TType.STOP:
         break
       if fid == 1:
+        if ftype == TType.STRUCT:
+          self.boolVal = TBoolColumn()
+          self.boolVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.byteVal = TByteColumn()
+          self.byteVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.i16Val = TI16Column()
+          self.i16Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRUCT:
+          self.i32Val = TI32Column()
+          self.i32Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRUCT:
+          self.i64Val = TI64Column()
+          self.i64Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.STRUCT:
+          self.doubleVal = TDoubleColumn()
+          self.doubleVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.STRUCT:
+          self.stringVal = TStringColumn()
+          self.stringVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.STRUCT:
+          self.binaryVal = TBinaryColumn()
+          self.binaryVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TColumn')
+    if self.boolVal is not None:
+      oprot.writeFieldBegin('boolVal', TType.STRUCT, 1)
+      self.boolVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.byteVal is not None:
+      oprot.writeFieldBegin('byteVal', TType.STRUCT, 2)
+      self.byteVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i16Val is not None:
+      oprot.writeFieldBegin('i16Val', TType.STRUCT, 3)
+      self.i16Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i32Val is not None:
+      oprot.writeFieldBegin('i32Val', TType.STRUCT, 4)
+      self.i32Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i64Val is not None:
+      oprot.writeFieldBegin('i64Val', TType.STRUCT, 5)
+      self.i64Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.doubleVal is not None:
+      oprot.writeFieldBegin('doubleVal', TType.STRUCT, 6)
+      self.doubleVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.stringVal is not None:
+      oprot.writeFieldBegin('stringVal', TType.STRUCT, 7)
+      self.stringVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.binaryVal is not None:
+      oprot.writeFieldBegin('binaryVal', TType.STRUCT, 8)
+      self.binaryVal.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TColumnValue:
+  """
+  Attributes:
+   - boolVal
+   - byteVal
+   - i16Val
+   - i32Val
+   - i64Val
+   - doubleVal
+   - stringVal
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'boolVal', (TBoolValue, TBoolValue.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'byteVal', (TByteValue, TByteValue.thrift_spec), None, ), # 2
+    (3, TType.STRUCT, 'i16Val', (TI16Value, TI16Value.thrift_spec), None, ), # 3
+    (4, TType.STRUCT, 'i32Val', (TI32Value, TI32Value.thrift_spec), None, ), # 4
+    (5, TType.STRUCT, 'i64Val', (TI64Value, TI64Value.thrift_spec), None, ), # 5
+    (6, TType.STRUCT, 'doubleVal', (TDoubleValue, TDoubleValue.thrift_spec), None, ), # 6
+    (7, TType.STRUCT, 'stringVal', (TStringValue, TStringValue.thrift_spec), None, ), # 7
+  )
+
+  def __init__(self, boolVal=None, byteVal=None, i16Val=None, i32Val=None, i64Val=None, doubleVal=None, stringVal=None,):
+    self.boolVal = boolVal
+    self.byteVal = byteVal
+    self.i16Val = i16Val
+    self.i32Val = i32Val
+    self.i64Val = i64Val
+    self.doubleVal = doubleVal
+    self.stringVal = stringVal
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.boolVal = TBoolValue()
+          self.boolVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.byteVal = TByteValue()
+          self.byteVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.i16Val = TI16Value()
+          self.i16Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRUCT:
+          self.i32Val = TI32Value()
+          self.i32Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRUCT:
+          self.i64Val = TI64Value()
+          self.i64Val.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.STRUCT:
+          self.doubleVal = TDoubleValue()
+          self.doubleVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.STRUCT:
+          self.stringVal = TStringValue()
+          self.stringVal.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TColumnValue')
+    if self.boolVal is not None:
+      oprot.writeFieldBegin('boolVal', TType.STRUCT, 1)
+      self.boolVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.byteVal is not None:
+      oprot.writeFieldBegin('byteVal', TType.STRUCT, 2)
+      self.byteVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i16Val is not None:
+      oprot.writeFieldBegin('i16Val', TType.STRUCT, 3)
+      self.i16Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i32Val is not None:
+      oprot.writeFieldBegin('i32Val', TType.STRUCT, 4)
+      self.i32Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.i64Val is not None:
+      oprot.writeFieldBegin('i64Val', TType.STRUCT, 5)
+      self.i64Val.write(oprot)
+      oprot.writeFieldEnd()
+    if self.doubleVal is not None:
+      oprot.writeFieldBegin('doubleVal', TType.STRUCT, 6)
+      self.doubleVal.write(oprot)
+      oprot.writeFieldEnd()
+    if self.stringVal is not None:
+      oprot.writeFieldBegin('stringVal', TType.STRUCT, 7)
+      self.stringVal.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TRow:
+  """
+  Attributes:
+   - colVals
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'colVals', (TType.STRUCT,(TColumnValue, TColumnValue.thrift_spec)), None, ), # 1
+  )
+
+  def __init__(self, colVals=None,):
+    self.colVals = colVals
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.colVals = []
+          (_etype93, _size90) = iprot.readListBegin()
+          for _i94 in xrange(_size90):
+            _elem95 = TColumnValue()
+            _elem95.read(iprot)
+            self.colVals.append(_elem95)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TRow')
+    if self.colVals is not None:
+      oprot.writeFieldBegin('colVals', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.colVals))
+      for iter96 in self.colVals:
+        iter96.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.colVals is None:
+      raise TProtocol.TProtocolException(message='Required field colVals is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TRowSet:
+  """
+  Attributes:
+   - startRowOffset
+   - rows
+   - columns
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'startRowOffset', None, None, ), # 1
+    (2, TType.LIST, 'rows', (TType.STRUCT,(TRow, TRow.thrift_spec)), None, ), # 2
+    (3, TType.LIST, 'columns', (TType.STRUCT,(TColumn, TColumn.thrift_spec)), None, ), # 3
+  )
+
+  def __init__(self, startRowOffset=None, rows=None, columns=None,):
+    self.startRowOffset = startRowOffset
+    self.rows = rows
+    self.columns = columns
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I64:
+          self.startRowOffset = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.rows = []
+          (_etype100, _size97) = iprot.readListBegin()
+          for _i101 in xrange(_size97):
+            _elem102 = TRow()
+            _elem102.read(iprot)
+            self.rows.append(_elem102)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST:
+          self.columns = []
+          (_etype106, _size103) = iprot.readListBegin()
+          for _i107 in xrange(_size103):
+            _elem108 = TColumn()
+            _elem108.read(iprot)
+            self.columns.append(_elem108)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TRowSet')
+    if self.startRowOffset is not None:
+      oprot.writeFieldBegin('startRowOffset', TType.I64, 1)
+      oprot.writeI64(self.startRowOffset)
+      oprot.writeFieldEnd()
+    if self.rows is not None:
+      oprot.writeFieldBegin('rows', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.rows))
+      for iter109 in self.rows:
+        iter109.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.columns is not None:
+      oprot.writeFieldBegin('columns', TType.LIST, 3)
+      oprot.writeListBegin(TType.STRUCT, len(self.columns))
+      for iter110 in self.columns:
+        iter110.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.startRowOffset is None:
+      raise TProtocol.TProtocolException(message='Required field startRowOffset is unset!')
+    if self.rows is None:
+      raise TProtocol.TProtocolException(message='Required field rows is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TStatus:
+  """
+  Attributes:
+   - statusCode
+   - infoMessages
+   - sqlState
+   - errorCode
+   - errorMessage
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'statusCode', None, None, ), # 1
+    (2, TType.LIST, 'infoMessages', (TType.STRING,None), None, ), # 2
+    (3, TType.STRING, 'sqlState', None, None, ), # 3
+    (4, TType.I32, 'errorCode', None, None, ), # 4
+    (5, TType.STRING, 'errorMessage', None, None, ), # 5
+  )
+
+  def __init__(self, statusCode=None, infoMessages=None, sqlState=None, errorCode=None, errorMessage=None,):
+    self.statusCode = statusCode
+    self.infoMessages = infoMessages
+    self.sqlState = sqlState
+    self.errorCode = errorCode
+    self.errorMessage = errorMessage
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.statusCode = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.infoMessages = []
+          (_etype114, _size111) = iprot.readListBegin()
+          for _i115 in xrange(_size111):
+            _elem116 = iprot.readString();
+            self.infoMessages.append(_elem116)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.sqlState = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I32:
+          self.errorCode = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.errorMessage = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TStatus')
+    if self.statusCode is not None:
+      oprot.writeFieldBegin('statusCode', TType.I32, 1)
+      oprot.writeI32(self.statusCode)
+      oprot.writeFieldEnd()
+    if self.infoMessages is not None:
+      oprot.writeFieldBegin('infoMessages', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRING, len(self.infoMessages))
+      for iter117 in self.infoMessages:
+        oprot.writeString(iter117)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.sqlState is not None:
+      oprot.writeFieldBegin('sqlState', TType.STRING, 3)
+      oprot.writeString(self.sqlState)
+      oprot.writeFieldEnd()
+    if self.errorCode is not None:
+      oprot.writeFieldBegin('errorCode', TType.I32, 4)
+      oprot.writeI32(self.errorCode)
+      oprot.writeFieldEnd()
+    if self.errorMessage is not None:
+      oprot.writeFieldBegin('errorMessage', TType.STRING, 5)
+      oprot.writeString(self.errorMessage)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.statusCode is None:
+      raise TProtocol.TProtocolException(message='Required field statusCode is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class THandleIdentifier:
+  """
+  Attributes:
+   - guid
+   - secret
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'guid', None, None, ), # 1
+    (2, TType.STRING, 'secret', None, None, ), # 2
+  )
+
+  def __init__(self, guid=None, secret=None,):
+    self.guid = guid
+    self.secret = secret
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.guid = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.secret = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('THandleIdentifier')
+    if self.guid is not None:
+      oprot.writeFieldBegin('guid', TType.STRING, 1)
+      oprot.writeString(self.guid)
+      oprot.writeFieldEnd()
+    if self.secret is not None:
+      oprot.writeFieldBegin('secret', TType.STRING, 2)
+      oprot.writeString(self.secret)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.guid is None:
+      raise TProtocol.TProtocolException(message='Required field guid is unset!')
+    if self.secret is None:
+      raise TProtocol.TProtocolException(message='Required field secret is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TSessionHandle:
+  """
+  Attributes:
+   - sessionId
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'sessionId', (THandleIdentifier, THandleIdentifier.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, sessionId=None,):
+    self.sessionId = sessionId
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.sessionId = THandleIdentifier()
+          self.sessionId.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TSessionHandle')
+    if self.sessionId is not None:
+      oprot.writeFieldBegin('sessionId', TType.STRUCT, 1)
+      self.sessionId.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.sessionId is None:
+      raise TProtocol.TProtocolException(message='Required field sessionId is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TOperationHandle:
+  """
+  Attributes:
+   - operationId
+   - operationType
+   - hasResultSet
+   - modifiedRowCount
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'operationId', (THandleIdentifier, THandleIdentifier.thrift_spec), None, ), # 1
+    (2, TType.I32, 'operationType', None, None, ), # 2
+    (3, TType.BOOL, 'hasResultSet', None, None, ), # 3
+    (4, TType.DOUBLE, 'modifiedRowCount', None, None, ), # 4
+  )
+
+  def __init__(self, operationId=None, operationType=None, hasResultSet=None, modifiedRowCount=None,):
+    self.operationId = operationId
+    self.operationType = operationType
+    self.hasResultSet = hasResultSet
+    self.modifiedRowCount = modifiedRowCount
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.operationId = THandleIdentifier()
+          self.operationId.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.operationType = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.BOOL:
+          self.hasResultSet = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.DOUBLE:
+          self.modifiedRowCount = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TOperationHandle')
+    if self.operationId is not None:
+      oprot.writeFieldBegin('operationId', TType.STRUCT, 1)
+      self.operationId.write(oprot)
+      oprot.writeFieldEnd()
+    if self.operationType is not None:
+      oprot.writeFieldBegin('operationType', TType.I32, 2)
+      oprot.writeI32(self.operationType)
+      oprot.writeFieldEnd()
+    if self.hasResultSet is not None:
+      oprot.writeFieldBegin('hasResultSet', TType.BOOL, 3)
+      oprot.writeBool(self.hasResultSet)
+      oprot.writeFieldEnd()
+    if self.modifiedRowCount is not None:
+      oprot.writeFieldBegin('modifiedRowCount', TType.DOUBLE, 4)
+      oprot.writeDouble(self.modifiedRowCount)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.operationId is None:
+      raise TProtocol.TProtocolException(message='Required field operationId is unset!')
+    if self.operationType is None:
+      raise TProtocol.TProtocolException(message='Required field operationType is unset!')
+    if self.hasResultSet is None:
+      raise TProtocol.TProtocolException(message='Required field hasResultSet is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TOpenSessionReq:
+  """
+  Attributes:
+   - client_protocol
+   - username
+   - password
+   - configuration
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'client_protocol', None,     5, ), # 1
+    (2, TType.STRING, 'username', None, None, ), # 2
+    (3, TType.STRING, 'password', None, None, ), # 3
+    (4, TType.MAP, 'configuration', (TType.STRING,None,TType.STRING,None), None, ), # 4
+  )
+
+  def __init__(self, client_protocol=thrift_spec[1][4], username=None, password=None, configuration=None,):
+    self.client_protocol = client_protocol
+    self.username = username
+    self.password = password
+    self.configuration = configuration
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.client_protocol = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.username = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.password = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.MAP:
+          self.configuration = {}
+          (_ktype119, _vtype120, _size118 ) = iprot.readMapBegin()
+          for _i122 in xrange(_size118):
+            _key123 = iprot.readString();
+            _val124 = iprot.readString();
+            self.configuration[_key123] = _val124
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TOpenSessionReq')
+    if self.client_protocol is not None:
+      oprot.writeFieldBegin('client_protocol', TType.I32, 1)
+      oprot.writeI32(self.client_protocol)
+      oprot.writeFieldEnd()
+    if self.username is not None:
+      oprot.writeFieldBegin('username', TType.STRING, 2)
+      oprot.writeString(self.username)
+      oprot.writeFieldEnd()
+    if self.password is not None:
+      oprot.writeFieldBegin('password', TType.STRING, 3)
+      oprot.writeString(self.password)
+      oprot.writeFieldEnd()
+    if self.configuration is not None:
+      oprot.writeFieldBegin('configuration', TType.MAP, 4)
+      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.configuration))
+      for kiter125,viter126 in self.configuration.items():
+        oprot.writeString(kiter125)
+        oprot.writeString(viter126)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.client_protocol is None:
+      raise TProtocol.TProtocolException(message='Required field client_protocol is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TOpenSessionResp:
+  """
+  Attributes:
+   - status
+   - serverProtocolVersion
+   - sessionHandle
+   - configuration
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.I32, 'serverProtocolVersion', None,     5, ), # 2
+    (3, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 3
+    (4, TType.MAP, 'configuration', (TType.STRING,None,TType.STRING,None), None, ), # 4
+  )
+
+  def __init__(self, status=None, serverProtocolVersion=thrift_spec[2][4], sessionHandle=None, configuration=None,):
+    self.status = status
+    self.serverProtocolVersion = serverProtocolVersion
+    self.sessionHandle = sessionHandle
+    self.configuration = configuration
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.status = TStatus()
+          self.status.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
         if ftype == TType.I32:
-          self.client_protocol = iprot.readI32();
+          self.serverProtocolVersion = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.MAP:
+          self.configuration = {}
+          (_ktype128, _vtype129, _size127 ) = iprot.readMapBegin()
+          for _i131 in xrange(_size127):
+            _key132 = iprot.readString();
+            _val133 = iprot.readString();
+            self.configuration[_key132] = _val133
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TOpenSessionResp')
+    if self.status is not None:
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
+      oprot.writeFieldEnd()
+    if self.serverProtocolVersion is not None:
+      oprot.writeFieldBegin('serverProtocolVersion', TType.I32, 2)
+      oprot.writeI32(self.serverProtocolVersion)
+      oprot.writeFieldEnd()
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 3)
+      self.sessionHandle.write(oprot)
+      oprot.writeFieldEnd()
+    if self.configuration is not None:
+      oprot.writeFieldBegin('configuration', TType.MAP, 4)
+      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.configuration))
+      for kiter134,viter135 in self.configuration.items():
+        oprot.writeString(kiter134)
+        oprot.writeString(viter135)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.status is None:
+      raise TProtocol.TProtocolException(message='Required field status is unset!')
+    if self.serverProtocolVersion is None:
+      raise TProtocol.TProtocolException(message='Required field serverProtocolVersion is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TCloseSessionReq:
+  """
+  Attributes:
+   - sessionHandle
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, sessionHandle=None,):
+    self.sessionHandle = sessionHandle
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TCloseSessionReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TCloseSessionResp:
+  """
+  Attributes:
+   - status
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, status=None,):
+    self.status = status
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.status = TStatus()
+          self.status.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TCloseSessionResp')
+    if self.status is not None:
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.status is None:
+      raise TProtocol.TProtocolException(message='Required field status is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TGetInfoValue:
+  """
+  Attributes:
+   - stringValue
+   - smallIntValue
+   - integerBitmask
+   - integerFlag
+   - binaryValue
+   - lenValue
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'stringValue', None, None, ), # 1
+    (2, TType.I16, 'smallIntValue', None, None, ), # 2
+    (3, TType.I32, 'integerBitmask', None, None, ), # 3
+    (4, TType.I32, 'integerFlag', None, None, ), # 4
+    (5, TType.I32, 'binaryValue', None, None, ), # 5
+    (6, TType.I64, 'lenValue', None, None, ), # 6
+  )
+
+  def __init__(self, stringValue=None, smallIntValue=None, integerBitmask=None, integerFlag=None, binaryValue=None, lenValue=None,):
+    self.stringValue = stringValue
+    self.smallIntValue = smallIntValue
+    self.integerBitmask = integerBitmask
+    self.integerFlag = integerFlag
+    self.binaryValue = binaryValue
+    self.lenValue = lenValue
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.stringValue = iprot.readString();
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.STRING:
-          self.username = iprot.readString();
+        if ftype == TType.I16:
+          self.smallIntValue = iprot.readI16();
         else:
           iprot.skip(ftype)
       elif fid == 3:
-        if ftype == TType.STRING:
-          self.password = iprot.readString();
+        if ftype == TType.I32:
+          self.integerBitmask = iprot.readI32();
         else:
           iprot.skip(ftype)
       elif fid == 4:
-        if ftype == TType.MAP:
-          self.configuration = {}
-          (_ktype110, _vtype111, _size109 ) = iprot.readMapBegin() 
-          for _i113 in xrange(_size109):
-            _key114 = iprot.readString();
-            _val115 = iprot.readString();
-            self.configuration[_key114] = _val115
-          iprot.readMapEnd()
+        if ftype == TType.I32:
+          self.integerFlag = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32:
+          self.binaryValue = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I64:
+          self.lenValue = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TGetInfoValue')
+    if self.stringValue is not None:
+      oprot.writeFieldBegin('stringValue', TType.STRING, 1)
+      oprot.writeString(self.stringValue)
+      oprot.writeFieldEnd()
+    if self.smallIntValue is not None:
+      oprot.writeFieldBegin('smallIntValue', TType.I16, 2)
+      oprot.writeI16(self.smallIntValue)
+      oprot.writeFieldEnd()
+    if self.integerBitmask is not None:
+      oprot.writeFieldBegin('integerBitmask', TType.I32, 3)
+      oprot.writeI32(self.integerBitmask)
+      oprot.writeFieldEnd()
+    if self.integerFlag is not None:
+      oprot.writeFieldBegin('integerFlag', TType.I32, 4)
+      oprot.writeI32(self.integerFlag)
+      oprot.writeFieldEnd()
+    if self.binaryValue is not None:
+      oprot.writeFieldBegin('binaryValue', TType.I32, 5)
+      oprot.writeI32(self.binaryValue)
+      oprot.writeFieldEnd()
+    if self.lenValue is not None:
+      oprot.writeFieldBegin('lenValue', TType.I64, 6)
+      oprot.writeI64(self.lenValue)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TGetInfoReq:
+  """
+  Attributes:
+   - sessionHandle
+   - infoType
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.I32, 'infoType', None, None, ), # 2
+  )
+
+  def __init__(self, sessionHandle=None, infoType=None,):
+    self.sessionHandle = sessionHandle
+    self.infoType = infoType
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.infoType = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TGetInfoReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
+      oprot.writeFieldEnd()
+    if self.infoType is not None:
+      oprot.writeFieldBegin('infoType', TType.I32, 2)
+      oprot.writeI32(self.infoType)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.infoType is None:
+      raise TProtocol.TProtocolException(message='Required field infoType is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class TGetInfoResp:
+  """
+  Attributes:
+   - status
+   - infoValue
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'infoValue', (TGetInfoValue, TGetInfoValue.thrift_spec), None, ), # 2
+  )
+
+  def __init__(self, status=None, infoValue=None,):
+    self.status = status
+    self.infoValue = infoValue
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.status = TStatus()
+          self.status.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.infoValue = TGetInfoValue()
+          self.infoValue.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -2481,33 +3821,23 @@ class TOpenSessionReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TOpenSessionReq')
-    if self.client_protocol is not None:
-      oprot.writeFieldBegin('client_protocol', TType.I32, 1)
-      oprot.writeI32(self.client_protocol)
-      oprot.writeFieldEnd()
-    if self.username is not None:
-      oprot.writeFieldBegin('username', TType.STRING, 2)
-      oprot.writeString(self.username)
-      oprot.writeFieldEnd()
-    if self.password is not None:
-      oprot.writeFieldBegin('password', TType.STRING, 3)
-      oprot.writeString(self.password)
+    oprot.writeStructBegin('TGetInfoResp')
+    if self.status is not None:
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.configuration is not None:
-      oprot.writeFieldBegin('configuration', TType.MAP, 4)
-      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.configuration))
-      for kiter116,viter117 in self.configuration.items():
-        oprot.writeString(kiter116)
-        oprot.writeString(viter117)
-      oprot.writeMapEnd()
+    if self.infoValue is not None:
+      oprot.writeFieldBegin('infoValue', TType.STRUCT, 2)
+      self.infoValue.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.client_protocol is None:
-      raise TProtocol.TProtocolException(message='Required field client_protocol is unset!')
+    if self.status is None:
+      raise TProtocol.TProtocolException(message='Required field status is unset!')
+    if self.infoValue is None:
+      raise TProtocol.TProtocolException(message='Required field infoValue is unset!')
     return
 
 
@@ -2522,28 +3852,28 @@ class TOpenSessionReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TOpenSessionResp:
+class TExecuteStatementReq:
   """
   Attributes:
-   - status
-   - serverProtocolVersion
    - sessionHandle
-   - configuration
+   - statement
+   - confOverlay
+   - runAsync
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.I32, 'serverProtocolVersion', None,     0, ), # 2
-    (3, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 3
-    (4, TType.MAP, 'configuration', (TType.STRING,None,TType.STRING,None), None, ), # 4
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'statement', None, None, ), # 2
+    (3, TType.MAP, 'confOverlay', (TType.STRING,None,TType.STRING,None), None, ), # 3
+    (4, TType.BOOL, 'runAsync', None, False, ), # 4
   )
 
-  def __init__(self, status=None, serverProtocolVersion=thrift_spec[2][4], sessionHandle=None, configuration=None,):
-    self.status = status
-    self.serverProtocolVersion = serverProtocolVersion
+  def __init__(self, sessionHandle=None, statement=None, confOverlay=None, runAsync=thrift_spec[4][4],):
     self.sessionHandle = sessionHandle
-    self.configuration = configuration
+    self.statement = statement
+    self.confOverlay = confOverlay
+    self.runAsync = runAsync
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2556,30 +3886,29 @@ class TOpenSessionResp:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.status = TStatus()
-          self.status.read(iprot)
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I32:
-          self.serverProtocolVersion = iprot.readI32();
+        if ftype == TType.STRING:
+          self.statement = iprot.readString();
         else:
           iprot.skip(ftype)
       elif fid == 3:
-        if ftype == TType.STRUCT:
-          self.sessionHandle = TSessionHandle()
-          self.sessionHandle.read(iprot)
+        if ftype == TType.MAP:
+          self.confOverlay = {}
+          (_ktype137, _vtype138, _size136 ) = iprot.readMapBegin()
+          for _i140 in xrange(_size136):
+            _key141 = iprot.readString();
+            _val142 = iprot.readString();
+            self.confOverlay[_key141] = _val142
+          iprot.readMapEnd()
         else:
           iprot.skip(ftype)
       elif fid == 4:
-        if ftype == TType.MAP:
-          self.configuration = {}
-          (_ktype119, _vtype120, _size118 ) = iprot.readMapBegin() 
-          for _i122 in xrange(_size118):
-            _key123 = iprot.readString();
-            _val124 = iprot.readString();
-            self.configuration[_key123] = _val124
-          iprot.readMapEnd()
+        if ftype == TType.BOOL:
+          self.runAsync = iprot.readBool();
         else:
           iprot.skip(ftype)
       else:
@@ -2591,35 +3920,35 @@ class TOpenSessionResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TOpenSessionResp')
-    if self.status is not None:
-      oprot.writeFieldBegin('status', TType.STRUCT, 1)
-      self.status.write(oprot)
-      oprot.writeFieldEnd()
-    if self.serverProtocolVersion is not None:
-      oprot.writeFieldBegin('serverProtocolVersion', TType.I32, 2)
-      oprot.writeI32(self.serverProtocolVersion)
-      oprot.writeFieldEnd()
+    oprot.writeStructBegin('TExecuteStatementReq')
     if self.sessionHandle is not None:
-      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 3)
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
-    if self.configuration is not None:
-      oprot.writeFieldBegin('configuration', TType.MAP, 4)
-      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.configuration))
-      for kiter125,viter126 in self.configuration.items():
-        oprot.writeString(kiter125)
-        oprot.writeString(viter126)
+    if self.statement is not None:
+      oprot.writeFieldBegin('statement', TType.STRING, 2)
+      oprot.writeString(self.statement)
+      oprot.writeFieldEnd()
+    if self.confOverlay is not None:
+      oprot.writeFieldBegin('confOverlay', TType.MAP, 3)
+      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.confOverlay))
+      for kiter143,viter144 in self.confOverlay.items():
+        oprot.writeString(kiter143)
+        oprot.writeString(viter144)
       oprot.writeMapEnd()
       oprot.writeFieldEnd()
+    if self.runAsync is not None:
+      oprot.writeFieldBegin('runAsync', TType.BOOL, 4)
+      oprot.writeBool(self.runAsync)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.status is None:
-      raise TProtocol.TProtocolException(message='Required field status is unset!')
-    if self.serverProtocolVersion is None:
-      raise TProtocol.TProtocolException(message='Required field serverProtocolVersion is unset!')
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.statement is None:
+      raise TProtocol.TProtocolException(message='Required field statement is unset!')
     return
 
 
@@ -2634,19 +3963,22 @@ class TOpenSessionResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TCloseSessionReq:
+class TExecuteStatementResp:
   """
   Attributes:
-   - sessionHandle
+   - status
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, sessionHandle=None,):
-    self.sessionHandle = sessionHandle
+  def __init__(self, status=None, operationHandle=None,):
+    self.status = status
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2659,8 +3991,14 @@ class TCloseSessionReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.sessionHandle = TSessionHandle()
-          self.sessionHandle.read(iprot)
+          self.status = TStatus()
+          self.status.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -2672,17 +4010,21 @@ class TCloseSessionReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCloseSessionReq')
-    if self.sessionHandle is not None:
-      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
-      self.sessionHandle.write(oprot)
+    oprot.writeStructBegin('TExecuteStatementResp')
+    if self.status is not None:
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
+      oprot.writeFieldEnd()
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.sessionHandle is None:
-      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.status is None:
+      raise TProtocol.TProtocolException(message='Required field status is unset!')
     return
 
 
@@ -2697,19 +4039,19 @@ class TCloseSessionReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TCloseSessionResp:
+class TGetTypeInfoReq:
   """
   Attributes:
-   - status
+   - sessionHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, status=None,):
-    self.status = status
+  def __init__(self, sessionHandle=None,):
+    self.sessionHandle = sessionHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2722,8 +4064,8 @@ class TCloseSessionResp:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.status = TStatus()
-          self.status.read(iprot)
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -2735,17 +4077,17 @@ class TCloseSessionResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCloseSessionResp')
-    if self.status is not None:
-      oprot.writeFieldBegin('status', TType.STRUCT, 1)
-      self.status.write(oprot)
+    oprot.writeStructBegin('TGetTypeInfoReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.status is None:
-      raise TProtocol.TProtocolException(message='Required field status is unset!')
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
     return
 
 
@@ -2760,34 +4102,22 @@ class TCloseSessionResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetInfoValue:
+class TGetTypeInfoResp:
   """
   Attributes:
-   - stringValue
-   - smallIntValue
-   - integerBitmask
-   - integerFlag
-   - binaryValue
-   - lenValue
+   - status
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'stringValue', None, None, ), # 1
-    (2, TType.I16, 'smallIntValue', None, None, ), # 2
-    (3, TType.I32, 'integerBitmask', None, None, ), # 3
-    (4, TType.I32, 'integerFlag', None, None, ), # 4
-    (5, TType.I32, 'binaryValue', None, None, ), # 5
-    (6, TType.I64, 'lenValue', None, None, ), # 6
+    (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, stringValue=None, smallIntValue=None, integerBitmask=None, integerFlag=None, binaryValue=None, lenValue=None,):
-    self.stringValue = stringValue
-    self.smallIntValue = smallIntValue
-    self.integerBitmask = integerBitmask
-    self.integerFlag = integerFlag
-    self.binaryValue = binaryValue
-    self.lenValue = lenValue
+  def __init__(self, status=None, operationHandle=None,):
+    self.status = status
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2799,33 +4129,15 @@ class TGetInfoValue:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.stringValue = iprot.readString();
+        if ftype == TType.STRUCT:
+          self.status = TStatus()
+          self.status.read(iprot)
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I16:
-          self.smallIntValue = iprot.readI16();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.I32:
-          self.integerBitmask = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.I32:
-          self.integerFlag = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.I32:
-          self.binaryValue = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 6:
-        if ftype == TType.I64:
-          self.lenValue = iprot.readI64();
+        if ftype == TType.STRUCT:
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -2834,38 +4146,24 @@ class TGetInfoValue:
     iprot.readStructEnd()
 
   def write(self, oprot):
-    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
-      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
-      return
-    oprot.writeStructBegin('TGetInfoValue')
-    if self.stringValue is not None:
-      oprot.writeFieldBegin('stringValue', TType.STRING, 1)
-      oprot.writeString(self.stringValue)
-      oprot.writeFieldEnd()
-    if self.smallIntValue is not None:
-      oprot.writeFieldBegin('smallIntValue', TType.I16, 2)
-      oprot.writeI16(self.smallIntValue)
-      oprot.writeFieldEnd()
-    if self.integerBitmask is not None:
-      oprot.writeFieldBegin('integerBitmask', TType.I32, 3)
-      oprot.writeI32(self.integerBitmask)
-      oprot.writeFieldEnd()
-    if self.integerFlag is not None:
-      oprot.writeFieldBegin('integerFlag', TType.I32, 4)
-      oprot.writeI32(self.integerFlag)
-      oprot.writeFieldEnd()
-    if self.binaryValue is not None:
-      oprot.writeFieldBegin('binaryValue', TType.I32, 5)
-      oprot.writeI32(self.binaryValue)
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('TGetTypeInfoResp')
+    if self.status is not None:
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.lenValue is not None:
-      oprot.writeFieldBegin('lenValue', TType.I64, 6)
-      oprot.writeI64(self.lenValue)
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.status is None:
+      raise TProtocol.TProtocolException(message='Required field status is unset!')
     return
 
 
@@ -2880,22 +4178,19 @@ class TGetInfoValue:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetInfoReq:
+class TGetCatalogsReq:
   """
   Attributes:
    - sessionHandle
-   - infoType
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
-    (2, TType.I32, 'infoType', None, None, ), # 2
   )
 
-  def __init__(self, sessionHandle=None, infoType=None,):
+  def __init__(self, sessionHandle=None,):
     self.sessionHandle = sessionHandle
-    self.infoType = infoType
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2912,11 +4207,6 @@ class TGetInfoReq:
           self.sessionHandle.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.I32:
-          self.infoType = iprot.readI32();
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2926,23 +4216,17 @@ class TGetInfoReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetInfoReq')
+    oprot.writeStructBegin('TGetCatalogsReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
-    if self.infoType is not None:
-      oprot.writeFieldBegin('infoType', TType.I32, 2)
-      oprot.writeI32(self.infoType)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
     if self.sessionHandle is None:
       raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
-    if self.infoType is None:
-      raise TProtocol.TProtocolException(message='Required field infoType is unset!')
     return
 
 
@@ -2957,22 +4241,22 @@ class TGetInfoReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetInfoResp:
+class TGetCatalogsResp:
   """
   Attributes:
    - status
-   - infoValue
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'infoValue', (TGetInfoValue, TGetInfoValue.thrift_spec), None, ), # 2
+    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, status=None, infoValue=None,):
+  def __init__(self, status=None, operationHandle=None,):
     self.status = status
-    self.infoValue = infoValue
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2991,8 +4275,8 @@ class TGetInfoResp:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRUCT:
-          self.infoValue = TGetInfoValue()
-          self.infoValue.read(iprot)
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -3004,14 +4288,14 @@ class TGetInfoResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetInfoResp')
+    oprot.writeStructBegin('TGetCatalogsResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.infoValue is not None:
-      oprot.writeFieldBegin('infoValue', TType.STRUCT, 2)
-      self.infoValue.write(oprot)
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -3019,8 +4303,6 @@ class TGetInfoResp:
   def validate(self):
     if self.status is None:
       raise TProtocol.TProtocolException(message='Required field status is unset!')
-    if self.infoValue is None:
-      raise TProtocol.TProtocolException(message='Required field infoValue is unset!')
     return
 
 
@@ -3035,25 +4317,25 @@ class TGetInfoResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TExecuteStatementReq:
+class TGetSchemasReq:
   """
   Attributes:
    - sessionHandle
-   - statement
-   - confOverlay
+   - catalogName
+   - schemaName
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
-    (2, TType.STRING, 'statement', None, None, ), # 2
-    (3, TType.MAP, 'confOverlay', (TType.STRING,None,TType.STRING,None), None, ), # 3
+    (2, TType.STRING, 'catalogName', None, None, ), # 2
+    (3, TType.STRING, 'schemaName', None, None, ), # 3
   )
 
-  def __init__(self, sessionHandle=None, statement=None, confOverlay=None,):
+  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None,):
     self.sessionHandle = sessionHandle
-    self.statement = statement
-    self.confOverlay = confOverlay
+    self.catalogName = catalogName
+    self.schemaName = schemaName
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3072,18 +4354,12 @@ class TExecuteStatementReq:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRING:
-          self.statement = iprot.readString();
+          self.catalogName = iprot.readString();
         else:
           iprot.skip(ftype)
       elif fid == 3:
-        if ftype == TType.MAP:
-          self.confOverlay = {}
-          (_ktype128, _vtype129, _size127 ) = iprot.readMapBegin() 
-          for _i131 in xrange(_size127):
-            _key132 = iprot.readString();
-            _val133 = iprot.readString();
-            self.confOverlay[_key132] = _val133
-          iprot.readMapEnd()
+        if ftype == TType.STRING:
+          self.schemaName = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -3095,22 +4371,18 @@ class TExecuteStatementReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TExecuteStatementReq')
+    oprot.writeStructBegin('TGetSchemasReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
-    if self.statement is not None:
-      oprot.writeFieldBegin('statement', TType.STRING, 2)
-      oprot.writeString(self.statement)
+    if self.catalogName is not None:
+      oprot.writeFieldBegin('catalogName', TType.STRING, 2)
+      oprot.writeString(self.catalogName)
       oprot.writeFieldEnd()
-    if self.confOverlay is not None:
-      oprot.writeFieldBegin('confOverlay', TType.MAP, 3)
-      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.confOverlay))
-      for kiter134,viter135 in self.confOverlay.items():
-        oprot.writeString(kiter134)
-        oprot.writeString(viter135)
-      oprot.writeMapEnd()
+    if self.schemaName is not None:
+      oprot.writeFieldBegin('schemaName', TType.STRING, 3)
+      oprot.writeString(self.schemaName)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -3118,8 +4390,6 @@ class TExecuteStatementReq:
   def validate(self):
     if self.sessionHandle is None:
       raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
-    if self.statement is None:
-      raise TProtocol.TProtocolException(message='Required field statement is unset!')
     return
 
 
@@ -3134,7 +4404,7 @@ class TExecuteStatementReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TExecuteStatementResp:
+class TGetSchemasResp:
   """
   Attributes:
    - status
@@ -3181,7 +4451,7 @@ class TExecuteStatementResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TExecuteStatementResp')
+    oprot.writeStructBegin('TGetSchemasResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
@@ -3210,19 +4480,31 @@ class TExecuteStatementResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTypeInfoReq:
+class TGetTablesReq:
   """
   Attributes:
    - sessionHandle
+   - catalogName
+   - schemaName
+   - tableName
+   - tableTypes
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'catalogName', None, None, ), # 2
+    (3, TType.STRING, 'schemaName', None, None, ), # 3
+    (4, TType.STRING, 'tableName', None, None, ), # 4
+    (5, TType.LIST, 'tableTypes', (TType.STRING,None), None, ), # 5
   )
 
-  def __init__(self, sessionHandle=None,):
+  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, tableName=None, tableTypes=None,):
     self.sessionHandle = sessionHandle
+    self.catalogName = catalogName
+    self.schemaName = schemaName
+    self.tableName = tableName
+    self.tableTypes = tableTypes
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3239,6 +4521,31 @@ class TGetTypeInfoReq:
           self.sessionHandle.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.catalogName = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.schemaName = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.tableName = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.LIST:
+          self.tableTypes = []
+          (_etype148, _size145) = iprot.readListBegin()
+          for _i149 in xrange(_size145):
+            _elem150 = iprot.readString();
+            self.tableTypes.append(_elem150)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -3248,11 +4555,30 @@ class TGetTypeInfoReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTypeInfoReq')
+    oprot.writeStructBegin('TGetTablesReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
+    if self.catalogName is not None:
+      oprot.writeFieldBegin('catalogName', TType.STRING, 2)
+      oprot.writeString(self.catalogName)
+      oprot.writeFieldEnd()
+    if self.schemaName is not None:
+      oprot.writeFieldBegin('schemaName', TType.STRING, 3)
+      oprot.writeString(self.schemaName)
+      oprot.writeFieldEnd()
+    if self.tableName is not None:
+      oprot.writeFieldBegin('tableName', TType.STRING, 4)
+      oprot.writeString(self.tableName)
+      oprot.writeFieldEnd()
+    if self.tableTypes is not None:
+      oprot.writeFieldBegin('tableTypes', TType.LIST, 5)
+      oprot.writeListBegin(TType.STRING, len(self.tableTypes))
+      for iter151 in self.tableTypes:
+        oprot.writeString(iter151)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -3273,7 +4599,7 @@ class TGetTypeInfoReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTypeInfoResp:
+class TGetTablesResp:
   """
   Attributes:
    - status
@@ -3320,7 +4646,7 @@ class TGetTypeInfoResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTypeInfoResp')
+    oprot.writeStructBegin('TGetTablesResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
@@ -3349,7 +4675,7 @@ class TGetTypeInfoResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetCatalogsReq:
+class TGetTableTypesReq:
   """
   Attributes:
    - sessionHandle
@@ -3387,7 +4713,7 @@ class TGetCatalogsReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetCatalogsReq')
+    oprot.writeStructBegin('TGetTableTypesReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
@@ -3412,7 +4738,7 @@ class TGetCatalogsReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetCatalogsResp:
+class TGetTableTypesResp:
   """
   Attributes:
    - status
@@ -3459,7 +4785,7 @@ class TGetCatalogsResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetCatalogsResp')
+    oprot.writeStructBegin('TGetTableTypesResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
@@ -3488,12 +4814,14 @@ class TGetCatalogsResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetSchemasReq:
+class TGetColumnsReq:
   """
   Attributes:
    - sessionHandle
    - catalogName
    - schemaName
+   - tableName
+   - columnName
   """
 
   thrift_spec = (
@@ -3501,12 +4829,16 @@ class TGetSchemasReq:
     (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
     (2, TType.STRING, 'catalogName', None, None, ), # 2
     (3, TType.STRING, 'schemaName', None, None, ), # 3
+    (4, TType.STRING, 'tableName', None, None, ), # 4
+    (5, TType.STRING, 'columnName', None, None, ), # 5
   )
 
-  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None,):
+  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, tableName=None, columnName=None,):
     self.sessionHandle = sessionHandle
     self.catalogName = catalogName
     self.schemaName = schemaName
+    self.tableName = tableName
+    self.columnName = columnName
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3533,6 +4865,16 @@ class TGetSchemasReq:
           self.schemaName = iprot.readString();
         else:
           iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.tableName = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.columnName = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -3542,7 +4884,7 @@ class TGetSchemasReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetSchemasReq')
+    oprot.writeStructBegin('TGetColumnsReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
@@ -3555,6 +4897,14 @@ class TGetSchemasReq:
       oprot.writeFieldBegin('schemaName', TType.STRING, 3)
       oprot.writeString(self.schemaName)
       oprot.writeFieldEnd()
+    if self.tableName is not None:
+      oprot.writeFieldBegin('tableName', TType.STRING, 4)
+      oprot.writeString(self.tableName)
+      oprot.writeFieldEnd()
+    if self.columnName is not None:
+      oprot.writeFieldBegin('columnName', TType.STRING, 5)
+      oprot.writeString(self.columnName)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -3575,7 +4925,7 @@ class TGetSchemasReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetSchemasResp:
+class TGetColumnsResp:
   """
   Attributes:
    - status
@@ -3622,7 +4972,7 @@ class TGetSchemasResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetSchemasResp')
+    oprot.writeStructBegin('TGetColumnsResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
@@ -3651,14 +5001,13 @@ class TGetSchemasResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTablesReq:
+class TGetFunctionsReq:
   """
   Attributes:
    - sessionHandle
    - catalogName
    - schemaName
-   - tableName
-   - tableTypes
+   - functionName
   """
 
   thrift_spec = (
@@ -3666,16 +5015,14 @@ class TGetTablesReq:
     (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
     (2, TType.STRING, 'catalogName', None, None, ), # 2
     (3, TType.STRING, 'schemaName', None, None, ), # 3
-    (4, TType.STRING, 'tableName', None, None, ), # 4
-    (5, TType.LIST, 'tableTypes', (TType.STRING,None), None, ), # 5
+    (4, TType.STRING, 'functionName', None, None, ), # 4
   )
 
-  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, tableName=None, tableTypes=None,):
+  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, functionName=None,):
     self.sessionHandle = sessionHandle
     self.catalogName = catalogName
     self.schemaName = schemaName
-    self.tableName = tableName
-    self.tableTypes = tableTypes
+    self.functionName = functionName
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3704,17 +5051,7 @@ class TGetTablesReq:
           iprot.skip(ftype)
       elif fid == 4:
         if ftype == TType.STRING:
-          self.tableName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.LIST:
-          self.tableTypes = []
-          (_etype139, _size136) = iprot.readListBegin()
-          for _i140 in xrange(_size136):
-            _elem141 = iprot.readString();
-            self.tableTypes.append(_elem141)
-          iprot.readListEnd()
+          self.functionName = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -3726,7 +5063,7 @@ class TGetTablesReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTablesReq')
+    oprot.writeStructBegin('TGetFunctionsReq')
     if self.sessionHandle is not None:
       oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
       self.sessionHandle.write(oprot)
@@ -3739,16 +5076,9 @@ class TGetTablesReq:
       oprot.writeFieldBegin('schemaName', TType.STRING, 3)
       oprot.writeString(self.schemaName)
       oprot.writeFieldEnd()
-    if self.tableName is not None:
-      oprot.writeFieldBegin('tableName', TType.STRING, 4)
-      oprot.writeString(self.tableName)
-      oprot.writeFieldEnd()
-    if self.tableTypes is not None:
-      oprot.writeFieldBegin('tableTypes', TType.LIST, 5)
-      oprot.writeListBegin(TType.STRING, len(self.tableTypes))
-      for iter142 in self.tableTypes:
-        oprot.writeString(iter142)
-      oprot.writeListEnd()
+    if self.functionName is not None:
+      oprot.writeFieldBegin('functionName', TType.STRING, 4)
+      oprot.writeString(self.functionName)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -3756,6 +5086,8 @@ class TGetTablesReq:
   def validate(self):
     if self.sessionHandle is None:
       raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.functionName is None:
+      raise TProtocol.TProtocolException(message='Required field functionName is unset!')
     return
 
 
@@ -3770,7 +5102,7 @@ class TGetTablesReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTablesResp:
+class TGetFunctionsResp:
   """
   Attributes:
    - status
@@ -3817,7 +5149,7 @@ class TGetTablesResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTablesResp')
+    oprot.writeStructBegin('TGetFunctionsResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
@@ -3846,19 +5178,19 @@ class TGetTablesResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTableTypesReq:
+class TGetOperationStatusReq:
   """
   Attributes:
-   - sessionHandle
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, sessionHandle=None,):
-    self.sessionHandle = sessionHandle
+  def __init__(self, operationHandle=None,):
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3871,8 +5203,8 @@ class TGetTableTypesReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.sessionHandle = TSessionHandle()
-          self.sessionHandle.read(iprot)
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -3884,17 +5216,17 @@ class TGetTableTypesReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTableTypesReq')
-    if self.sessionHandle is not None:
-      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
-      self.sessionHandle.write(oprot)
+    oprot.writeStructBegin('TGetOperationStatusReq')
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.sessionHandle is None:
-      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.operationHandle is None:
+      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
     return
 
 
@@ -3909,22 +5241,31 @@ class TGetTableTypesReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetTableTypesResp:
+class TGetOperationStatusResp:
   """
   Attributes:
    - status
-   - operationHandle
+   - operationState
+   - sqlState
+   - errorCode
+   - errorMessage
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
+    (2, TType.I32, 'operationState', None, None, ), # 2
+    (3, TType.STRING, 'sqlState', None, None, ), # 3
+    (4, TType.I32, 'errorCode', None, None, ), # 4
+    (5, TType.STRING, 'errorMessage', None, None, ), # 5
   )
 
-  def __init__(self, status=None, operationHandle=None,):
+  def __init__(self, status=None, operationState=None, sqlState=None, errorCode=None, errorMessage=None,):
     self.status = status
-    self.operationHandle = operationHandle
+    self.operationState = operationState
+    self.sqlState = sqlState
+    self.errorCode = errorCode
+    self.errorMessage = errorMessage
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -3942,9 +5283,23 @@ class TGetTableTypesResp:
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
+        if ftype == TType.I32:
+          self.operationState = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.sqlState = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I32:
+          self.errorCode = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.errorMessage = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -3956,14 +5311,26 @@ class TGetTableTypesResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetTableTypesResp')
+    oprot.writeStructBegin('TGetOperationStatusResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
-      self.operationHandle.write(oprot)
+    if self.operationState is not None:
+      oprot.writeFieldBegin('operationState', TType.I32, 2)
+      oprot.writeI32(self.operationState)
+      oprot.writeFieldEnd()
+    if self.sqlState is not None:
+      oprot.writeFieldBegin('sqlState', TType.STRING, 3)
+      oprot.writeString(self.sqlState)
+      oprot.writeFieldEnd()
+    if self.errorCode is not None:
+      oprot.writeFieldBegin('errorCode', TType.I32, 4)
+      oprot.writeI32(self.errorCode)
+      oprot.writeFieldEnd()
+    if self.errorMessage is not None:
+      oprot.writeFieldBegin('errorMessage', TType.STRING, 5)
+      oprot.writeString(self.errorMessage)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -3985,31 +5352,19 @@ class TGetTableTypesResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetColumnsReq:
+class TCancelOperationReq:
   """
   Attributes:
-   - sessionHandle
-   - catalogName
-   - schemaName
-   - tableName
-   - columnName
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
-    (2, TType.STRING, 'catalogName', None, None, ), # 2
-    (3, TType.STRING, 'schemaName', None, None, ), # 3
-    (4, TType.STRING, 'tableName', None, None, ), # 4
-    (5, TType.STRING, 'columnName', None, None, ), # 5
+    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, tableName=None, columnName=None,):
-    self.sessionHandle = sessionHandle
-    self.catalogName = catalogName
-    self.schemaName = schemaName
-    self.tableName = tableName
-    self.columnName = columnName
+  def __init__(self, operationHandle=None,):
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4022,28 +5377,8 @@ class TGetColumnsReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.sessionHandle = TSessionHandle()
-          self.sessionHandle.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRING:
-          self.catalogName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRING:
-          self.schemaName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.STRING:
-          self.tableName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.STRING:
-          self.columnName = iprot.readString();
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -4055,33 +5390,17 @@ class TGetColumnsReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetColumnsReq')
-    if self.sessionHandle is not None:
-      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
-      self.sessionHandle.write(oprot)
-      oprot.writeFieldEnd()
-    if self.catalogName is not None:
-      oprot.writeFieldBegin('catalogName', TType.STRING, 2)
-      oprot.writeString(self.catalogName)
-      oprot.writeFieldEnd()
-    if self.schemaName is not None:
-      oprot.writeFieldBegin('schemaName', TType.STRING, 3)
-      oprot.writeString(self.schemaName)
-      oprot.writeFieldEnd()
-    if self.tableName is not None:
-      oprot.writeFieldBegin('tableName', TType.STRING, 4)
-      oprot.writeString(self.tableName)
-      oprot.writeFieldEnd()
-    if self.columnName is not None:
-      oprot.writeFieldBegin('columnName', TType.STRING, 5)
-      oprot.writeString(self.columnName)
+    oprot.writeStructBegin('TCancelOperationReq')
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.sessionHandle is None:
-      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.operationHandle is None:
+      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
     return
 
 
@@ -4096,22 +5415,19 @@ class TGetColumnsReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetColumnsResp:
+class TCancelOperationResp:
   """
   Attributes:
    - status
-   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, status=None, operationHandle=None,):
+  def __init__(self, status=None,):
     self.status = status
-    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4128,12 +5444,6 @@ class TGetColumnsResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4143,15 +5453,11 @@ class TGetColumnsResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetColumnsResp')
+    oprot.writeStructBegin('TCancelOperationResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
-      self.operationHandle.write(oprot)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -4172,28 +5478,19 @@ class TGetColumnsResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetFunctionsReq:
+class TCloseOperationReq:
   """
   Attributes:
-   - sessionHandle
-   - catalogName
-   - schemaName
-   - functionName
+   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
-    (2, TType.STRING, 'catalogName', None, None, ), # 2
-    (3, TType.STRING, 'schemaName', None, None, ), # 3
-    (4, TType.STRING, 'functionName', None, None, ), # 4
+    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, sessionHandle=None, catalogName=None, schemaName=None, functionName=None,):
-    self.sessionHandle = sessionHandle
-    self.catalogName = catalogName
-    self.schemaName = schemaName
-    self.functionName = functionName
+  def __init__(self, operationHandle=None,):
+    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4206,23 +5503,8 @@ class TGetFunctionsReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.sessionHandle = TSessionHandle()
-          self.sessionHandle.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRING:
-          self.catalogName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRING:
-          self.schemaName = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.STRING:
-          self.functionName = iprot.readString();
+          self.operationHandle = TOperationHandle()
+          self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -4234,31 +5516,17 @@ class TGetFunctionsReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetFunctionsReq')
-    if self.sessionHandle is not None:
-      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
-      self.sessionHandle.write(oprot)
-      oprot.writeFieldEnd()
-    if self.catalogName is not None:
-      oprot.writeFieldBegin('catalogName', TType.STRING, 2)
-      oprot.writeString(self.catalogName)
-      oprot.writeFieldEnd()
-    if self.schemaName is not None:
-      oprot.writeFieldBegin('schemaName', TType.STRING, 3)
-      oprot.writeString(self.schemaName)
-      oprot.writeFieldEnd()
-    if self.functionName is not None:
-      oprot.writeFieldBegin('functionName', TType.STRING, 4)
-      oprot.writeString(self.functionName)
+    oprot.writeStructBegin('TCloseOperationReq')
+    if self.operationHandle is not None:
+      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
+      self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.sessionHandle is None:
-      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
-    if self.functionName is None:
-      raise TProtocol.TProtocolException(message='Required field functionName is unset!')
+    if self.operationHandle is None:
+      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
     return
 
 
@@ -4273,22 +5541,19 @@ class TGetFunctionsReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetFunctionsResp:
+class TCloseOperationResp:
   """
   Attributes:
    - status
-   - operationHandle
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, status=None, operationHandle=None,):
+  def __init__(self, status=None,):
     self.status = status
-    self.operationHandle = operationHandle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4305,12 +5570,6 @@ class TGetFunctionsResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4320,14 +5579,10 @@ class TGetFunctionsResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetFunctionsResp')
+    oprot.writeStructBegin('TCloseOperationResp')
     if self.status is not None:
-      oprot.writeFieldBegin('status', TType.STRUCT, 1)
-      self.status.write(oprot)
-      oprot.writeFieldEnd()
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 2)
-      self.operationHandle.write(oprot)
+      oprot.writeFieldBegin('status', TType.STRUCT, 1)
+      self.status.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -4349,7 +5604,7 @@ class TGetFunctionsResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetOperationStatusReq:
+class TGetResultSetMetadataReq:
   """
   Attributes:
    - operationHandle
@@ -4387,7 +5642,7 @@ class TGetOperationStatusReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetOperationStatusReq')
+    oprot.writeStructBegin('TGetResultSetMetadataReq')
     if self.operationHandle is not None:
       oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
       self.operationHandle.write(oprot)
@@ -4412,22 +5667,22 @@ class TGetOperationStatusReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetOperationStatusResp:
+class TGetResultSetMetadataResp:
   """
   Attributes:
    - status
-   - operationState
+   - schema
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.I32, 'operationState', None, None, ), # 2
+    (2, TType.STRUCT, 'schema', (TTableSchema, TTableSchema.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, status=None, operationState=None,):
+  def __init__(self, status=None, schema=None,):
     self.status = status
-    self.operationState = operationState
+    self.schema = schema
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4445,8 +5700,9 @@ class TGetOperationStatusResp:
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I32:
-          self.operationState = iprot.readI32();
+        if ftype == TType.STRUCT:
+          self.schema = TTableSchema()
+          self.schema.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -4458,14 +5714,14 @@ class TGetOperationStatusResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetOperationStatusResp')
+    oprot.writeStructBegin('TGetResultSetMetadataResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.operationState is not None:
-      oprot.writeFieldBegin('operationState', TType.I32, 2)
-      oprot.writeI32(self.operationState)
+    if self.schema is not None:
+      oprot.writeFieldBegin('schema', TType.STRUCT, 2)
+      self.schema.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -4487,19 +5743,25 @@ class TGetOperationStatusResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TCancelOperationReq:
+class TFetchResultsReq:
   """
   Attributes:
    - operationHandle
+   - orientation
+   - maxRows
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
+    (2, TType.I32, 'orientation', None,     0, ), # 2
+    (3, TType.I64, 'maxRows', None, None, ), # 3
   )
 
-  def __init__(self, operationHandle=None,):
+  def __init__(self, operationHandle=None, orientation=thrift_spec[2][4], maxRows=None,):
     self.operationHandle = operationHandle
+    self.orientation = orientation
+    self.maxRows = maxRows
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4516,6 +5778,16 @@ class TCancelOperationReq:
           self.operationHandle.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.orientation = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I64:
+          self.maxRows = iprot.readI64();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4525,17 +5797,29 @@ class TCancelOperationReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCancelOperationReq')
+    oprot.writeStructBegin('TFetchResultsReq')
     if self.operationHandle is not None:
       oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
       self.operationHandle.write(oprot)
       oprot.writeFieldEnd()
+    if self.orientation is not None:
+      oprot.writeFieldBegin('orientation', TType.I32, 2)
+      oprot.writeI32(self.orientation)
+      oprot.writeFieldEnd()
+    if self.maxRows is not None:
+      oprot.writeFieldBegin('maxRows', TType.I64, 3)
+      oprot.writeI64(self.maxRows)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
     if self.operationHandle is None:
       raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
+    if self.orientation is None:
+      raise TProtocol.TProtocolException(message='Required field orientation is unset!')
+    if self.maxRows is None:
+      raise TProtocol.TProtocolException(message='Required field maxRows is unset!')
     return
 
 
@@ -4550,19 +5834,25 @@ class TCancelOperationReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TCancelOperationResp:
+class TFetchResultsResp:
   """
   Attributes:
    - status
+   - hasMoreRows
+   - results
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.BOOL, 'hasMoreRows', None, None, ), # 2
+    (3, TType.STRUCT, 'results', (TRowSet, TRowSet.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, status=None,):
+  def __init__(self, status=None, hasMoreRows=None, results=None,):
     self.status = status
+    self.hasMoreRows = hasMoreRows
+    self.results = results
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4579,6 +5869,17 @@ class TCancelOperationResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.BOOL:
+          self.hasMoreRows = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.results = TRowSet()
+          self.results.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4588,11 +5889,19 @@ class TCancelOperationResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCancelOperationResp')
+    oprot.writeStructBegin('TFetchResultsResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
+    if self.hasMoreRows is not None:
+      oprot.writeFieldBegin('hasMoreRows', TType.BOOL, 2)
+      oprot.writeBool(self.hasMoreRows)
+      oprot.writeFieldEnd()
+    if self.results is not None:
+      oprot.writeFieldBegin('results', TType.STRUCT, 3)
+      self.results.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -4613,19 +5922,25 @@ class TCancelOperationResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TCloseOperationReq:
+class TGetDelegationTokenReq:
   """
   Attributes:
-   - operationHandle
+   - sessionHandle
+   - owner
+   - renewer
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'owner', None, None, ), # 2
+    (3, TType.STRING, 'renewer', None, None, ), # 3
   )
 
-  def __init__(self, operationHandle=None,):
-    self.operationHandle = operationHandle
+  def __init__(self, sessionHandle=None, owner=None, renewer=None,):
+    self.sessionHandle = sessionHandle
+    self.owner = owner
+    self.renewer = renewer
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4638,8 +5953,18 @@ class TCloseOperationReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.owner = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.renewer = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -4651,17 +5976,29 @@ class TCloseOperationReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCloseOperationReq')
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
-      self.operationHandle.write(oprot)
+    oprot.writeStructBegin('TGetDelegationTokenReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
+      oprot.writeFieldEnd()
+    if self.owner is not None:
+      oprot.writeFieldBegin('owner', TType.STRING, 2)
+      oprot.writeString(self.owner)
+      oprot.writeFieldEnd()
+    if self.renewer is not None:
+      oprot.writeFieldBegin('renewer', TType.STRING, 3)
+      oprot.writeString(self.renewer)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.operationHandle is None:
-      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.owner is None:
+      raise TProtocol.TProtocolException(message='Required field owner is unset!')
+    if self.renewer is None:
+      raise TProtocol.TProtocolException(message='Required field renewer is unset!')
     return
 
 
@@ -4676,19 +6013,22 @@ class TCloseOperationReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TCloseOperationResp:
+class TGetDelegationTokenResp:
   """
   Attributes:
    - status
+   - delegationToken
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'delegationToken', None, None, ), # 2
   )
 
-  def __init__(self, status=None,):
+  def __init__(self, status=None, delegationToken=None,):
     self.status = status
+    self.delegationToken = delegationToken
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4705,6 +6045,11 @@ class TCloseOperationResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.delegationToken = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4714,11 +6059,15 @@ class TCloseOperationResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TCloseOperationResp')
+    oprot.writeStructBegin('TGetDelegationTokenResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
+    if self.delegationToken is not None:
+      oprot.writeFieldBegin('delegationToken', TType.STRING, 2)
+      oprot.writeString(self.delegationToken)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -4739,19 +6088,22 @@ class TCloseOperationResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetResultSetMetadataReq:
+class TCancelDelegationTokenReq:
   """
   Attributes:
-   - operationHandle
+   - sessionHandle
+   - delegationToken
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'delegationToken', None, None, ), # 2
   )
 
-  def __init__(self, operationHandle=None,):
-    self.operationHandle = operationHandle
+  def __init__(self, sessionHandle=None, delegationToken=None,):
+    self.sessionHandle = sessionHandle
+    self.delegationToken = delegationToken
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4764,8 +6116,13 @@ class TGetResultSetMetadataReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.delegationToken = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -4777,17 +6134,23 @@ class TGetResultSetMetadataReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetResultSetMetadataReq')
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
-      self.operationHandle.write(oprot)
+    oprot.writeStructBegin('TCancelDelegationTokenReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
+      oprot.writeFieldEnd()
+    if self.delegationToken is not None:
+      oprot.writeFieldBegin('delegationToken', TType.STRING, 2)
+      oprot.writeString(self.delegationToken)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.operationHandle is None:
-      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.delegationToken is None:
+      raise TProtocol.TProtocolException(message='Required field delegationToken is unset!')
     return
 
 
@@ -4802,22 +6165,19 @@ class TGetResultSetMetadataReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TGetResultSetMetadataResp:
+class TCancelDelegationTokenResp:
   """
   Attributes:
    - status
-   - schema
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'schema', (TTableSchema, TTableSchema.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, status=None, schema=None,):
+  def __init__(self, status=None,):
     self.status = status
-    self.schema = schema
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4834,12 +6194,6 @@ class TGetResultSetMetadataResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.schema = TTableSchema()
-          self.schema.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -4849,15 +6203,11 @@ class TGetResultSetMetadataResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TGetResultSetMetadataResp')
+    oprot.writeStructBegin('TCancelDelegationTokenResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.schema is not None:
-      oprot.writeFieldBegin('schema', TType.STRUCT, 2)
-      self.schema.write(oprot)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -4878,25 +6228,22 @@ class TGetResultSetMetadataResp:
   def __ne__(self, other):
     return not (self == other)
 
-class TFetchResultsReq:
+class TRenewDelegationTokenReq:
   """
   Attributes:
-   - operationHandle
-   - orientation
-   - maxRows
+   - sessionHandle
+   - delegationToken
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'operationHandle', (TOperationHandle, TOperationHandle.thrift_spec), None, ), # 1
-    (2, TType.I32, 'orientation', None,     0, ), # 2
-    (3, TType.I64, 'maxRows', None, None, ), # 3
+    (1, TType.STRUCT, 'sessionHandle', (TSessionHandle, TSessionHandle.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'delegationToken', None, None, ), # 2
   )
 
-  def __init__(self, operationHandle=None, orientation=thrift_spec[2][4], maxRows=None,):
-    self.operationHandle = operationHandle
-    self.orientation = orientation
-    self.maxRows = maxRows
+  def __init__(self, sessionHandle=None, delegationToken=None,):
+    self.sessionHandle = sessionHandle
+    self.delegationToken = delegationToken
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -4909,18 +6256,13 @@ class TFetchResultsReq:
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.operationHandle = TOperationHandle()
-          self.operationHandle.read(iprot)
+          self.sessionHandle = TSessionHandle()
+          self.sessionHandle.read(iprot)
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I32:
-          self.orientation = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.I64:
-          self.maxRows = iprot.readI64();
+        if ftype == TType.STRING:
+          self.delegationToken = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -4932,29 +6274,23 @@ class TFetchResultsReq:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TFetchResultsReq')
-    if self.operationHandle is not None:
-      oprot.writeFieldBegin('operationHandle', TType.STRUCT, 1)
-      self.operationHandle.write(oprot)
-      oprot.writeFieldEnd()
-    if self.orientation is not None:
-      oprot.writeFieldBegin('orientation', TType.I32, 2)
-      oprot.writeI32(self.orientation)
+    oprot.writeStructBegin('TRenewDelegationTokenReq')
+    if self.sessionHandle is not None:
+      oprot.writeFieldBegin('sessionHandle', TType.STRUCT, 1)
+      self.sessionHandle.write(oprot)
       oprot.writeFieldEnd()
-    if self.maxRows is not None:
-      oprot.writeFieldBegin('maxRows', TType.I64, 3)
-      oprot.writeI64(self.maxRows)
+    if self.delegationToken is not None:
+      oprot.writeFieldBegin('delegationToken', TType.STRING, 2)
+      oprot.writeString(self.delegationToken)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.operationHandle is None:
-      raise TProtocol.TProtocolException(message='Required field operationHandle is unset!')
-    if self.orientation is None:
-      raise TProtocol.TProtocolException(message='Required field orientation is unset!')
-    if self.maxRows is None:
-      raise TProtocol.TProtocolException(message='Required field maxRows is unset!')
+    if self.sessionHandle is None:
+      raise TProtocol.TProtocolException(message='Required field sessionHandle is unset!')
+    if self.delegationToken is None:
+      raise TProtocol.TProtocolException(message='Required field delegationToken is unset!')
     return
 
 
@@ -4969,25 +6305,19 @@ class TFetchResultsReq:
   def __ne__(self, other):
     return not (self == other)
 
-class TFetchResultsResp:
+class TRenewDelegationTokenResp:
   """
   Attributes:
    - status
-   - hasMoreRows
-   - results
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'status', (TStatus, TStatus.thrift_spec), None, ), # 1
-    (2, TType.BOOL, 'hasMoreRows', None, None, ), # 2
-    (3, TType.STRUCT, 'results', (TRowSet, TRowSet.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, status=None, hasMoreRows=None, results=None,):
+  def __init__(self, status=None,):
     self.status = status
-    self.hasMoreRows = hasMoreRows
-    self.results = results
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -5004,17 +6334,6 @@ class TFetchResultsResp:
           self.status.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.BOOL:
-          self.hasMoreRows = iprot.readBool();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRUCT:
-          self.results = TRowSet()
-          self.results.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -5024,19 +6343,11 @@ class TFetchResultsResp:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('TFetchResultsResp')
+    oprot.writeStructBegin('TRenewDelegationTokenResp')
     if self.status is not None:
       oprot.writeFieldBegin('status', TType.STRUCT, 1)
       self.status.write(oprot)
       oprot.writeFieldEnd()
-    if self.hasMoreRows is not None:
-      oprot.writeFieldBegin('hasMoreRows', TType.BOOL, 2)
-      oprot.writeBool(self.hasMoreRows)
-      oprot.writeFieldEnd()
-    if self.results is not None:
-      oprot.writeFieldBegin('results', TType.STRUCT, 3)
-      self.results.write(oprot)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
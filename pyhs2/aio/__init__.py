@@ -0,0 +1,10 @@
+"""
+Non-blocking client built on Tornado coroutines and Futures rather than the
+gen.engine/gen.Task callbacks of TornadoConnection. On Python 3 the returned
+Futures can be awaited, including from an asyncio event loop through
+Tornado's asyncio integration.
+"""
+from pyhs2.aio.connection import AsyncConnection, connect
+from pyhs2.aio.cursor import AsyncCursor
+
+__all__ = ['AsyncConnection', 'AsyncCursor', 'connect']
@@ -0,0 +1,40 @@
+from functools import partial
+
+from thrift.transport.TTransport import TMemoryBuffer
+from tornado import gen
+from tornado.locks import Lock
+
+from pyhs2.TCLIService import TCLIService
+
+
+class AsyncClient(object):
+    """
+    Coroutine shim over the generated TCLIService.Client. Each call
+    serializes its request with the generated send_<Method> into a memory
+    buffer, writes it as one frame, and parses the reply frame with
+    recv_<Method>, so no per-method code is duplicated here. Calls on one
+    client are issued one at a time, as HiveServer2 expects per session.
+    """
+
+    def __init__(self, transport, protocolFactory):
+        self._transport = transport
+        self._protocolFactory = protocolFactory
+        self._client = TCLIService.Client(None)
+        self._lock = Lock()
+
+    def __getattr__(self, name):
+        if not hasattr(TCLIService.Client, 'send_' + name):
+            raise AttributeError(name)
+        return partial(self._call, name)
+
+    @gen.coroutine
+    def _call(self, name, *args):
+        with (yield self._lock.acquire()):
+            wbuf = TMemoryBuffer()
+            self._client._oprot = self._protocolFactory.getProtocol(wbuf)
+            getattr(self._client, 'send_' + name)(*args)
+            yield self._transport.write_frame(wbuf.getvalue())
+            frame = yield self._transport.read_frame()
+            self._client._iprot = self._protocolFactory.getProtocol(TMemoryBuffer(frame))
+            result = getattr(self._client, 'recv_' + name)()
+        raise gen.Return(result)
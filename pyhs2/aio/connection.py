@@ -0,0 +1,75 @@
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolFactory, TBinaryProtocolAcceleratedFactory
+from tornado import gen
+
+from pyhs2.TCLIService.ttypes import TOpenSessionReq, TCloseSessionReq, TProtocolVersion
+from pyhs2.connections_base import BaseConnection
+from pyhs2.aio.client import AsyncClient
+from pyhs2.aio.cursor import AsyncCursor
+from pyhs2.aio.transport import TAsyncBufferedTransport, TAsyncSaslClientTransport
+
+
+class AsyncConnection(BaseConnection):
+    """
+    Coroutine connection to HiveServer2. Construct it, then yield (or await)
+    open() before creating cursors; connect() does both.
+    """
+    # Database selected with USE, if any.
+    database = None
+
+    def __init__(self, host=None, port=10000, authMechanism=None, user=None, password=None, configuration=None,
+                 accelerated=True, clientProtocol=TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V6):
+        super(AsyncConnection, self).__init__(authMechanism)
+        #Must set a password for thrift, even if it doesn't need one
+        #Open issue with python-sasl
+        password = self._check_password(authMechanism, password)
+        if authMechanism == 'NOSASL':
+            self.transport = TAsyncBufferedTransport(host, port)
+        else:
+            saslc, sasl_mech = self._get_sasl_client(host, authMechanism, user, password, configuration)
+            self.transport = TAsyncSaslClientTransport(saslc, sasl_mech, host, port)
+        if self._use_accelerated(accelerated):
+            pfactory = TBinaryProtocolAcceleratedFactory()
+        else:
+            pfactory = TBinaryProtocolFactory()
+        self.client = AsyncClient(self.transport, pfactory)
+        self.configuration = configuration
+        self.clientProtocol = clientProtocol
+
+    @gen.coroutine
+    def open(self, database=None):
+        yield self.transport.open()
+        req = TOpenSessionReq(client_protocol=self.clientProtocol, configuration=self.configuration)
+        res = yield self.client.OpenSession(req)
+        self.session = res.sessionHandle
+        self.protocolVersion = res.serverProtocolVersion
+        if database is not None:
+            yield self.use(database)
+
+    @gen.coroutine
+    def use(self, database):
+        cur = self.cursor()
+        yield cur.execute("USE {0}".format(database))
+        yield cur.close()
+        self.database = database
+
+    def cursor(self, confOverlay=None):
+        return AsyncCursor(self.client, self.session, confOverlay)
+
+    @gen.coroutine
+    def close(self):
+        req = TCloseSessionReq(sessionHandle=self.session)
+        try:
+            yield self.client.CloseSession(req)
+        finally:
+            self.transport.close()
+
+
+@gen.coroutine
+def connect(*args, **kwargs):
+    """
+    Open an AsyncConnection; takes the same arguments as Connection.
+    """
+    database = kwargs.pop('database', None)
+    conn = AsyncConnection(*args, **kwargs)
+    yield conn.open(database)
+    raise gen.Return(conn)
@@ -0,0 +1,130 @@
+from collections import deque
+
+from tornado import gen
+
+from pyhs2.TCLIService.ttypes import TExecuteStatementReq, TFetchResultsReq, TFetchOrientation, \
+    TGetResultSetMetadataReq, TCloseOperationReq, TGetSchemasReq
+from pyhs2.cursor import _is_last_page
+from pyhs2.schema import describe_columns, schema_dicts
+from pyhs2.decoders import RowDecoder, columnar_rows, count_rows, is_columnar
+from pyhs2.error import Pyhs2Exception
+
+
+class AsyncCursor(object):
+    """
+    Coroutine counterpart of Cursor. Every method returns a Future, so it can
+    be yielded from a Tornado coroutine or awaited on Python 3.
+    """
+    session = None
+    client = None
+    operationHandle = None
+    arraysize = 10000
+    # FetchResults calls skipped thanks to hasMoreRows.
+    roundTripsSaved = 0
+
+    def __init__(self, _client, sessionHandle, confOverlay=None):
+        self.session = sessionHandle
+        self.client = _client
+        self.confOverlay = confOverlay or {}
+        self._reset_results()
+
+    def _reset_results(self):
+        self._rows = deque()
+        self._decoder = RowDecoder()
+        self._done = False
+        self._fetchReq = None
+        self._columns = None
+
+    @gen.coroutine
+    def execute(self, hql):
+        query = TExecuteStatementReq(self.session, statement=hql, confOverlay=self.confOverlay)
+        res = yield self.client.ExecuteStatement(query)
+        self.operationHandle = res.operationHandle
+        self._reset_results()
+        if res.status.errorCode is not None:
+            raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
+
+    @gen.coroutine
+    def _fetch_page(self):
+        """
+        Append the next page to the row buffer. Returns False once the
+        result set is exhausted.
+        """
+        if self._done:
+            raise gen.Return(False)
+        if self._fetchReq is None:
+            self._fetchReq = TFetchResultsReq(operationHandle=self.operationHandle,
+                                              orientation=TFetchOrientation.FETCH_NEXT)
+        self._fetchReq.maxRows = self.arraysize
+        resultsRes = yield self.client.FetchResults(self._fetchReq)
+        if count_rows(resultsRes.results) == 0:
+            self._done = True
+            raise gen.Return(False)
+        if is_columnar(resultsRes.results):
+            self._rows.extend(columnar_rows(resultsRes.results))
+        else:
+            self._rows.extend(self._decoder.decode_rows(resultsRes.results.rows))
+        if _is_last_page(resultsRes, self._fetchReq):
+            self.roundTripsSaved += 1
+            self._done = True
+        raise gen.Return(True)
+
+    @gen.coroutine
+    def fetchone(self):
+        if not self._rows:
+            yield self._fetch_page()
+        raise gen.Return(self._rows.popleft() if self._rows else None)
+
+    @gen.coroutine
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        while len(self._rows) < size:
+            more = yield self._fetch_page()
+            if not more:
+                break
+        rows = [self._rows.popleft() for _ in xrange(min(size, len(self._rows)))]
+        raise gen.Return(rows)
+
+    @gen.coroutine
+    def fetch(self):
+        while True:
+            more = yield self._fetch_page()
+            if not more:
+                break
+        rows = list(self._rows)
+        self._rows.clear()
+        raise gen.Return(rows)
+
+    fetchall = fetch
+
+    @gen.coroutine
+    def getColumnDescriptors(self):
+        if self._columns is None and self.operationHandle:
+            req = TGetResultSetMetadataReq(self.operationHandle)
+            res = yield self.client.GetResultSetMetadata(req)
+            if res.schema is not None:
+                self._columns = describe_columns(res.schema)
+        raise gen.Return(self._columns)
+
+    @gen.coroutine
+    def getSchema(self):
+        columns = yield self.getColumnDescriptors()
+        raise gen.Return(None if columns is None else schema_dicts(columns))
+
+    @gen.coroutine
+    def getDatabases(self):
+        req = TGetSchemasReq(self.session)
+        res = yield self.client.GetSchemas(req)
+        self.operationHandle = res.operationHandle
+        self._reset_results()
+        if res.status.errorCode is not None:
+            raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
+        rows = yield self.fetch()
+        raise gen.Return(rows)
+
+    @gen.coroutine
+    def close(self):
+        if self.operationHandle is not None:
+            req = TCloseOperationReq(operationHandle=self.operationHandle)
+            yield self.client.CloseOperation(req)
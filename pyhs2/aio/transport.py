@@ -0,0 +1,279 @@
+"""
+Thrift transports over a Tornado IOStream, exposing coroutine (Future
+returning) open/read_frame/write_frame instead of callbacks. A "frame" is
+one whole Thrift message, whether or not it is length-framed on the wire.
+"""
+import struct
+
+from thrift.Thrift import TType
+from thrift.transport.TTransport import TTransportException
+from tornado import gen
+from tornado.tcpclient import TCPClient
+
+
+class TAsyncStreamTransport(object):
+    """
+    Plain framed transport: every message is a 4-byte big-endian length
+    followed by the payload, as with TTornadoStreamTransport.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.stream = None
+
+    def isOpen(self):
+        return self.stream is not None and not self.stream.closed()
+
+    @gen.coroutine
+    def open(self):
+        try:
+            self.stream = yield TCPClient().connect(self.host, self.port)
+        except IOError as e:
+            raise TTransportException(type=TTransportException.NOT_OPEN,
+                                      message='could not connect to %s:%s (%s)' % (self.host, self.port, e))
+
+    def write_frame(self, payload):
+        return self.stream.write(struct.pack(">I", len(payload)) + payload)
+
+    @gen.coroutine
+    def read_frame(self):
+        header = yield self.stream.read_bytes(4)
+        length, = struct.unpack(">I", header)
+        frame = yield self.stream.read_bytes(length)
+        raise gen.Return(frame)
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+
+
+# Encoded size of the fixed-width TBinaryProtocol types.
+_WIDTHS = {TType.BOOL: 1, TType.BYTE: 1, TType.I16: 2, TType.I32: 4, TType.I64: 8, TType.DOUBLE: 8}
+
+
+class MessageScanner(object):
+    """
+    Finds where a TBinaryProtocol message ends in bytes that arrive in
+    pieces, without decoding it. Append to buff and call scan() until it
+    returns the message's length; the walk resumes where it ran out of
+    bytes, so every byte is looked at once.
+    """
+
+    def __init__(self, buff=None):
+        self.buff = buff if buff is not None else bytearray()
+        self._pos = None
+        # Containers being walked: [STRUCT] or [LIST, elementType, remaining]
+        # or [MAP, keyType, valueType, remaining keys and values].
+        self._stack = []
+
+    def _value(self, ttype):
+        """Step over a value at _pos; False if its header has not arrived."""
+        width = _WIDTHS.get(ttype)
+        if width is not None:
+            self._pos += width
+        elif ttype == TType.STRING:
+            if len(self.buff) < self._pos + 4:
+                return False
+            length, = struct.unpack_from('>i', self.buff, self._pos)
+            self._pos += 4 + length
+        elif ttype == TType.STRUCT:
+            self._stack.append([TType.STRUCT])
+        elif ttype in (TType.LIST, TType.SET):
+            if len(self.buff) < self._pos + 5:
+                return False
+            elementType, size = struct.unpack_from('>bi', self.buff, self._pos)
+            self._pos += 5
+            if elementType in _WIDTHS:
+                self._pos += size * _WIDTHS[elementType]
+            elif size:
+                self._stack.append([TType.LIST, elementType, size])
+        elif ttype == TType.MAP:
+            if len(self.buff) < self._pos + 6:
+                return False
+            keyType, valueType, size = struct.unpack_from('>bbi', self.buff, self._pos)
+            self._pos += 6
+            if keyType in _WIDTHS and valueType in _WIDTHS:
+                self._pos += size * (_WIDTHS[keyType] + _WIDTHS[valueType])
+            elif size:
+                self._stack.append([TType.MAP, keyType, valueType, size * 2])
+        else:
+            raise TTransportException(type=TTransportException.UNKNOWN, message='unknown Thrift type %d' % ttype)
+        return True
+
+    def _header(self):
+        buff = self.buff
+        if len(buff) < 4:
+            return False
+        version, = struct.unpack_from('>i', buff, 0)
+        if version < 0:
+            # Strict: version and type, name, sequence id.
+            if len(buff) < 8:
+                return False
+            length, = struct.unpack_from('>i', buff, 4)
+            self._pos = 8 + length + 4
+        else:
+            # Old style: name (version is its length), type, sequence id.
+            self._pos = 4 + version + 1 + 4
+        self._stack.append([TType.STRUCT])
+        return True
+
+    def scan(self):
+        """The length of the message, or None until all of it is in buff."""
+        if self._pos is None and not self._header():
+            return None
+        buff, stack = self.buff, self._stack
+        while stack:
+            top = stack[-1]
+            if top[0] == TType.STRUCT:
+                if len(buff) < self._pos + 1:
+                    return None
+                fieldType = buff[self._pos]
+                if fieldType == TType.STOP:
+                    self._pos += 1
+                    stack.pop()
+                    continue
+                # Step over the type and field id only once the value's own
+                # header is here too, so a retry starts at the field again.
+                if len(buff) < self._pos + 3:
+                    return None
+                self._pos += 3
+                if not self._value(fieldType):
+                    self._pos -= 3
+                    return None
+            else:
+                if top[-1] == 0:
+                    stack.pop()
+                    continue
+                if top[0] == TType.LIST:
+                    ttype = top[1]
+                else:
+                    ttype = top[1] if top[3] % 2 == 0 else top[2]
+                if not self._value(ttype):
+                    return None
+                top[-1] -= 1
+        if len(buff) < self._pos:
+            return None
+        return self._pos
+
+
+class TAsyncBufferedTransport(TAsyncStreamTransport):
+    """
+    Unframed transport, as TBufferedTransport on the sync NOSASL path:
+    messages are written as they are, and each reply is read until a whole
+    message has arrived.
+    """
+    # Most a single read asks the stream for.
+    READ_SIZE = 65536
+
+    def __init__(self, host, port):
+        super(TAsyncBufferedTransport, self).__init__(host, port)
+        self._rbuf = bytearray()
+
+    def write_frame(self, payload):
+        return self.stream.write(payload)
+
+    @gen.coroutine
+    def read_frame(self):
+        scanner = MessageScanner(self._rbuf)
+        length = scanner.scan()
+        while length is None:
+            chunk = yield self.stream.read_bytes(self.READ_SIZE, partial=True)
+            scanner.buff.extend(chunk)
+            length = scanner.scan()
+        message = bytes(scanner.buff[:length])
+        self._rbuf = scanner.buff[length:]
+        raise gen.Return(message)
+
+
+class TAsyncSaslClientTransport(TAsyncStreamTransport):
+    """
+    SASL negotiation and framing as in TSaslClientTransport, driven from
+    coroutines.
+    """
+    START = 1
+    OK = 2
+    BAD = 3
+    ERROR = 4
+    COMPLETE = 5
+
+    def __init__(self, sasl_client_factory, mechanism, host, port):
+        """
+        @param sasl_client_factory: a sasl.Client object
+        @param mechanism: the SASL mechanism (e.g. "GSSAPI")
+        """
+        super(TAsyncSaslClientTransport, self).__init__(host, port)
+        self.sasl_client_factory = sasl_client_factory
+        self.sasl = None
+        self.mechanism = mechanism
+        self.encode = None
+
+    @gen.coroutine
+    def open(self):
+        yield super(TAsyncSaslClientTransport, self).open()
+        if self.sasl is not None:
+            raise TTransportException(type=TTransportException.NOT_OPEN, message="Already open!")
+        self.sasl = self.sasl_client_factory
+
+        ret, chosen_mech, initial_response = self.sasl.start(self.mechanism)
+        if not ret:
+            raise TTransportException(type=TTransportException.NOT_OPEN,
+                                      message=("Could not start SASL: %s" % self.sasl.getError()))
+        yield self._send_message(self.START, chosen_mech)
+        yield self._send_message(self.OK, initial_response)
+
+        while True:
+            status, payload = yield self._recv_sasl_message()
+            if status not in (self.OK, self.COMPLETE):
+                raise TTransportException(type=TTransportException.NOT_OPEN,
+                                          message=("Bad status: %d (%s)" % (status, payload)))
+            if status == self.COMPLETE:
+                break
+            ret, response = self.sasl.step(payload)
+            if not ret:
+                raise TTransportException(type=TTransportException.NOT_OPEN,
+                                          message=("Bad SASL result: %s" % (self.sasl.getError())))
+            yield self._send_message(self.OK, response)
+
+    def _send_message(self, status, body):
+        return self.stream.write(struct.pack(">BI", status, len(body)) + body)
+
+    @gen.coroutine
+    def _recv_sasl_message(self):
+        header = yield self.stream.read_bytes(5)
+        status, length = struct.unpack(">BI", header)
+        payload = ""
+        if length > 0:
+            payload = yield self.stream.read_bytes(length)
+        raise gen.Return((status, payload))
+
+    def write_frame(self, payload):
+        # The first frame tells us whether the negotiated QOP wraps data: if
+        # sasl.encode() leaves the length unchanged, frames go out as is.
+        if self.encode is None:
+            success, encoded = self.sasl.encode(payload)
+            if not success:
+                raise TTransportException(type=TTransportException.UNKNOWN, message=self.sasl.getError())
+            self.encode = len(encoded) != len(payload)
+        if not self.encode:
+            return super(TAsyncSaslClientTransport, self).write_frame(payload)
+        # sasl.encode() adds the length header itself.
+        success, encoded = self.sasl.encode(payload)
+        if not success:
+            raise TTransportException(type=TTransportException.UNKNOWN, message=self.sasl.getError())
+        return self.stream.write(encoded)
+
+    @gen.coroutine
+    def read_frame(self):
+        header = yield self.stream.read_bytes(4)
+        length, = struct.unpack(">I", header)
+        body = yield self.stream.read_bytes(length)
+        if self.encode:
+            success, body = self.sasl.decode(header + body)
+            if not success:
+                raise TTransportException(type=TTransportException.UNKNOWN, message=self.sasl.getError())
+        raise gen.Return(body)
+
+    def close(self):
+        super(TAsyncSaslClientTransport, self).close()
+        self.sasl = None
@@ -0,0 +1,112 @@
+from TCLIService.ttypes import TTypeId
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Arrow type factory for each Hive type name returned by get_type(); any
+# other type, including complex ones, is carried as a string.
+ARROW_TYPES = {
+    'BOOLEAN_TYPE': 'bool_',
+    'TINYINT_TYPE': 'int8',
+    'SMALLINT_TYPE': 'int16',
+    'INT_TYPE': 'int32',
+    'BIGINT_TYPE': 'int64',
+    'FLOAT_TYPE': 'float64',
+    'DOUBLE_TYPE': 'float64',
+    'BINARY_TYPE': 'binary',
+}
+
+
+def _decimal_arrow_type(column):
+    precision = column.qualifiers.get('precision')
+    scale = column.qualifiers.get('scale')
+    if precision is None or scale is None:
+        return None
+    return pyarrow.decimal128(precision, scale)
+
+
+# Arrow type for each type the built-in converters turn into Python objects,
+# or None when the column has no fixed Arrow type (a DECIMAL the server sent
+# without precision and scale) and its values are carried as strings.
+CONVERTED_ARROW_TYPES = {
+    TTypeId.TIMESTAMP_TYPE: lambda column: pyarrow.timestamp('us'),
+    TTypeId.DATE_TYPE: lambda column: pyarrow.date32(),
+    TTypeId.DECIMAL_TYPE: _decimal_arrow_type,
+}
+
+
+def _require():
+    if pyarrow is None:
+        raise ImportError('pyarrow is required for Arrow output')
+
+
+def arrow_type(typeName):
+    if not isinstance(typeName, str):
+        return pyarrow.string()
+    return getattr(pyarrow, ARROW_TYPES.get(typeName, 'string'))()
+
+
+def _is_converted(column, converters):
+    return converters is not None and converters.uses_default(column.typeId) and column.typeId in CONVERTED_ARROW_TYPES
+
+
+def column_arrow_type(column, converters=None):
+    if _is_converted(column, converters):
+        converted = CONVERTED_ARROW_TYPES[column.typeId](column)
+        if converted is not None:
+            return converted
+    return arrow_type(column.type)
+
+
+def arrow_schema(schema, converters=None):
+    """
+    Build an Arrow schema from the ColumnDescriptors of a result set, using
+    native Arrow types for columns the converters turn into Python objects.
+    """
+    _require()
+    return pyarrow.schema([pyarrow.field(col.name, column_arrow_type(col, converters)) for col in schema])
+
+
+def _as_text(values):
+    return [None if value is None else unicode(value) for value in values]
+
+
+def iter_record_batches(cursor):
+    """
+    Yield the rest of the cursor's result set as one Arrow RecordBatch per
+    FetchResults page.
+    """
+    descriptors = cursor.getColumnDescriptors() or ()
+    schema = arrow_schema(descriptors, cursor.converters)
+    # Converted values without an Arrow type of their own go back to text.
+    text = [_is_converted(column, cursor.converters) and field.type == pyarrow.string()
+            for column, field in zip(descriptors, schema)]
+    for columns in cursor._iter_column_pages():
+        arrays = [pyarrow.array(_as_text(values) if astext else values, type=field.type)
+                  for values, field, astext in zip(columns, schema, text)]
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema.names)
+
+
+def write_ipc(cursor, sink):
+    """
+    Stream the rest of the result set to an Arrow IPC file, one record batch
+    per page. sink is a path or a writable file object. Returns the number
+    of rows written.
+    """
+    schema = arrow_schema(cursor.getColumnDescriptors() or (), cursor.converters)
+    # The writer does not close a stream it was given, so own the file when
+    # handed a path.
+    stream = pyarrow.OSFile(sink, 'wb') if isinstance(sink, basestring) else sink
+    writer = pyarrow.RecordBatchFileWriter(stream, schema)
+    rows = 0
+    try:
+        for batch in iter_record_batches(cursor):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+        if stream is not sink:
+            stream.close()
+    return rows
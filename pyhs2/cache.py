@@ -0,0 +1,352 @@
+import cPickle as pickle
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from thrift.TSerialization import serialize, deserialize
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolAcceleratedFactory
+
+from TCLIService.ttypes import TRowSet
+
+# Quoted literals and identifiers, kept verbatim by normalize_hql().
+_TOKENS = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)|(\s+)", re.S)
+
+# Only plain queries are cached; anything else may have side effects.
+_CACHEABLE = re.compile(r'(select|with)\b', re.I)
+
+_PROTOCOL = TBinaryProtocolAcceleratedFactory()
+
+
+def normalize_hql(hql):
+    """
+    Collapse runs of whitespace outside quoted literals and drop trailing
+    semicolons, so trivially different spellings of a query share a key.
+    """
+    def replace(match):
+        return match.group(1) or ' '
+    return _TOKENS.sub(replace, hql).strip().rstrip(';').rstrip()
+
+
+def is_cacheable(hql):
+    return _CACHEABLE.match(normalize_hql(hql)) is not None
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def encode_page(rowSet):
+    return serialize(rowSet, _PROTOCOL)
+
+
+def decode_page(data):
+    return deserialize(TRowSet(), data, _PROTOCOL)
+
+
+class CacheEntry(object):
+
+    def __init__(self, schema, pages, expires):
+        self.schema = schema
+        # FetchResults pages as serialized TRowSets.
+        self.pages = pages
+        self.expires = expires
+        self.size = sum(len(page) for page in pages)
+
+    def rowsets(self):
+        return [decode_page(page) for page in self.pages]
+
+
+class ResultCache(object):
+    """
+    Client-side cache of query results, keyed by normalized HQL, database
+    and configuration overlay. Entries live in memory up to maxBytes of
+    serialized pages, least recently used first out; with a directory
+    entries evicted from memory are kept there as pickle files. Entries
+    expire ttl seconds after being stored, unless a statement gives its
+    own TTL.
+    """
+
+    def __init__(self, maxBytes=64 * 1024 * 1024, ttl=300, directory=None):
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.diskHits = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @staticmethod
+    def key(hql, database=None, confOverlay=None):
+        return (normalize_hql(hql), database, tuple(sorted((confOverlay or {}).items())))
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(repr(key)).hexdigest() + '.pickle')
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                storedKey, schema, pages, expires = pickle.load(f)
+        except (EnvironmentError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if storedKey != key:
+            return None
+        return CacheEntry(schema, pages, expires)
+
+    def _dump(self, key, entry):
+        # Write and rename so readers never see a partial file.
+        fd, tmp = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, entry.schema, entry.pages, entry.expires), f, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, self._path(key))
+        except EnvironmentError:
+            _remove(tmp)
+
+    def _remove_file(self, key):
+        _remove(self._path(key))
+
+    def _insert(self, key, entry):
+        # Called with the lock held; returns entries pushed out of memory.
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= old.size
+        self._entries[key] = entry
+        self.size += entry.size
+        evicted = []
+        while self.size > self.maxBytes and self._entries:
+            oldKey, old = self._entries.popitem(last=False)
+            self.size -= old.size
+            self.evictions += 1
+            evicted.append((oldKey, old))
+        return evicted
+
+    def _spill(self, evicted, now):
+        if self.directory is None:
+            return
+        for key, entry in evicted:
+            if entry.expires > now:
+                self._dump(key, entry)
+
+    def get(self, key):
+        """
+        Return the live CacheEntry for key, or None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > now:
+                    self._entries[key] = self._entries.pop(key)
+                    self.hits += 1
+                    return entry
+                del self._entries[key]
+                self.size -= entry.size
+        if self.directory is not None:
+            entry = self._load(key)
+            if entry is not None:
+                if entry.expires > now:
+                    with self._lock:
+                        evicted = self._insert(key, entry)
+                        self.hits += 1
+                        self.diskHits += 1
+                    self._remove_file(key)
+                    self._spill(evicted, now)
+                    return entry
+                self._remove_file(key)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, schema, pages, ttl=None):
+        """
+        Store the schema and serialized pages of a complete result set.
+        """
+        now = time.time()
+        entry = CacheEntry(schema, pages, now + (self.ttl if ttl is None else ttl))
+        if entry.size > self.maxBytes:
+            return
+        with self._lock:
+            evicted = self._insert(key, entry)
+        self._spill(evicted, now)
+
+    def invalidate(self, hql, database=None, confOverlay=None):
+        self._discard(self.key(hql, database, confOverlay))
+
+    def _discard(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+        if self.directory is not None:
+            self._remove_file(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    _remove(os.path.join(self.directory, name))
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'diskHits': self.diskHits,
+                    'evictions': self.evictions, 'entries': len(self._entries), 'bytes': self.size}
+
+
+class ResultRecorder(object):
+    """
+    Collects the pages of a result set as they are fetched, giving up once
+    they outgrow what the cache would hold.
+    """
+
+    def __init__(self, cache, key, ttl):
+        self.cache = cache
+        self.key = key
+        self.ttl = ttl
+        self.pages = []
+        self.size = 0
+        self.active = True
+
+    def add(self, rowSet):
+        if not self.active:
+            return
+        page = encode_page(rowSet)
+        self.size += len(page)
+        if self.size > self.cache.maxBytes:
+            self.active = False
+            self.pages = []
+            return
+        self.pages.append(page)
+
+    def finish(self, schema):
+        if self.active:
+            self.cache.put(self.key, schema, self.pages, self.ttl)
+        self.active = False
+        self.pages = []
+
+
+def like_pattern(pattern):
+    """
+    Compile a catalog call's LIKE-style pattern (% and _ wildcards, backslash
+    escapes) into a case-insensitive regular expression.
+    """
+    parts = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            parts.append(re.escape(char))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts) + r'\Z', re.I | re.S)
+
+
+def _matches_all(pattern):
+    return pattern is None or pattern == '%'
+
+
+class MetadataCache(object):
+    """
+    Connection-scoped cache of catalog call results (GetSchemas, GetTables,
+    GetColumns, GetFunctions, GetTableTypes), each kept for ttl seconds.
+
+    Keys are the call kind and its name patterns, so a narrower lookup is
+    answered by filtering a cached listing that covers it, e.g. the tables
+    of one schema from an earlier listing of every table.
+    """
+
+    # Row index of the column each name pattern is matched against.
+    PATTERN_COLUMNS = {
+        'schemas': (('schemaName', 0),),
+        'tables': (('schemaName', 1), ('tableName', 2)),
+        'columns': (('schemaName', 1), ('tableName', 2), ('columnName', 3)),
+        'functions': (('schemaName', 1), ('functionName', 2)),
+        'tableTypes': (),
+    }
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _key(self, kind, patterns, extra):
+        return (kind, tuple(patterns.get(name) for name, _ in self.PATTERN_COLUMNS[kind]), extra)
+
+    def _covers(self, kind, cached, wanted):
+        for (_, index), have, want in zip(self.PATTERN_COLUMNS[kind], cached, wanted):
+            if not (_matches_all(have) or have == want):
+                return False
+        return True
+
+    def _filter(self, kind, rows, wanted):
+        checks = [(index, like_pattern(want)) for (_, index), want in zip(self.PATTERN_COLUMNS[kind], wanted)
+                  if not _matches_all(want)]
+        return [row for row in rows
+                if all(row[index] is not None and regex.match(row[index]) for index, regex in checks)]
+
+    def get(self, kind, patterns, extra=None):
+        """
+        Return the cached (columns, rows) of a catalog call, or None. rows
+        are lists of column values, before any row factory.
+        """
+        key = self._key(kind, patterns, extra)
+        now = time.time()
+        with self._lock:
+            for cachedKey in [key] + [k for k in self._entries if k != key]:
+                entry = self._entries.get(cachedKey)
+                if entry is None:
+                    continue
+                expires, columns, rows = entry
+                if expires <= now:
+                    del self._entries[cachedKey]
+                    continue
+                if cachedKey == key:
+                    self.hits += 1
+                    return columns, [list(row) for row in rows]
+                if cachedKey[0] == kind and cachedKey[2] == extra and self._covers(kind, cachedKey[1], key[1]):
+                    self.hits += 1
+                    return columns, [list(row) for row in self._filter(kind, rows, key[1])]
+            self.misses += 1
+        return None
+
+    def put(self, kind, patterns, rows, extra=None, columns=None):
+        """
+        Cache the rows (sequences of column values) of a catalog call, with
+        the ColumnDescriptors of its result set.
+        """
+        with self._lock:
+            self._entries[self._key(kind, patterns, extra)] = (time.time() + self.ttl, columns,
+                                                               [list(row) for row in rows])
+
+    def refresh(self, kind=None):
+        """
+        Forget cached results, of one kind of call or all of them.
+        """
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[key]
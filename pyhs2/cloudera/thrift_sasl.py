@@ -22,9 +22,12 @@ from cStringIO import StringIO
 from thrift.transport import TTransport
 from thrift.transport.TTransport import *
 from thrift.protocol import TBinaryProtocol
-import sasl
+import socket
 import struct
 
+# Room kept at the front of the write buffer for the frame length.
+_HEADER = struct.Struct(">I")
+
 class TSaslClientTransport(TTransportBase, CReadableTransport):
   START = 1
   OK = 2
@@ -42,8 +45,12 @@ class TSaslClientTransport(TTransportBase, CReadableTransport):
     self.sasl_client_factory = sasl_client_factory
     self.sasl = None
     self.mechanism = mechanism
-    self.__wbuf = StringIO()
-    self.__rbuf = StringIO()
+    self.__wbuf = bytearray(_HEADER.size)
+    # Decoded frames are read into this reusable buffer; __rbuf is an input
+    # StringIO over (not a copy of) the current frame. fastbinary only reads
+    # from an input StringIO, which StringIO() is not.
+    self.__rframe = bytearray()
+    self.__rbuf = StringIO("")
     self.opened = False
     self.encode = None
 
@@ -98,62 +105,96 @@ class TSaslClientTransport(TTransportBase, CReadableTransport):
     return status, payload
 
   def write(self, data):
-    self.__wbuf.write(data)
+    self.__wbuf += data
 
   def flush(self):
-    buffer = self.__wbuf.getvalue()
+    # The payload follows the space reserved for the frame header.
+    payload = memoryview(self.__wbuf)[_HEADER.size:]
     # The first time we flush data, we send it to sasl.encode()
     # If the length doesn't change, then we must be using a QOP
     # of auth and we should no longer call sasl.encode(), otherwise
     # we encode every time.
     if self.encode == None:
-      success, encoded = self.sasl.encode(buffer)
+      success, encoded = self.sasl.encode(payload.tobytes())
       if not success:
         raise TTransportException(type=TTransportException.UNKNOWN,
                                   message=self.sasl.getError())
-      if (len(encoded)==len(buffer)):
+      if (len(encoded)==len(payload)):
         self.encode = False
-        self._flushPlain(buffer)
+        self._flushPlain(payload)
       else:
         self.encode = True
         self._trans.write(encoded)
     elif self.encode:
-      self._flushEncoded(buffer)
+      self._flushEncoded(payload)
     else:
-      self._flushPlain(buffer)
+      self._flushPlain(payload)
 
     self._trans.flush()
-    self.__wbuf = StringIO()
+    del payload
+    del self.__wbuf[_HEADER.size:]
 
-  def _flushEncoded(self, buffer):
+  def _flushEncoded(self, payload):
     # sasl.ecnode() does the encoding and adds the length header, so nothing
     # to do but call it and write the result.
-    success, encoded = self.sasl.encode(buffer)
+    success, encoded = self.sasl.encode(payload.tobytes())
     if not success:
       raise TTransportException(type=TTransportException.UNKNOWN,
                                 message=self.sasl.getError())
     self._trans.write(encoded)
 
-  def _flushPlain(self, buffer):
+  def _flushPlain(self, payload):
     # When we have QOP of auth, sasl.encode() will pass the input to the output
-    # but won't put a length header, so we have to do that.
-
-    # Note stolen from TFramedTransport:
-    # N.B.: Doing this string concatenation is WAY cheaper than making
-    # two separate calls to the underlying socket object. Socket writes in
-    # Python turn out to be REALLY expensive, but it seems to do a pretty
-    # good job of managing string buffer operations without excessive copies
-    self._trans.write(struct.pack(">I", len(buffer)) + buffer)
+    # but won't put a length header, so we have to do that. The header goes
+    # into the space reserved at the front of the write buffer, so header and
+    # payload leave in one socket write without concatenating a copy.
+    _HEADER.pack_into(self.__wbuf, 0, len(payload))
+    self._trans.write(self.__wbuf)
 
   def read(self, sz):
     ret = self.__rbuf.read(sz)
     if len(ret) != 0:
       return ret
 
-    self._read_frame()
+    end = self._read_frame(0)
+    self.__rbuf = StringIO(buffer(self.__rframe, 0, end))
     return self.__rbuf.read(sz)
 
-  def _read_frame(self):
+  def _reserve(self, size, keep):
+    # Grow by replacing the buffer rather than resizing it: a StringIO handed
+    # out earlier may still point into the old one.
+    if len(self.__rframe) < size:
+      frame = bytearray(max(size, 2 * len(self.__rframe)))
+      frame[:keep] = self.__rframe[:keep]
+      self.__rframe = frame
+
+  def _recv_into(self, offset, length):
+    # Sockets from pyhs2.sockets have a recv_into() (which CountingSocket
+    # counts); a plain TSocket's handle is read directly.
+    recv_into = getattr(self._trans, 'recv_into', None)
+    if recv_into is None:
+      handle = getattr(self._trans, 'handle', None)
+      if handle is None:
+        self.__rframe[offset:offset + length] = self._trans.readAll(length)
+        return
+      recv_into = handle.recv_into
+    view = memoryview(self.__rframe)
+    end = offset + length
+    try:
+      while offset < end:
+        received = recv_into(view[offset:end], end - offset)
+        if received == 0:
+          raise TTransportException(type=TTransportException.END_OF_FILE,
+                                    message='TSocket read 0 bytes')
+        offset += received
+    except socket.error, e:
+      raise TTransportException(type=TTransportException.UNKNOWN, message=str(e))
+
+  def _read_frame(self, offset):
+    """
+    Read the next frame into the frame buffer at offset, keeping the bytes
+    before it, and return the offset just past the frame.
+    """
     header = self._trans.readAll(4)
     (length,) = struct.unpack(">I", header)
     if self.encode:
@@ -165,10 +206,13 @@ class TSaslClientTransport(TTransportBase, CReadableTransport):
       if not success:
         raise TTransportException(type=TTransportException.UNKNOWN,
                                   message=self.sasl.getError())
-    else:
-      # If the frames are not encoded, just pass it through
-      decoded = self._trans.readAll(length)
-    self.__rbuf = StringIO(decoded)
+      self._reserve(offset + len(decoded), offset)
+      self.__rframe[offset:offset + len(decoded)] = decoded
+      return offset + len(decoded)
+    # If the frames are not encoded, read them straight into the frame buffer
+    self._reserve(offset + length, offset)
+    self._recv_into(offset, length)
+    return offset + length
 
   def close(self):
     self._trans.close()
@@ -183,9 +227,12 @@ class TSaslClientTransport(TTransportBase, CReadableTransport):
   def cstringio_refill(self, prefix, reqlen):
     # self.__rbuf will already be empty here because fastbinary doesn't
     # ask for a refill until the previous buffer is empty.  Therefore,
-    # we can start reading new frames immediately.
-    while len(prefix) < reqlen:
-      self._read_frame()
-      prefix += self.__rbuf.getvalue()
-    self.__rbuf = StringIO(prefix)
+    # we can start reading new frames immediately. Frames are appended
+    # after the prefix in place, so nothing already read is copied again.
+    self._reserve(len(prefix), 0)
+    self.__rframe[:len(prefix)] = prefix
+    end = len(prefix)
+    while end < reqlen:
+      end = self._read_frame(end)
+    self.__rbuf = StringIO(buffer(self.__rframe, 0, end))
     return self.__rbuf
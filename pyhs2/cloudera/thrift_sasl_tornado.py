@@ -19,29 +19,32 @@
 """ SASL transports for Thrift. Updated for Tornado Thrift. """
 import logging
 
-from thrift.TTornado import TTornadoStreamTransport
 from thrift.transport.TTransport import *
 import struct
 from tornado import gen
 
+from pyhs2.sockets_tornado import TunedStreamTransport
+
 logger = logging.getLogger(__name__)
 
 
-class TSaslClientTransportTornado(TTornadoStreamTransport):
+class TSaslClientTransportTornado(TunedStreamTransport):
     START = 1
     OK = 2
     BAD = 3
     ERROR = 4
     COMPLETE = 5
 
-    def __init__(self, sasl_client_factory, mechanism, host, port):
+    def __init__(self, sasl_client_factory, mechanism, host, port, socketOptions=None, counting=False):
         """
         @param sasl_client_factory: a callable that returns a new sasl.Client object
         @param mechanism: the SASL mechanism (e.g. "GSSAPI")
         @param host: ip address or host name
         @param port: port
+        @param socketOptions: see pyhs2.sockets.tcp_options()
+        @param counting: count the bytes on the stream (see TunedStreamTransport)
         """
-        TTornadoStreamTransport.__init__(self, host, port)
+        TunedStreamTransport.__init__(self, host, port, socketOptions, counting)
         self.sasl_client_factory = sasl_client_factory
         self.sasl = None
         self.mechanism = mechanism
@@ -51,7 +54,8 @@ class TSaslClientTransportTornado(TTornadoStreamTransport):
 
     @gen.engine
     def open(self, callback=None):
-        yield gen.Task(TTornadoStreamTransport.open, self)
+        if self.stream is None:
+            yield gen.Task(TunedStreamTransport.open, self)
 
         if self.sasl is not None:
             raise TTransportException(type=TTransportException.NOT_OPEN, message="Already open!")
@@ -168,5 +172,5 @@ class TSaslClientTransportTornado(TTornadoStreamTransport):
         callback(frame)
 
     def close(self):
-        TTornadoStreamTransport.close(self)
+        TunedStreamTransport.close(self)
         self.sasl = None
@@ -1,131 +1,164 @@
-from thrift.TTornado import TTornadoStreamTransport
-
-from thrift.protocol.TBinaryProtocol import TBinaryProtocol, TBinaryProtocolFactory
-from thrift.transport.TSocket import TSocket
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol, TBinaryProtocolAccelerated
 from thrift.transport.TTransport import TBufferedTransport
-import sasl
-from tornado import gen
+from thrift.Thrift import TException
 from cloudera.thrift_sasl import TSaslClientTransport
 
 from TCLIService import TCLIService
-from TCLIServiceTornado import TCLIService as TCLIServiceTornado
 
+from connections_base import BaseConnection
 from cursor import Cursor
-from TCLIService.ttypes import TCloseSessionReq, TOpenSessionReq
-from TCLIServiceTornado.ttypes import TCloseSessionReq as TCloseSessionReqTornado, \
-    TOpenSessionReq as TOpenSessionReqTornado
-from pyhs2.cloudera.thrift_sasl_tornado import TSaslClientTransportTornado
-from pyhs2.cursor_tornado import TornadoCursor
-
-
-class BaseConnection(object):
-    DEFAULT_KRB_SERVICE = 'hive'
-    AUTH_MECHANISMS = {'NOSASL', 'PLAIN', 'KERBEROS', 'LDAP'}
-    client = None
-    session = None
-
-    def __init__(self, authMechanism):
-        if authMechanism not in self.AUTH_MECHANISMS:
-            raise NotImplementedError('authMechanism is either not supported or not implemented')
-
-    def _get_krb_settings(self, default_host, config):
-        host = default_host
-        service = self.DEFAULT_KRB_SERVICE
-
-        if config is not None:
-            if 'krb_host' in config:
-                host = config['krb_host']
-
-            if 'krb_service' in config:
-                service = config['krb_service']
-
-        return host, service
-
-    @staticmethod
-    def _check_password(authMechanism, password):
-        if authMechanism == 'PLAIN' and (password is None or len(password) == 0):
-            password = 'password'
-        return password
-
-    def _get_sasl_client(self, host, authMechanism, user, password, configuration):
-        sasl_mech = 'PLAIN'
-        saslc = sasl.Client()
-        saslc.setAttr("username", user)
-        saslc.setAttr("password", password)
-        if authMechanism == 'KERBEROS':
-            krb_host,krb_service = self._get_krb_settings(host, configuration)
-            sasl_mech = 'GSSAPI'
-            saslc.setAttr("host", krb_host)
-            saslc.setAttr("service", krb_service)
-        saslc.init()
-        return saslc, sasl_mech
+from tracing import start_span
+from sockets import TunedSocket
+from TCLIService.ttypes import TCloseSessionReq, TOpenSessionReq, TProtocolVersion, TGetInfoReq, TGetInfoType, \
+    TStatusCode
+
 
 class Connection(BaseConnection):
+    transport = None
+    # The TunedSocket under transport.
+    socket = None
+    # Database selected with USE, if any.
+    database = None
+    # cache.ResultCache shared by the cursors of this connection, if any.
+    resultCache = None
+    # cache.MetadataCache for catalog calls, if metadataTtl was given.
+    metadataCache = None
+    # Optional instrumentation.Observer told about every call and page.
+    observer = None
+    # Optional tracer (see the tracing module) making connect, execute and
+    # fetch spans.
+    tracer = None
+
     def __enter__(self):
         return self
 
     def __exit__(self, _exc_type, _exc_value, _traceback):
         self.close()
 
-    def __init__(self, host=None, port=10000, authMechanism=None, user=None, password=None, database=None, configuration=None):
+    def __init__(self, host=None, port=10000, authMechanism=None, user=None, password=None, database=None,
+                 configuration=None, accelerated=True, clientProtocol=TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V6,
+                 resultCache=None, metadataTtl=None, observer=None, tracer=None, socketOptions=None):
         super(Connection, self).__init__(authMechanism)
+        self.resultCache = resultCache
+        self.observer = observer
+        self.tracer = tracer
+        if metadataTtl is not None:
+            from cache import MetadataCache
+            self.metadataCache = MetadataCache(metadataTtl)
         #Must set a password for thrift, even if it doesn't need one
         #Open issue with python-sasl
         password = self._check_password(authMechanism, password)
-        socket = TSocket(host, port)
+        counting = observer is not None or tracer is not None
+        # socketOptions: see sockets.tcp_options(); None for the defaults.
+        if counting:
+            from instrumentation import CountingSocket, InstrumentedClient, Observer
+            socket = CountingSocket(host, port, socketOptions)
+        else:
+            socket = TunedSocket(host, port, socketOptions)
+        sasl_mech = None
         if authMechanism == 'NOSASL':
             transport = TBufferedTransport(socket)
         else:
             saslc, sasl_mech = self._get_sasl_client(host, authMechanism, user, password, configuration)
             transport = TSaslClientTransport(saslc, sasl_mech, socket)
 
-        self.client = TCLIService.Client(TBinaryProtocol(transport))
-        transport.open()
-        res = self.client.OpenSession(TOpenSessionReq(configuration=configuration))
+        if self._use_accelerated(accelerated):
+            protocol = TBinaryProtocolAccelerated(transport)
+        else:
+            protocol = TBinaryProtocol(transport)
+        self.client = TCLIService.Client(protocol)
+        if counting:
+            self.client = InstrumentedClient(self.client, observer or Observer(), socket)
+        self.transport = transport
+        self.socket = socket
+        with start_span(tracer, 'pyhs2.connect', {'net.peer.name': host, 'net.peer.port': port,
+                                                   'pyhs2.auth_mechanism': authMechanism}):
+            self._open(socket, transport, sasl_mech)
+            with start_span(tracer, 'pyhs2.open_session') as span:
+                res = self.client.OpenSession(TOpenSessionReq(client_protocol=clientProtocol,
+                                                              configuration=configuration))
+                span.set_attribute('pyhs2.protocol_version', res.serverProtocolVersion)
         self.session = res.sessionHandle
+        self.protocolVersion = res.serverProtocolVersion
         if database is not None:
-            with self.cursor() as cur:
-                query = "USE {0}".format(database)
-                cur.execute(query)
-
-    def cursor(self):
-        return Cursor(self.client, self.session)
+            self.use(database)
+
+    def _open(self, socket, transport, saslMechanism):
+        if self.tracer is None:
+            transport.open()
+            return
+        # The socket is opened first so that the TCP connect and the SASL
+        # exchange get spans of their own; TSaslClientTransport.open() leaves
+        # an open socket alone.
+        with start_span(self.tracer, 'pyhs2.tcp_connect'):
+            socket.open()
+        if saslMechanism is not None:
+            with start_span(self.tracer, 'pyhs2.sasl_negotiate', {'pyhs2.sasl_mechanism': saslMechanism}):
+                transport.open()
+
+    def use(self, database):
+        with self.cursor() as cur:
+            query = "USE {0}".format(database)
+            cur.execute(query)
+        self.database = database
+
+    def ping(self):
+        """
+        Cheap liveness check: a single GetInfo round trip on the session.
+        """
+        req = TGetInfoReq(sessionHandle=self.session, infoType=TGetInfoType.CLI_SERVER_NAME)
+        try:
+            res = self.client.GetInfo(req)
+        except (TException, EnvironmentError):
+            return False
+        return res.status.statusCode in (TStatusCode.SUCCESS_STATUS, TStatusCode.SUCCESS_WITH_INFO_STATUS)
+
+    def cursor(self, confOverlay=None):
+        return Cursor(self.client, self.session, confOverlay, self.resultCache, self.database, self.metadataCache,
+                      self.observer, self.tracer, self)
 
     def close(self):
         req = TCloseSessionReq(sessionHandle=self.session)
-        self.client.CloseSession(req)
-
-class TornadoConnection(BaseConnection):
-    def __init__(self, host=None, port=10000, authMechanism=None, user=None, password=None, configuration=None):
-        super(TornadoConnection, self).__init__(authMechanism)
-        #Must set a password for thrift, even if it doesn't need one
-        #Open issue with python-sasl
-        password = self._check_password(authMechanism, password)
-        if authMechanism == "NOSASL":
-            self.transport = TTornadoStreamTransport(host, port)
-        else:
-            saslc, sasl_mech = self._get_sasl_client(host, authMechanism, user, password, configuration)
-            self.transport = TSaslClientTransportTornado(saslc, sasl_mech, host, port)
-        pfactory = TBinaryProtocolFactory()
-        self.client = TCLIServiceTornado.Client(self.transport, pfactory)
-
-    @gen.engine
-    def connect(self, database, configuration, callback):
-        yield gen.Task(self.transport.open)
-        req = TOpenSessionReqTornado(configuration=configuration)
-        res = yield gen.Task(self.client.OpenSession, req)
-        self.session = res.sessionHandle
-        if database is not None:
-            query = "USE {0}".format(database)
-            yield gen.Task(self.cursor().execute, query)
-        callback()
-
-    @gen.engine
-    def close(self, callback):
-        req = TCloseSessionReqTornado(sessionHandle=self.session)
-        yield gen.Task(self.client.CloseSession, req)
-        self.transport.close()
-        callback()
-
-    def cursor(self):
-        return TornadoCursor(self.client, self.session)
\ No newline at end of file
+        try:
+            self.client.CloseSession(req)
+        finally:
+            if self.transport is not None:
+                self.transport.close()
+
+class _TornadoConnectionType(type):
+    """
+    Metaclass of the TornadoConnection stand-in below. The real class is
+    imported on first use; calls, attribute reads, isinstance() and
+    issubclass() checks all go to it, and subclassing the stand-in
+    subclasses the real class.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        if any(isinstance(base, mcs) for base in bases):
+            bases = tuple(base._load() if isinstance(base, mcs) else base for base in bases)
+            return type(name, bases, namespace)
+        return type.__new__(mcs, name, bases, namespace)
+
+    def _load(cls):
+        from connections_tornado import TornadoConnection
+        return TornadoConnection
+
+    def __call__(cls, *args, **kwargs):
+        return cls._load()(*args, **kwargs)
+
+    def __getattr__(cls, name):
+        return getattr(cls._load(), name)
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls._load())
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, cls._load())
+
+
+class TornadoConnection(object):
+    """
+    Kept for backwards compatibility; the Tornado client now lives in
+    pyhs2.connections_tornado so sync users never import tornado.
+    """
+    __metaclass__ = _TornadoConnectionType
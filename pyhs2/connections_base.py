@@ -0,0 +1,68 @@
+"""
+What the sync, Tornado and asyncio connections share. Kept apart from
+connections so that the other clients do not import the sync stack.
+"""
+try:
+    from thrift.protocol import fastbinary
+except ImportError:
+    fastbinary = None
+
+
+class BaseConnection(object):
+    DEFAULT_KRB_SERVICE = 'hive'
+    AUTH_MECHANISMS = {'NOSASL', 'PLAIN', 'KERBEROS', 'LDAP'}
+    client = None
+    session = None
+    # Thrift codec in use: 'fastbinary' (C extension) or 'python'.
+    codec = None
+    # Protocol version agreed with the server in OpenSession. V6 and later
+    # return result pages as typed column buffers instead of TRow structs.
+    protocolVersion = None
+
+    def __init__(self, authMechanism):
+        if authMechanism not in self.AUTH_MECHANISMS:
+            raise NotImplementedError('authMechanism is either not supported or not implemented')
+
+    def _get_krb_settings(self, default_host, config):
+        host = default_host
+        service = self.DEFAULT_KRB_SERVICE
+
+        if config is not None:
+            if 'krb_host' in config:
+                host = config['krb_host']
+
+            if 'krb_service' in config:
+                service = config['krb_service']
+
+        return host, service
+
+    @staticmethod
+    def _check_password(authMechanism, password):
+        if authMechanism == 'PLAIN' and (password is None or len(password) == 0):
+            password = 'password'
+        return password
+
+    def _get_sasl_client(self, host, authMechanism, user, password, configuration):
+        # Imported here so NOSASL users do not need the sasl extension.
+        import sasl
+        sasl_mech = 'PLAIN'
+        saslc = sasl.Client()
+        saslc.setAttr("username", user)
+        saslc.setAttr("password", password)
+        if authMechanism == 'KERBEROS':
+            krb_host,krb_service = self._get_krb_settings(host, configuration)
+            sasl_mech = 'GSSAPI'
+            saslc.setAttr("host", krb_host)
+            saslc.setAttr("service", krb_service)
+        saslc.init()
+        return saslc, sasl_mech
+
+    def _use_accelerated(self, accelerated):
+        # fastbinary only decodes from a CReadableTransport: TBufferedTransport
+        # and TSaslClientTransport on the sync path, TMemoryBuffer frames on
+        # the Tornado path.
+        if accelerated and fastbinary is not None:
+            self.codec = 'fastbinary'
+            return True
+        self.codec = 'python'
+        return False
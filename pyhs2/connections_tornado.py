@@ -0,0 +1,77 @@
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolFactory, TBinaryProtocolAcceleratedFactory
+from tornado import gen
+
+from TCLIServiceTornado import TCLIService as TCLIServiceTornado
+from TCLIServiceTornado.ttypes import TCloseSessionReq as TCloseSessionReqTornado, \
+    TOpenSessionReq as TOpenSessionReqTornado
+from pyhs2.cloudera.thrift_sasl_tornado import TSaslClientTransportTornado
+from pyhs2.connections_base import BaseConnection
+from pyhs2.cursor_tornado import TornadoCursor
+from pyhs2.sockets_tornado import TunedStreamTransport
+from pyhs2.tracing import start_span
+
+
+class TornadoConnection(BaseConnection):
+    # Optional tracer (see the tracing module) making connect, execute and
+    # fetch spans.
+    tracer = None
+
+    def __init__(self, host=None, port=10000, authMechanism=None, user=None, password=None, configuration=None,
+                 accelerated=True, tracer=None, socketOptions=None):
+        super(TornadoConnection, self).__init__(authMechanism)
+        self.host = host
+        self.port = port
+        self.authMechanism = authMechanism
+        self.tracer = tracer
+        #Must set a password for thrift, even if it doesn't need one
+        #Open issue with python-sasl
+        password = self._check_password(authMechanism, password)
+        # Traced cursors record the bytes of each page, as in Connection.
+        counting = tracer is not None
+        if authMechanism == "NOSASL":
+            self.transport = TunedStreamTransport(host, port, socketOptions, counting)
+        else:
+            saslc, sasl_mech = self._get_sasl_client(host, authMechanism, user, password, configuration)
+            self.transport = TSaslClientTransportTornado(saslc, sasl_mech, host, port, socketOptions, counting)
+        if self._use_accelerated(accelerated):
+            pfactory = TBinaryProtocolAcceleratedFactory()
+        else:
+            pfactory = TBinaryProtocolFactory()
+        self.client = TCLIServiceTornado.Client(self.transport, pfactory)
+
+    @gen.engine
+    def connect(self, database, configuration, callback):
+        tracer = self.tracer
+        with start_span(tracer, 'pyhs2.connect', {'net.peer.name': self.host, 'net.peer.port': self.port,
+                                                   'pyhs2.auth_mechanism': self.authMechanism}):
+            if tracer is None:
+                yield gen.Task(self.transport.open)
+            else:
+                # As in Connection: the stream is opened first so the TCP
+                # connect and the SASL exchange are timed apart.
+                with start_span(tracer, 'pyhs2.tcp_connect'):
+                    yield gen.Task(TunedStreamTransport.open, self.transport)
+                if self.authMechanism != 'NOSASL':
+                    with start_span(tracer, 'pyhs2.sasl_negotiate',
+                                    {'pyhs2.sasl_mechanism': self.transport.mechanism}):
+                        yield gen.Task(self.transport.open)
+            with start_span(tracer, 'pyhs2.open_session') as span:
+                req = TOpenSessionReqTornado(configuration=configuration)
+                res = yield gen.Task(self.client.OpenSession, req)
+                span.set_attribute('pyhs2.protocol_version', res.serverProtocolVersion)
+        self.session = res.sessionHandle
+        self.protocolVersion = res.serverProtocolVersion
+        if database is not None:
+            query = "USE {0}".format(database)
+            yield gen.Task(self.cursor().execute, query)
+        callback()
+
+    @gen.engine
+    def close(self, callback):
+        req = TCloseSessionReqTornado(sessionHandle=self.session)
+        yield gen.Task(self.client.CloseSession, req)
+        self.transport.close()
+        callback()
+
+    def cursor(self):
+        return TornadoCursor(self.client, self.session, self.tracer, self.transport)
\ No newline at end of file
@@ -0,0 +1,131 @@
+from datetime import date, datetime
+from decimal import Context, Decimal, InvalidOperation
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+from TCLIService.ttypes import TTypeId
+
+
+def _nullsafe(func):
+    """
+    Turn a per-value function into one converting a whole column page,
+    leaving NULLs (None) alone.
+    """
+    def convert(values):
+        return [None if value is None else func(value) for value in values]
+    return convert
+
+
+def parse_timestamp(value):
+    # 'YYYY-MM-DD HH:MM:SS[.fffffffff]'; Hive keeps nanoseconds, datetime
+    # microseconds.
+    seconds, _, fraction = value.partition('.')
+    stamp = datetime.strptime(seconds, '%Y-%m-%d %H:%M:%S')
+    if fraction:
+        stamp = stamp.replace(microsecond=int(fraction[:6].ljust(6, '0')))
+    return stamp
+
+
+def parse_date(value):
+    year, month, day = value.split('-')
+    return date(int(year), int(month), int(day))
+
+
+def timestamp_converter(column):
+    return _nullsafe(parse_timestamp)
+
+
+def date_converter(column):
+    return _nullsafe(parse_date)
+
+
+def decimal_converter(column):
+    """
+    Parse DECIMAL strings into Decimals carrying the column's precision, and
+    its scale when the server reports one.
+    """
+    precision = column.qualifiers.get('precision')
+    scale = column.qualifiers.get('scale')
+    context = Context(prec=precision) if precision else None
+    exponent = Decimal(1).scaleb(-scale) if scale is not None else None
+
+    def parse(value):
+        number = Decimal(value) if context is None else context.create_decimal(value)
+        if exponent is not None:
+            try:
+                number = number.quantize(exponent, context=context)
+            except InvalidOperation:
+                pass
+        return number
+    return _nullsafe(parse)
+
+
+def json_converter(column):
+    """
+    Decode ARRAY, MAP, STRUCT and UNION values, which HiveServer2 sends as
+    JSON text. Values that are not valid JSON (e.g. maps with non-string
+    keys) are left as strings.
+    """
+    loads = json.loads
+
+    def parse(value):
+        try:
+            return loads(value)
+        except ValueError:
+            return value
+    return _nullsafe(parse)
+
+
+class Converters(object):
+    """
+    Registry of per-type converters. A converter is registered for a
+    TTypeId as a factory taking the column's ColumnDescriptor and returning
+    a function that converts a list of column values (one page) to a list of
+    Python values. Built-in converters cover TIMESTAMP, DATE, DECIMAL and the
+    complex types; register() replaces or adds to them.
+    """
+
+    DEFAULTS = {
+        TTypeId.TIMESTAMP_TYPE: timestamp_converter,
+        TTypeId.DATE_TYPE: date_converter,
+        TTypeId.DECIMAL_TYPE: decimal_converter,
+        TTypeId.ARRAY_TYPE: json_converter,
+        TTypeId.MAP_TYPE: json_converter,
+        TTypeId.STRUCT_TYPE: json_converter,
+        TTypeId.UNION_TYPE: json_converter,
+    }
+
+    def __init__(self, defaults=True):
+        self.factories = dict(self.DEFAULTS) if defaults else {}
+
+    def register(self, typeId, factory):
+        self.factories[typeId] = factory
+
+    def unregister(self, typeId):
+        self.factories.pop(typeId, None)
+
+    def uses_default(self, typeId):
+        """
+        Whether values of typeId come out as the built-in converter makes
+        them, e.g. datetimes for TIMESTAMP.
+        """
+        factory = self.factories.get(typeId)
+        return factory is not None and factory is self.DEFAULTS.get(typeId)
+
+    def for_columns(self, columns):
+        """
+        Return one conversion function per column (None where values are
+        kept as they are), or None if no column needs converting.
+        """
+        funcs = [self.factories[col.typeId](col) if col.typeId in self.factories else None
+                 for col in columns]
+        if not any(funcs):
+            return None
+        return funcs
+
+
+def convert_columns(columns, funcs):
+    return [func(values) if func is not None else values for values, func in zip(columns, funcs)]
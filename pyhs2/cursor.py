@@ -1,87 +1,373 @@
-from TCLIService.ttypes import TOpenSessionReq, TGetTablesReq, TFetchResultsReq,\
+import re
+import threading
+import time
+from itertools import islice, izip
+
+from TCLIService.ttypes import TOpenSessionReq, TGetTablesReq, TFetchResultsReq, TFetchResultsResp,\
   TStatusCode, TGetResultSetMetadataReq, TGetColumnsReq, TType, TTypeId, \
   TExecuteStatementReq, TGetOperationStatusReq, TFetchOrientation, TCloseOperationReq, \
-  TCloseSessionReq, TGetSchemasReq, TGetLogReq, TCancelOperationReq, TGetCatalogsReq
+  TCloseSessionReq, TGetSchemasReq, TGetLogReq, TCancelOperationReq, TGetCatalogsReq, TOperationState, \
+  TGetFunctionsReq, TGetTableTypesReq
 
 from error import Pyhs2Exception
+from decoders import RowDecoder, columnar_rows, count_rows, get_value, is_columnar, page_columns, rows_from_columns
+from schema import describe_columns, get_type, schema_dicts
+from rows import list_rows, tuple_rows
+from tracing import operation_id, start_span
+
+_USE = re.compile(r'\s*use\s+`?(\w+)`?\s*;?\s*$', re.I)
+# Statements after which cached catalog results may be out of date.
+_DDL = re.compile(r'\s*(create|drop|alter|msck)\b', re.I)
 
-def get_type(typeDesc):
-    for ttype in typeDesc.types:
-        if ttype.primitiveEntry is not None:
-            return TTypeId._VALUES_TO_NAMES[ttype.primitiveEntry.type]
-        elif ttype.mapEntry is not None:
-            return ttype.mapEntry
-        elif ttype.unionEntry is not None:
-            return ttype.unionEntry
-        elif ttype.arrayEntry is not None:
-            return ttype.arrayEntry
-        elif ttype.structEntry is not None:
-            return ttype.structEntry
-        elif ttype.userDefinedTypeEntry is not None:
-            return ttype.userDefinedTypeEntry
-
-def get_value(colValue):
-    if colValue.boolVal is not None:
-      return colValue.boolVal.value
-    elif colValue.byteVal is not None:
-      return colValue.byteVal.value
-    elif colValue.i16Val is not None:
-      return colValue.i16Val.value
-    elif colValue.i32Val is not None:
-      return colValue.i32Val.value
-    elif colValue.i64Val is not None:
-      return colValue.i64Val.value
-    elif colValue.doubleVal is not None:
-      return colValue.doubleVal.value
-    elif colValue.stringVal is not None:
-      return colValue.stringVal.value
+def _is_last_page(resultsRes, fetchReq):
+    # Some HiveServer2 releases always report hasMoreRows=False, so it is only
+    # trusted for a short page; a full page is followed by another request
+    # that ends the loop the old way, on an empty result.
+    return not resultsRes.hasMoreRows and count_rows(resultsRes.results) < fetchReq.maxRows
 
 class Cursor(object):
     session = None
     client = None
     operationHandle = None
+    # Number of rows requested per FetchResults call and the default
+    # size for fetchmany().
+    arraysize = 10000
+    # FetchResults calls skipped thanks to hasMoreRows.
+    roundTripsSaved = 0
+    # Pages to fetch ahead on a background thread while the current one is
+    # consumed; 0 fetches each page only when it is needed. The connection
+    # must not be used by other cursors while a prefetching cursor is read.
+    prefetch = 0
+    # The prefetch.PagePrefetcher reading ahead, while there is one.
+    _prefetcher = None
+    # Optional cache.ResultCache consulted before running a SELECT.
+    resultCache = None
+    # The Connection that made the cursor, if any. The database the session
+    # is using (part of the cache key) is kept there, so a USE run through
+    # one cursor is seen by every cursor of the session.
+    connection = None
+    _database = None
+    # Optional cache.MetadataCache answering the catalog calls.
+    metadataCache = None
+    # Optional converters.Converters turning TIMESTAMP, DATE, DECIMAL and
+    # complex type strings into Python objects, a column page at a time.
+    converters = None
+    # Row factory from the rows module: list_rows (the default), tuple_rows,
+    # named_rows or dict_rows.
+    rowFactory = staticmethod(list_rows)
+    # Optional instrumentation.Observer told how long each page took to decode.
+    observer = None
+    # Optional tracer (see the tracing module) for execute and fetch_page spans.
+    tracer = None
+    # GetOperationStatus polling for asynchronous statements: the first
+    # delay in seconds, the multiplier applied after each poll and the cap.
+    pollInterval = 0.1
+    pollBackoff = 1.5
+    maxPollInterval = 10.0
 
-    def __init__(self, _client, sessionHandle):
+    RUNNING_STATES = (TOperationState.INITIALIZED_STATE, TOperationState.RUNNING_STATE,
+                      TOperationState.PENDING_STATE)
+
+    def __init__(self, _client, sessionHandle, confOverlay=None, resultCache=None, database=None,
+                 metadataCache=None, observer=None, tracer=None, connection=None):
         self.session = sessionHandle
+        self.connection = connection
         self.client = _client
+        # Configuration sent with every statement run through this cursor.
+        self.confOverlay = confOverlay or {}
+        self.resultCache = resultCache
+        if connection is None:
+            self.database = database
+        self.metadataCache = metadataCache
+        self.observer = observer
+        self.tracer = tracer
+        # Held by the prefetch thread around each FetchResults call.
+        self._fetchLock = threading.RLock()
+        self._pages = None
+        self._reset_results()
+
+    @property
+    def database(self):
+        if self.connection is not None:
+            return self.connection.database
+        return self._database
+
+    @database.setter
+    def database(self, database):
+        if self.connection is not None:
+            self.connection.database = database
+        else:
+            self._database = database
+
+    def _stop_prefetch(self):
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    def _reset_results(self):
+        self._stop_prefetch()
+        # Rows of the current page that have not been handed out yet.
+        self._rows = iter(())
+        self._pages = None
+        self._pending = False
+        self._decoder = RowDecoder()
+        # Collects the pages of a result set to be cached.
+        self._recorder = None
+        # ColumnDescriptors of the current result set, once known.
+        self._columns = None
+        # Per-column conversion functions, resolved on the first page.
+        self._convert = None
+        self._convertResolved = False
+        # The row factory's row builder and the column names it was given.
+        self._make = None
+        self._rowNames = ()
 
-    def execute(self, hql):
-        query = TExecuteStatementReq(self.session, statement=hql, confOverlay={})
+    def execute(self, hql, async_=False, ttl=None):
+        """
+        Run hql. With async_=True the call returns as soon as the server has
+        accepted the statement; use poll(), is_running() or wait() to follow
+        it. Fetching from a statement still running waits for it first.
+
+        With a resultCache, a SELECT whose result is cached is answered
+        without contacting the server, and a fully read result is cached for
+        ttl seconds (the cache's default if None).
+        """
+        self._stop_prefetch()
+        with start_span(self.tracer, 'pyhs2.execute', {'db.statement': hql}) as span:
+            self._execute(hql, async_, ttl, span)
+
+    def _execute(self, hql, async_, ttl, span):
+        key = None
+        # The cache module is only loaded by cursors that have a cache.
+        if self.resultCache is not None:
+            from cache import decode_page, is_cacheable
+            if is_cacheable(hql):
+                key = self.resultCache.key(hql, self.database, self.confOverlay)
+                entry = self.resultCache.get(key)
+                if entry is not None:
+                    span.set_attribute('pyhs2.cache_hit', True)
+                    self.operationHandle = None
+                    self._reset_results()
+                    self._columns = entry.schema
+                    self._pages = (TFetchResultsResp(results=decode_page(page)) for page in entry.pages)
+                    return
+        query = TExecuteStatementReq(self.session, statement=hql, confOverlay=self.confOverlay, runAsync=async_)
         res = self.client.ExecuteStatement(query)
         self.operationHandle = res.operationHandle
+        if self.tracer is not None:
+            span.set_attribute('pyhs2.operation_id', operation_id(res.operationHandle))
+        self._reset_results()
         if res.status.errorCode is not None:
             raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
-        
+        self._pending = async_
+        if key is not None:
+            from cache import ResultRecorder
+            self._recorder = ResultRecorder(self.resultCache, key, ttl)
+        use = _USE.match(hql)
+        if use:
+            self.database = use.group(1)
+        if self.metadataCache is not None and _DDL.match(hql):
+            self.metadataCache.refresh()
+
+    def poll(self):
+        """
+        Return the current TOperationState of the last statement, raising
+        Pyhs2Exception if it failed.
+        """
+        req = TGetOperationStatusReq(operationHandle=self.operationHandle)
+        res = self.client.GetOperationStatus(req)
+        if res.status.errorCode is not None:
+            raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
+        if res.operationState == TOperationState.ERROR_STATE:
+            raise Pyhs2Exception(res.errorCode, res.errorMessage)
+        if res.operationState not in self.RUNNING_STATES:
+            self._pending = False
+        return res.operationState
+
+    def is_running(self):
+        return self.poll() in self.RUNNING_STATES
+
+    def wait(self, timeout=None):
+        """
+        Poll until the last statement leaves the running states, sleeping
+        pollInterval seconds between polls and growing the delay by
+        pollBackoff up to maxPollInterval. Returns the final state, or None
+        if timeout seconds elapse first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        interval = self.pollInterval
+        while True:
+            state = self.poll()
+            if state not in self.RUNNING_STATES:
+                return state
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            interval = min(interval * self.pollBackoff, self.maxPollInterval)
+
     def fetch(self):
-        rows = []
-        fetchReq = TFetchResultsReq(operationHandle=self.operationHandle,
-                                    orientation=TFetchOrientation.FETCH_NEXT,
-                                    maxRows=10000)
-        self._fetch(rows, fetchReq)
+        return self.fetchall()
+
+    def fetchone(self):
+        """
+        Return the next row of the result set, or None when it is exhausted.
+        """
+        for row in self._rows:
+            return row
+        while self._fill_buffer():
+            for row in self._rows:
+                return row
+        return None
+
+    def fetchmany(self, size=None):
+        """
+        Return up to size rows (arraysize by default). Pages are only
+        requested from the server when the local buffer runs dry.
+        """
+        if size is None:
+            size = self.arraysize
+        rows = list(islice(self._rows, size))
+        while len(rows) < size and self._fill_buffer():
+            rows.extend(islice(self._rows, size - len(rows)))
         return rows
 
-    def getSchema(self):
-        if self.operationHandle:
+    def fetchall(self):
+        rows = list(self._rows)
+        while self._fill_buffer():
+            rows.extend(self._rows)
+        return rows
+
+    def iter_rows(self):
+        """
+        Yield the result rows one at a time. Pages are requested from the
+        server only as the previous one is consumed, so at most one page of
+        results is held in memory regardless of the size of the result set.
+        """
+        while True:
+            for row in self._rows:
+                yield row
+            if not self._fill_buffer():
+                return
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def fetch_numpy(self):
+        """
+        Fetch the rest of the result set as an OrderedDict of column name to
+        typed NumPy array (masked where the column has NULLs).
+        """
+        from frames import fetch_numpy
+        return fetch_numpy(self)
+
+    def fetch_dataframe(self):
+        """
+        Fetch the rest of the result set as a pandas DataFrame.
+        """
+        from frames import fetch_dataframe
+        return fetch_dataframe(self)
+
+    def iter_record_batches(self):
+        """
+        Yield the rest of the result set as Arrow RecordBatches, one per page.
+        """
+        from arrow_io import iter_record_batches
+        return iter_record_batches(self)
+
+    def write_arrow(self, sink):
+        """
+        Stream the rest of the result set to an Arrow IPC file at sink (a path
+        or writable file object) and return the number of rows written.
+        """
+        from arrow_io import write_ipc
+        return write_ipc(self, sink)
+
+    def getColumnDescriptors(self):
+        """
+        Return the result set's columns as ColumnDescriptors, or None if there
+        is no result set. The metadata is requested once per operation,
+        after waiting for an asynchronous statement to finish.
+        """
+        if self._columns is None and self.operationHandle:
+            if self._pending:
+                self.wait()
             req = TGetResultSetMetadataReq(self.operationHandle)
-            res = self.client.GetResultSetMetadata(req)
+            with self._fetchLock:
+                res = self.client.GetResultSetMetadata(req)
+            if res.status.statusCode not in (TStatusCode.SUCCESS_STATUS, TStatusCode.SUCCESS_WITH_INFO_STATUS):
+                raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
             if res.schema is not None:
-                cols = []
-                for c in self.client.GetResultSetMetadata(req).schema.columns:
-                    col = {}
-                    col['type'] = get_type(c.typeDesc)
-                    col['columnName'] = c.columnName
-                    col['comment'] = c.comment
-                    cols.append(col)
-                return cols
-        return None
+                self._columns = describe_columns(res.schema)
+                if self._decoder.slots is None:
+                    self._decoder = RowDecoder.from_types([col.type for col in self._columns], self._decoder.make)
+        return self._columns
 
-    def getDatabases(self):
-        req = TGetSchemasReq(self.session)
-        res = self.client.GetSchemas(req)
+    def getSchema(self):
+        columns = self.getColumnDescriptors()
+        if columns is None:
+            return None
+        return schema_dicts(columns)
+
+    def _catalog(self, kind, call, req, patterns, extra=None, refresh=False):
+        """
+        Run a catalog call and fetch its rows, answering from the metadata
+        cache when possible. refresh=True always asks the server.
+        """
+        cache = self.metadataCache
+        if cache is not None and not refresh:
+            cached = cache.get(kind, patterns, extra)
+            if cached is not None:
+                return self._catalog_rows(*cached)
+        self._stop_prefetch()
+        res = call(req)
         self.operationHandle = res.operationHandle
+        self._reset_results()
         if res.status.errorCode is not None:
             raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
-        return self.fetch()
+        # The cache keeps plain values, so the row factory runs on hits too.
+        values = [list(row) for columns in self._iter_column_pages() for row in izip(*columns)]
+        columns = self.getColumnDescriptors()
+        if cache is not None:
+            cache.put(kind, patterns, values, extra, columns)
+        return self._catalog_rows(columns, values)
+
+    def _catalog_rows(self, columns, values):
+        make = self.rowFactory([col.name for col in columns or ()])
+        if make is list:
+            return values
+        return map(make, values)
+
+    def getDatabases(self, refresh=False):
+        req = TGetSchemasReq(self.session)
+        return self._catalog('schemas', self.client.GetSchemas, req, {}, refresh=refresh)
+
+    def getTables(self, schemaName=None, tableName=None, tableTypes=None, refresh=False):
+        """
+        Return the tables matching the schema and table name patterns (% and
+        _ wildcards), optionally only those of the given tableTypes.
+        """
+        req = TGetTablesReq(self.session, schemaName=schemaName, tableName=tableName, tableTypes=tableTypes)
+        patterns = {'schemaName': schemaName, 'tableName': tableName}
+        extra = tuple(sorted(tableTypes)) if tableTypes else None
+        return self._catalog('tables', self.client.GetTables, req, patterns, extra, refresh)
+
+    def getColumns(self, schemaName=None, tableName=None, columnName=None, refresh=False):
+        req = TGetColumnsReq(self.session, schemaName=schemaName, tableName=tableName, columnName=columnName)
+        patterns = {'schemaName': schemaName, 'tableName': tableName, 'columnName': columnName}
+        return self._catalog('columns', self.client.GetColumns, req, patterns, refresh=refresh)
+
+    def getFunctions(self, functionName, schemaName=None, refresh=False):
+        req = TGetFunctionsReq(self.session, schemaName=schemaName, functionName=functionName)
+        patterns = {'schemaName': schemaName, 'functionName': functionName}
+        return self._catalog('functions', self.client.GetFunctions, req, patterns, refresh=refresh)
+
+    def getTableTypes(self, refresh=False):
+        req = TGetTableTypesReq(self.session)
+        return self._catalog('tableTypes', self.client.GetTableTypes, req, {}, refresh=refresh)
 
     def __enter__(self):
         return self
@@ -89,19 +375,123 @@ class Cursor(object):
     def __exit__(self, _exc_type, _exc_value, _traceback):
         self.close()
 
-    def _fetch(self, rows, fetchReq):
+    def _iter_pages(self):
+        if self._pending:
+            self.wait()
+        fetchReq = TFetchResultsReq(operationHandle=self.operationHandle,
+                                    orientation=TFetchOrientation.FETCH_NEXT)
+        recorder = self._recorder
         while True:
-            resultsRes = self.client.FetchResults(fetchReq)
-            for row in resultsRes.results.rows:
-                rowData= []
-                for i, col in enumerate(row.colVals):
-                    rowData.append(get_value(col))
-                rows.append(rowData)
-            if len(resultsRes.results.rows) == 0:
+            # Re-read arraysize on every request so it can be tuned mid-stream.
+            fetchReq.maxRows = self.arraysize
+            if self.tracer is None:
+                resultsRes = self.client.FetchResults(fetchReq)
+            else:
+                resultsRes = self._traced_fetch(fetchReq)
+            if count_rows(resultsRes.results) == 0:
                 break
-        return rows
+            if recorder is not None:
+                recorder.add(resultsRes.results)
+            yield resultsRes
+            if _is_last_page(resultsRes, fetchReq):
+                self.roundTripsSaved += 1
+                break
+        if recorder is not None:
+            recorder.finish(self.getColumnDescriptors())
+
+    def _traced_fetch(self, fetchReq):
+        # Connection gives a traced cursor an InstrumentedClient, whose
+        # socket counts the bytes of the page.
+        socket = getattr(self.client, 'socket', None)
+        received = socket.bytesRead if socket is not None else 0
+        with start_span(self.tracer, 'pyhs2.fetch_page',
+                        {'pyhs2.operation_id': operation_id(fetchReq.operationHandle)}) as span:
+            resultsRes = self.client.FetchResults(fetchReq)
+            span.set_attribute('pyhs2.rows', count_rows(resultsRes.results))
+            if socket is not None:
+                span.set_attribute('net.bytes_received', socket.bytesRead - received)
+        return resultsRes
+
+    def _open_pages(self):
+        if self.prefetch > 0:
+            from prefetch import PagePrefetcher
+            self._prefetcher = PagePrefetcher(self._iter_pages(), self.prefetch, self._fetchLock)
+            return self._prefetcher
+        return self._iter_pages()
+
+    def _iter_column_pages(self):
+        """
+        Yield the rest of the result set a page at a time, each page as a list
+        of values per column. Rows already buffered come out first.
+        """
+        rows = list(self._rows)
+        if rows and isinstance(rows[0], dict):
+            rows = [[row[name] for name in self._rowNames] for row in rows]
+        if rows:
+            yield zip(*rows)
+        if self._pages is None:
+            self._pages = self._open_pages()
+        for resultsRes in self._pages:
+            start = time.time()
+            columns = page_columns(resultsRes.results, self._decoder)
+            convert = self._column_converters()
+            if convert is not None:
+                from converters import convert_columns
+                columns = convert_columns(columns, convert)
+            if self.observer is not None:
+                self.observer.decoded(count_rows(resultsRes.results), time.time() - start)
+            yield columns
+
+    def _row_maker(self):
+        if self._make is None:
+            factory = self.rowFactory
+            if factory is list_rows or factory is tuple_rows:
+                names = ()
+            else:
+                names = [col.name for col in self.getColumnDescriptors() or ()]
+            self._rowNames = names
+            self._make = factory(names)
+            self._decoder.set_make(self._make)
+        return self._make
+
+    def _column_converters(self):
+        if not self._convertResolved:
+            self._convertResolved = True
+            if self.converters is not None:
+                self._convert = self.converters.for_columns(self.getColumnDescriptors() or ())
+        return self._convert
+
+    def _fill_buffer(self):
+        """
+        Make the next page the current row buffer. Returns False once the
+        result set is exhausted. Columnar pages are kept as column buffers
+        and rows are assembled as they are read.
+        """
+        if self._pages is None:
+            self._pages = self._open_pages()
+        for resultsRes in self._pages:
+            if self.observer is None:
+                self._rows = self._decode_page(resultsRes.results)
+            else:
+                start = time.time()
+                self._rows = self._decode_page(resultsRes.results)
+                self.observer.decoded(count_rows(resultsRes.results), time.time() - start)
+            return True
+        return False
+
+    def _decode_page(self, results):
+        make = self._row_maker()
+        convert = self._column_converters()
+        if convert is not None:
+            from converters import convert_columns
+            columns = convert_columns(page_columns(results, self._decoder), convert)
+            return rows_from_columns(columns, make)
+        elif is_columnar(results):
+            return columnar_rows(results, make)
+        return iter(self._decoder.decode_rows(results.rows))
 
     def close(self):
+        self._stop_prefetch()
         if self.operationHandle is not None:
             req = TCloseOperationReq(operationHandle=self.operationHandle)
             self.client.CloseOperation(req) 
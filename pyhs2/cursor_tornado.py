@@ -1,54 +1,49 @@
 from tornado import gen
-from TCLIServiceTornado.ttypes import TFetchResultsReq, TGetResultSetMetadataReq, TTypeId, TExecuteStatementReq, \
+from TCLIServiceTornado.ttypes import TFetchResultsReq, TGetResultSetMetadataReq, TExecuteStatementReq, \
     TFetchOrientation, TCloseOperationReq, TGetSchemasReq
 
 from error import Pyhs2Exception
+from decoders import RowDecoder, columnar_rows, count_rows, is_columnar
+from schema import describe_columns, schema_dicts
+from tracing import operation_id, start_span
 
-def get_type(typeDesc):
-    for ttype in typeDesc.types:
-        if ttype.primitiveEntry is not None:
-            return TTypeId._VALUES_TO_NAMES[ttype.primitiveEntry.type]
-        elif ttype.mapEntry is not None:
-            return ttype.mapEntry
-        elif ttype.unionEntry is not None:
-            return ttype.unionEntry
-        elif ttype.arrayEntry is not None:
-            return ttype.arrayEntry
-        elif ttype.structEntry is not None:
-            return ttype.structEntry
-        elif ttype.userDefinedTypeEntry is not None:
-            return ttype.userDefinedTypeEntry
-
-def get_value(colValue):
-    if colValue.boolVal is not None:
-      return colValue.boolVal.value
-    elif colValue.byteVal is not None:
-      return colValue.byteVal.value
-    elif colValue.i16Val is not None:
-      return colValue.i16Val.value
-    elif colValue.i32Val is not None:
-      return colValue.i32Val.value
-    elif colValue.i64Val is not None:
-      return colValue.i64Val.value
-    elif colValue.doubleVal is not None:
-      return colValue.doubleVal.value
-    elif colValue.stringVal is not None:
-      return colValue.stringVal.value
+def _is_last_page(resultsRes, fetchReq):
+    # Some HiveServer2 releases always report hasMoreRows=False, so it is only
+    # trusted for a short page; a full page is followed by another request
+    # that ends the loop the old way, on an empty result.
+    return not resultsRes.hasMoreRows and count_rows(resultsRes.results) < fetchReq.maxRows
 
 class TornadoCursor(object):
     session = None
     client = None
     operationHandle = None
+    # FetchResults calls skipped thanks to hasMoreRows.
+    roundTripsSaved = 0
+    # Optional tracer (see the tracing module) for execute and fetch_page spans.
+    tracer = None
+    # The client's transport; a counting one adds page sizes to the spans.
+    transport = None
 
-    def __init__(self, _client, sessionHandle):
+    def __init__(self, _client, sessionHandle, tracer=None, transport=None):
         self.session = sessionHandle
         self.client = _client
+        self.tracer = tracer
+        self.transport = transport
+        # ColumnDescriptors of the current result set, once known.
+        self._columns = None
+        # RowDecoder for the current result set's row-based pages, once built.
+        self._decoder = None
 
     @gen.engine
     def execute(self, hql, callback):
         query = TExecuteStatementReq(self.session, statement=hql, confOverlay={})
-        res = yield gen.Task(self.client.ExecuteStatement, query)
+        with start_span(self.tracer, 'pyhs2.execute', {'db.statement': hql}) as span:
+            res = yield gen.Task(self.client.ExecuteStatement, query)
+            if self.tracer is not None:
+                span.set_attribute('pyhs2.operation_id', operation_id(res.operationHandle))
         self.operationHandle = res.operationHandle
+        self._columns = None
+        self._decoder = None
         if res.status.errorCode is not None:
             raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
         callback()
@@ -63,27 +58,26 @@ class TornadoCursor(object):
         callback(rows)
 
     @gen.engine
-    def getSchema(self, callback):
-        cols = None
-        if self.operationHandle:
+    def getColumnDescriptors(self, callback):
+        if self._columns is None and self.operationHandle:
             req = TGetResultSetMetadataReq(self.operationHandle)
             res = yield gen.Task(self.client.GetResultSetMetadata, req)
             if res.schema is not None:
-                cols = []
-                metadata = yield gen.Task(self.client.GetResultSetMetadata, req)
-                for c in metadata.schema.columns:
-                    col = dict()
-                    col['type'] = get_type(c.typeDesc)
-                    col['columnName'] = c.columnName
-                    col['comment'] = c.comment
-                    cols.append(col)
-        callback(cols)
+                self._columns = describe_columns(res.schema)
+        callback(self._columns)
+
+    @gen.engine
+    def getSchema(self, callback):
+        columns = yield gen.Task(self.getColumnDescriptors)
+        callback(None if columns is None else schema_dicts(columns))
 
     @gen.engine
     def getDatabases(self, callback):
         req = TGetSchemasReq(self.session)
         res = yield gen.Task(self.client.GetSchemas, req)
         self.operationHandle = res.operationHandle
+        self._columns = None
+        self._decoder = None
         if res.status.errorCode is not None:
             raise Pyhs2Exception(res.status.errorCode, res.status.errorMessage)
         fetch_res = yield gen.Task(self.fetch)
@@ -92,13 +86,34 @@ class TornadoCursor(object):
     @gen.engine
     def _fetch(self, rows, fetchReq, callback):
         while True:
-            resultsRes = yield gen.Task(self.client.FetchResults, fetchReq)
-            for row in resultsRes.results.rows:
-                rowData = []
-                for i, col in enumerate(row.colVals):
-                    rowData.append(get_value(col))
-                rows.append(rowData)
-            if len(resultsRes.results.rows) == 0:
+            if self.tracer is None:
+                resultsRes = yield gen.Task(self.client.FetchResults, fetchReq)
+            else:
+                # TornadoConnection gives a traced cursor a transport whose
+                # CountingIOStream counts the bytes of the page.
+                stream = getattr(self.transport, 'stream', None)
+                received = getattr(stream, 'bytesRead', None)
+                with start_span(self.tracer, 'pyhs2.fetch_page',
+                                {'pyhs2.operation_id': operation_id(fetchReq.operationHandle)}) as span:
+                    resultsRes = yield gen.Task(self.client.FetchResults, fetchReq)
+                    span.set_attribute('pyhs2.rows', count_rows(resultsRes.results))
+                    if received is not None:
+                        span.set_attribute('net.bytes_received', stream.bytesRead - received)
+            if count_rows(resultsRes.results) == 0:
+                break
+            if is_columnar(resultsRes.results):
+                rows.extend(columnar_rows(resultsRes.results))
+            else:
+                if self._decoder is None:
+                    # Resolve each column's value slot from the schema, as
+                    # Cursor does, once per operation; columnar pages need
+                    # no decoder and so no metadata call.
+                    columns = yield gen.Task(self.getColumnDescriptors)
+                    self._decoder = RowDecoder() if columns is None else \
+                        RowDecoder.from_types([col.type for col in columns])
+                rows.extend(self._decoder.decode_rows(resultsRes.results.rows))
+            if _is_last_page(resultsRes, fetchReq):
+                self.roundTripsSaved += 1
                 break
         callback(rows)
 
@@ -0,0 +1,203 @@
+from itertools import imap, izip
+from operator import attrgetter
+
+# TColumnValue slots in the order get_value() probes them.
+VALUE_SLOTS = ('boolVal', 'byteVal', 'i16Val', 'i32Val', 'i64Val', 'doubleVal', 'stringVal')
+
+# Slot HiveServer2 fills for each primitive type. Everything else,
+# including TIMESTAMP, DECIMAL and complex types, is sent as a string.
+TYPE_SLOTS = {
+    'BOOLEAN_TYPE': 'boolVal',
+    'TINYINT_TYPE': 'byteVal',
+    'SMALLINT_TYPE': 'i16Val',
+    'INT_TYPE': 'i32Val',
+    'BIGINT_TYPE': 'i64Val',
+    'FLOAT_TYPE': 'doubleVal',
+    'DOUBLE_TYPE': 'doubleVal',
+}
+
+_SLOT_GETTERS = [(slot, attrgetter(slot)) for slot in VALUE_SLOTS]
+
+# TColumn slots of a columnar (protocol V6+) TRowSet.
+COLUMN_SLOTS = VALUE_SLOTS + ('binaryVal',)
+
+_COLUMN_GETTERS = [attrgetter(slot) for slot in COLUMN_SLOTS]
+
+
+def get_value(colValue):
+    if colValue.boolVal is not None:
+      return colValue.boolVal.value
+    elif colValue.byteVal is not None:
+      return colValue.byteVal.value
+    elif colValue.i16Val is not None:
+      return colValue.i16Val.value
+    elif colValue.i32Val is not None:
+      return colValue.i32Val.value
+    elif colValue.i64Val is not None:
+      return colValue.i64Val.value
+    elif colValue.doubleVal is not None:
+      return colValue.doubleVal.value
+    elif colValue.stringVal is not None:
+      return colValue.stringVal.value
+
+
+def slot_for_type(typeName):
+    # get_type() returns the entry struct rather than a name for complex types.
+    if not isinstance(typeName, str):
+        return 'stringVal'
+    return TYPE_SLOTS.get(typeName, 'stringVal')
+
+
+def probe_slot(colValue):
+    for slot, getter in _SLOT_GETTERS:
+        if getter(colValue) is not None:
+            return slot
+    return None
+
+
+def compile_row_decoder(slots, container=list):
+    """
+    Build a function turning a row's colVals into a list (or, with
+    container=tuple, a tuple) of plain values. The accessors are compiled
+    into one function body, so decoding a row costs a single call and no
+    per-cell attribute probing.
+    """
+    for slot in slots:
+        if slot not in VALUE_SLOTS:
+            raise ValueError('unknown TColumnValue slot: %r' % (slot,))
+    if not slots:
+        return lambda colVals: container()
+    names = ['c%d' % i for i in xrange(len(slots))]
+    template = '[%s]' if container is list else '(%s,)'
+    source = 'def decode(colVals):\n    %s, = colVals\n    return %s\n' % (
+        ', '.join(names), template % ', '.join('%s.%s.value' % (name, slot) for name, slot in zip(names, slots)))
+    namespace = {}
+    exec source in namespace
+    return namespace['decode']
+
+
+class RowDecoder(object):
+    """
+    Decodes pages of TRow structs. The value slot of each column is resolved
+    once, from the result set schema when it is known or from the first row
+    otherwise. Pages that do not match the resolved slots (e.g. a NULL sent
+    as an empty TColumnValue) fall back to probing every cell.
+
+    Rows are lists by default; make is a row factory's function (see rows)
+    turning a tuple of values into a row.
+    """
+
+    def __init__(self, slots=None, make=list):
+        self.slots = None
+        self.make = make
+        self._decode = None
+        if slots is not None:
+            self._set_slots(slots)
+
+    @classmethod
+    def from_types(cls, typeNames, make=list):
+        return cls([slot_for_type(typeName) for typeName in typeNames], make)
+
+    def set_make(self, make):
+        self.make = make
+        if self.slots is not None:
+            self._set_slots(self.slots)
+
+    def _set_slots(self, slots):
+        self.slots = list(slots)
+        self._decode = compile_row_decoder(self.slots, list if self.make is list else tuple)
+
+    def _learn(self, row):
+        slots = [probe_slot(col) for col in row.colVals]
+        if None not in slots:
+            self._set_slots(slots)
+
+    def decode_values(self, rows):
+        """
+        Decode rows into lists or tuples of values, whatever make is.
+        """
+        if self._decode is None and rows:
+            self._learn(rows[0])
+        decode = self._decode
+        if decode is not None:
+            try:
+                return [decode(row.colVals) for row in rows]
+            except (AttributeError, ValueError):
+                pass
+        return [[get_value(col) for col in row.colVals] for row in rows]
+
+    def decode_rows(self, rows):
+        values = self.decode_values(rows)
+        make = self.make
+        if values and type(values[0]) is make:
+            return values
+        return map(make, values)
+
+
+def is_columnar(rowSet):
+    return bool(rowSet.columns)
+
+
+def count_rows(rowSet):
+    if rowSet.columns:
+        # The length of the first column's values, without applying its nulls.
+        for getter in _COLUMN_GETTERS:
+            typedColumn = getter(rowSet.columns[0])
+            if typedColumn is not None:
+                return len(typedColumn.values)
+        return 0
+    return len(rowSet.rows)
+
+
+def apply_nulls(values, nulls):
+    """
+    Replace the entries flagged in a TColumn null bitmap (bit i of byte
+    i / 8, least significant bit first) with None.
+    """
+    if not nulls or not nulls.strip('\x00'):
+        return values
+    values = list(values)
+    size = len(values)
+    for byteIndex, byte in enumerate(bytearray(nulls)):
+        if byte:
+            base = byteIndex * 8
+            for bit in xrange(8):
+                if byte & (1 << bit) and base + bit < size:
+                    values[base + bit] = None
+    return values
+
+
+def column_values(column):
+    """
+    Return the values of a V6 TColumn as a flat list, with NULLs as None.
+    """
+    for getter in _COLUMN_GETTERS:
+        typedColumn = getter(column)
+        if typedColumn is not None:
+            return apply_nulls(typedColumn.values, typedColumn.nulls)
+    return []
+
+
+def columnar_rows(rowSet, make=list):
+    """
+    Lazily assemble rows from the column buffers of a columnar TRowSet;
+    each row is only built when the iterator reaches it.
+    """
+    return rows_from_columns([column_values(column) for column in rowSet.columns], make)
+
+
+def rows_from_columns(columns, make=list):
+    rows = izip(*columns)
+    if make is tuple:
+        return rows
+    return imap(make, rows)
+
+
+def page_columns(rowSet, decoder):
+    """
+    Return a page as one list of values per column, reading columnar pages
+    directly and transposing decoded TRow pages.
+    """
+    if rowSet.columns:
+        return [column_values(column) for column in rowSet.columns]
+    return zip(*decoder.decode_values(rowSet.rows))
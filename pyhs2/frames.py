@@ -0,0 +1,147 @@
+from collections import OrderedDict
+
+from TCLIService.ttypes import TTypeId
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+# NumPy dtype for each primitive Hive type; everything else is kept as
+# Python objects. HiveServer2 sends FLOAT columns as doubles.
+NUMPY_TYPES = {
+    'BOOLEAN_TYPE': 'bool',
+    'TINYINT_TYPE': 'int8',
+    'SMALLINT_TYPE': 'int16',
+    'INT_TYPE': 'int32',
+    'BIGINT_TYPE': 'int64',
+    'FLOAT_TYPE': 'float64',
+    'DOUBLE_TYPE': 'float64',
+}
+
+# NumPy dtype for types the built-in converters turn into Python objects
+# that NumPy can store natively.
+CONVERTED_NUMPY_TYPES = {
+    TTypeId.TIMESTAMP_TYPE: 'datetime64[us]',
+    TTypeId.DATE_TYPE: 'datetime64[D]',
+}
+
+# Capacity growth factor once a column outgrows its preallocated array.
+GROWTH = 1.5
+
+
+def _require(module, name):
+    if module is None:
+        raise ImportError('%s is required for this result format' % name)
+
+
+def numpy_type(typeName):
+    if not isinstance(typeName, str):
+        return object
+    return numpy.dtype(NUMPY_TYPES.get(typeName, object))
+
+
+def column_dtype(column, converters):
+    if converters is not None and converters.uses_default(column.typeId) and column.typeId in CONVERTED_NUMPY_TYPES:
+        return numpy.dtype(CONVERTED_NUMPY_TYPES[column.typeId])
+    return numpy_type(column.type)
+
+
+class ColumnBuilder(object):
+    """
+    A growable typed array for one result column, filled a page at a time.
+    NULLs in numeric and boolean columns are tracked in a parallel mask;
+    object columns simply hold None.
+    """
+
+    def __init__(self, dtype, capacity):
+        self.dtype = numpy.dtype(dtype)
+        self.data = numpy.empty(capacity, self.dtype)
+        self.mask = None
+        self.size = 0
+
+    def _reserve(self, size):
+        capacity = len(self.data)
+        if size <= capacity:
+            return
+        capacity = max(size, int(capacity * GROWTH))
+        self.data.resize(capacity, refcheck=False)
+        if self.mask is not None:
+            self.mask.resize(capacity, refcheck=False)
+
+    def extend(self, values):
+        count = len(values)
+        start, end = self.size, self.size + count
+        self._reserve(end)
+        if self.dtype.hasobject:
+            self.data[start:end] = values
+        elif None in values:
+            if self.mask is None:
+                self.mask = numpy.zeros(len(self.data), bool)
+            nulls = [value is None for value in values]
+            self.mask[start:end] = nulls
+            self.data[start:end] = [0 if isnull else value for value, isnull in zip(values, nulls)]
+        else:
+            self.data[start:end] = values
+        self.size = end
+
+    def finish(self):
+        """
+        Trim the array to the rows actually read and return it, as a masked
+        array if any NULLs were seen.
+        """
+        self.data.resize(self.size, refcheck=False)
+        if self.mask is None:
+            return self.data
+        self.mask.resize(self.size, refcheck=False)
+        if not self.mask.any():
+            return self.data
+        return numpy.ma.MaskedArray(self.data, mask=self.mask)
+
+
+def fetch_numpy(cursor):
+    """
+    Read the rest of the cursor's result set into one typed NumPy array per
+    column, keyed by column name. Arrays are preallocated from the page size
+    and filled as each FetchResults page arrives, so no intermediate list of
+    rows is built.
+    """
+    _require(numpy, 'numpy')
+    schema = cursor.getColumnDescriptors() or ()
+    builders = [ColumnBuilder(column_dtype(col, cursor.converters), cursor.arraysize) for col in schema]
+    for columns in cursor._iter_column_pages():
+        for builder, values in zip(builders, columns):
+            builder.extend(values)
+    return OrderedDict((col.name, builder.finish()) for col, builder in zip(schema, builders))
+
+
+def _to_series_data(array):
+    if not isinstance(array, numpy.ma.MaskedArray):
+        return array
+    if array.dtype.kind in 'iu' and hasattr(pandas, 'arrays'):
+        return pandas.arrays.IntegerArray(array.data, array.mask)
+    if array.dtype.kind == 'f':
+        return array.filled(numpy.nan)
+    if array.dtype.kind == 'M':
+        return array.filled(numpy.datetime64('NaT'))
+    # filled(None) would use the dtype's default fill value ('?' for object).
+    out = array.data.astype(object)
+    out[numpy.ma.getmaskarray(array)] = None
+    return out
+
+
+def fetch_dataframe(cursor):
+    """
+    Read the rest of the result set into a pandas DataFrame built directly
+    from the per-column arrays of fetch_numpy(). Integer columns with NULLs
+    use pandas' nullable integer arrays where available.
+    """
+    _require(pandas, 'pandas')
+    arrays = fetch_numpy(cursor)
+    return pandas.DataFrame(OrderedDict((name, _to_series_data(array)) for name, array in arrays.iteritems()),
+                            columns=list(arrays))
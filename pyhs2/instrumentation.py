@@ -0,0 +1,296 @@
+"""
+Per-RPC instrumentation. Pass an Observer to Connection(observer=...) and
+every TCLIService call made through the connection reports its wall time
+and the bytes it wrote and read on the socket (SASL framing included),
+and cursors report the rows of each page they decode and the time it took:
+
+    metrics = Metrics()
+    conn = pyhs2.connect(host, authMechanism='NOSASL', observer=metrics)
+    ...
+    metrics.snapshot()['rpc']['FetchResults']['seconds']['p99']
+
+Metrics keeps in-process histograms and forwards every event to its
+exporters, which are Observers too: StatsdExporter takes any client with
+statsd's timing()/incr() methods and PrometheusExporter registers metrics
+with prometheus_client, imported only if that exporter is used.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from TCLIService import TCLIService
+from sockets import TunedSocket
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+# The TCLIService calls an InstrumentedClient reports.
+RPC_NAMES = frozenset(name for name in dir(TCLIService.Iface) if not name.startswith('_'))
+
+
+class Observer(object):
+    """
+    Receives instrumentation events; the methods do nothing by default.
+    They are called on the thread making the call, so they should be quick.
+    """
+
+    def rpc(self, method, seconds, bytesSent, bytesReceived, error=None):
+        """
+        A TCLIService call (method is its name, e.g. 'FetchResults')
+        returned, or raised error.
+        """
+
+    def decoded(self, rows, seconds):
+        """
+        A cursor turned a FetchResults page of rows rows into its row
+        buffer. For column-based pages rows are assembled lazily as they
+        are read, so seconds covers the column decoding only.
+        """
+
+
+class Histogram(object):
+    """
+    Counts of observations per bucket, each bucket holding the values up
+    to its upper bound, plus a final unbounded bucket.
+    """
+    # Seconds, from a loopback round trip to a long query.
+    LATENCY_BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+                      30.0, 60.0, 300.0)
+
+    def __init__(self, bounds=LATENCY_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """
+        Upper bound of the bucket holding the q-quantile (the largest value
+        seen for the unbounded bucket), or None before any observation.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': zip(self.bounds + (float('inf'),), self.counts),
+        }
+
+
+class _RpcStats(object):
+
+    def __init__(self):
+        self.seconds = Histogram()
+        self.errors = 0
+        self.bytesSent = 0
+        self.bytesReceived = 0
+
+    def snapshot(self):
+        return {
+            'seconds': self.seconds.snapshot(),
+            'errors': self.errors,
+            'bytesSent': self.bytesSent,
+            'bytesReceived': self.bytesReceived,
+        }
+
+
+class Metrics(Observer):
+    """
+    In-process latency histograms and byte counters per TCLIService method,
+    and a histogram of page decode times with the number of rows decoded.
+    Every event is also passed on to each of exporters.
+    """
+
+    def __init__(self, exporters=()):
+        self.exporters = list(exporters)
+        self.decodeSeconds = Histogram()
+        self.rowsDecoded = 0
+        self._rpc = {}
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+
+    def rpc(self, method, seconds, bytesSent, bytesReceived, error=None):
+        with self._lock:
+            stats = self._rpc.get(method)
+            if stats is None:
+                stats = self._rpc[method] = _RpcStats()
+            stats.seconds.observe(seconds)
+            stats.bytesSent += bytesSent
+            stats.bytesReceived += bytesReceived
+            if error is not None:
+                stats.errors += 1
+        for exporter in self.exporters:
+            exporter.rpc(method, seconds, bytesSent, bytesReceived, error)
+
+    def decoded(self, rows, seconds):
+        with self._lock:
+            self.decodeSeconds.observe(seconds)
+            self.rowsDecoded += rows
+        for exporter in self.exporters:
+            exporter.decoded(rows, seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'rpc': dict((method, stats.snapshot()) for method, stats in self._rpc.iteritems()),
+                'decode': {'seconds': self.decodeSeconds.snapshot(), 'rows': self.rowsDecoded},
+            }
+
+    def reset(self):
+        with self._lock:
+            self._rpc.clear()
+            self.decodeSeconds = Histogram(self.decodeSeconds.bounds)
+            self.rowsDecoded = 0
+
+
+class StatsdExporter(Observer):
+    """
+    Sends events through a statsd client (anything with timing(stat, ms)
+    and incr(stat, count)) as prefix.rpc.<method>.* and prefix.decode.*.
+    """
+
+    def __init__(self, client, prefix='pyhs2'):
+        self.client = client
+        self.prefix = prefix
+
+    def rpc(self, method, seconds, bytesSent, bytesReceived, error=None):
+        stat = '%s.rpc.%s' % (self.prefix, method)
+        self.client.timing(stat + '.time', seconds * 1000.0)
+        self.client.incr(stat + '.bytes_sent', bytesSent)
+        self.client.incr(stat + '.bytes_received', bytesReceived)
+        if error is not None:
+            self.client.incr(stat + '.errors', 1)
+
+    def decoded(self, rows, seconds):
+        self.client.timing(self.prefix + '.decode.time', seconds * 1000.0)
+        self.client.incr(self.prefix + '.decode.rows', rows)
+
+
+class PrometheusExporter(Observer):
+    """
+    Records events in prometheus_client metrics, labelled by method, in
+    registry (prometheus_client's default registry when None).
+    """
+
+    def __init__(self, registry=None, namespace='pyhs2'):
+        if prometheus_client is None:
+            raise ImportError('PrometheusExporter requires the prometheus_client package')
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        histogram, counter = prometheus_client.Histogram, prometheus_client.Counter
+        self.rpcSeconds = histogram('rpc_seconds', 'TCLIService call latency', ['method'],
+                                    namespace=namespace, registry=registry, buckets=Histogram.LATENCY_BOUNDS)
+        self.rpcErrors = counter('rpc_errors_total', 'TCLIService calls that raised', ['method'],
+                                 namespace=namespace, registry=registry)
+        self.bytesSent = counter('rpc_sent_bytes_total', 'Bytes written by TCLIService calls', ['method'],
+                                 namespace=namespace, registry=registry)
+        self.bytesReceived = counter('rpc_received_bytes_total', 'Bytes read by TCLIService calls', ['method'],
+                                     namespace=namespace, registry=registry)
+        self.decodeSeconds = histogram('decode_seconds', 'FetchResults page decode time',
+                                       namespace=namespace, registry=registry, buckets=Histogram.LATENCY_BOUNDS)
+        self.rowsDecoded = counter('decoded_rows_total', 'Rows decoded from FetchResults pages',
+                                   namespace=namespace, registry=registry)
+
+    def rpc(self, method, seconds, bytesSent, bytesReceived, error=None):
+        self.rpcSeconds.labels(method).observe(seconds)
+        self.bytesSent.labels(method).inc(bytesSent)
+        self.bytesReceived.labels(method).inc(bytesReceived)
+        if error is not None:
+            self.rpcErrors.labels(method).inc()
+
+    def decoded(self, rows, seconds):
+        self.decodeSeconds.observe(seconds)
+        self.rowsDecoded.inc(rows)
+
+
+class CountingSocket(TunedSocket):
+    """
+    A TunedSocket counting the bytes read and written, so the counts
+    include whatever the transports above it (buffering, SASL) add.
+    """
+    bytesRead = 0
+    bytesWritten = 0
+
+    def read(self, sz):
+        buff = TunedSocket.read(self, sz)
+        self.bytesRead += len(buff)
+        return buff
+
+    def recv_into(self, buff, nbytes):
+        received = TunedSocket.recv_into(self, buff, nbytes)
+        self.bytesRead += received
+        return received
+
+    def write(self, buff):
+        TunedSocket.write(self, buff)
+        self.bytesWritten += len(buff)
+
+
+class InstrumentedClient(object):
+    """
+    Wraps a TCLIService.Client, reporting each call to observer with the
+    bytes moved on socket (a CountingSocket, or None to report 0 bytes).
+    Other attributes are the wrapped client's.
+    """
+
+    def __init__(self, client, observer, socket=None):
+        self.client = client
+        self.observer = observer
+        self.socket = socket
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if name not in RPC_NAMES:
+            return attr
+        call = self._instrument(name, attr)
+        # Later lookups find the wrapper without going through __getattr__.
+        setattr(self, name, call)
+        return call
+
+    def _instrument(self, name, method):
+        observer = self.observer
+
+        def call(req):
+            socket = self.socket
+            if socket is not None:
+                written, read = socket.bytesWritten, socket.bytesRead
+            error = None
+            start = time.time()
+            try:
+                return method(req)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                seconds = time.time() - start
+                if socket is None:
+                    observer.rpc(name, seconds, 0, 0, error)
+                else:
+                    observer.rpc(name, seconds, socket.bytesWritten - written, socket.bytesRead - read, error)
+        call.__name__ = name
+        return call
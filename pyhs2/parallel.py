@@ -0,0 +1,186 @@
+import sys
+import threading
+from Queue import Queue, Empty, Full
+
+from thrift.Thrift import TException
+
+# How often blocked workers check whether the consumer has gone away.
+_CHECK_INTERVAL = 0.1
+
+# Errors that leave a session unusable and are worth a retry on a new one.
+RETRYABLE = (TException, EnvironmentError)
+
+_PAGE, _DONE, _ERROR = range(3)
+
+
+class _Stopped(Exception):
+    pass
+
+
+class _Shard(object):
+
+    def __init__(self, index, value, hql):
+        self.index = index
+        self.value = value
+        self.hql = hql
+        self.attempts = 0
+        # Set once a page has been handed to the consumer; after that a
+        # retry would deliver rows twice.
+        self.started = False
+
+
+class _ShardRunner(object):
+    """
+    Runs shards on a fixed number of worker threads, each owning one
+    connection, and passes their pages to the consumer through bounded
+    queues.
+    """
+
+    def __init__(self, connFactory, shards, workers, ordered, maxPages, retries):
+        self.connFactory = connFactory
+        self.shards = shards
+        self.ordered = ordered
+        self.retries = retries
+        self.stopped = threading.Event()
+        self._next = iter(shards)
+        self._lock = threading.Lock()
+        if ordered:
+            self.queues = [Queue(maxPages) for _ in shards]
+        else:
+            self.queues = [Queue(maxPages)] * len(shards)
+        self.threads = [threading.Thread(target=self._work, name='pyhs2-shard-%d' % i)
+                        for i in xrange(min(workers, len(shards)))]
+        for thread in self.threads:
+            thread.daemon = True
+
+    def _put(self, shard, item):
+        queue = self.queues[shard.index]
+        while True:
+            if self.stopped.is_set():
+                raise _Stopped()
+            try:
+                queue.put((shard.index,) + item, timeout=_CHECK_INTERVAL)
+                return
+            except Full:
+                pass
+
+    def _take(self):
+        with self._lock:
+            return next(self._next, None)
+
+    def _close(self, conn):
+        if conn is None:
+            return
+        try:
+            conn.close()
+        except RETRYABLE:
+            pass
+
+    def _run(self, conn, shard):
+        with conn.cursor() as cursor:
+            cursor.execute(shard.hql)
+            while True:
+                rows = cursor.fetchmany(cursor.arraysize)
+                if not rows:
+                    break
+                self._put(shard, (_PAGE, rows))
+                shard.started = True
+
+    def _work(self):
+        conn = None
+        try:
+            shard = self._take()
+            while shard is not None:
+                try:
+                    if conn is None:
+                        conn = self.connFactory()
+                    self._run(conn, shard)
+                except RETRYABLE:
+                    self._close(conn)
+                    conn = None
+                    shard.attempts += 1
+                    if shard.started or shard.attempts > self.retries:
+                        raise
+                    continue
+                self._put(shard, (_DONE, None))
+                shard = self._take()
+        except _Stopped:
+            pass
+        except Exception:
+            try:
+                self._put(shard, (_ERROR, sys.exc_info()))
+            except _Stopped:
+                pass
+        finally:
+            self._close(conn)
+
+    def _raise(self, excInfo):
+        raise excInfo[0], excInfo[1], excInfo[2]
+
+    def _read_ordered(self):
+        for queue in self.queues:
+            while True:
+                _, kind, payload = queue.get()
+                if kind == _DONE:
+                    break
+                if kind == _ERROR:
+                    self._raise(payload)
+                yield payload
+
+    def _read_unordered(self):
+        queue = self.queues[0] if self.queues else None
+        remaining = len(self.shards)
+        while remaining:
+            _, kind, payload = queue.get()
+            if kind == _DONE:
+                remaining -= 1
+            elif kind == _ERROR:
+                self._raise(payload)
+            else:
+                yield payload
+
+    def pages(self):
+        for thread in self.threads:
+            thread.start()
+        try:
+            for page in (self._read_ordered() if self.ordered else self._read_unordered()):
+                yield page
+            # Every shard is done; let the workers close their connections.
+            for thread in self.threads:
+                thread.join()
+        finally:
+            # Release workers blocked on a full queue, e.g. when the consumer
+            # stops early or a shard has failed.
+            self.stopped.set()
+            for queue in set(self.queues):
+                try:
+                    while True:
+                        queue.get_nowait()
+                except Empty:
+                    pass
+
+    def rows(self):
+        for page in self.pages():
+            for row in page:
+                yield row
+
+
+def execute_sharded(conn_factory, template, shard_values, workers=4, ordered=True, maxPages=2, retries=2):
+    """
+    Run template % value for every shard value on up to workers threads,
+    each with its own connection from conn_factory, and iterate over the
+    combined rows.
+
+    With ordered=True rows come back shard by shard in the order of
+    shard_values; otherwise pages are passed on as soon as any shard
+    returns them. At most maxPages fetched pages are buffered per shard
+    (in total when unordered), after which workers wait for the consumer.
+
+    A shard failing with a transport error is retried up to retries times
+    on a new connection, unless some of its rows have already been
+    returned. Any other error stops every shard and is raised here.
+    """
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+    shards = [_Shard(index, value, template % (value,)) for index, value in enumerate(shard_values)]
+    return _ShardRunner(conn_factory, shards, workers, ordered, maxPages, retries).rows()
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from thrift.Thrift import TException
+
+from connections import Connection
+from error import Pyhs2Exception
+
+
+class PooledConnection(object):
+    """
+    A connection checked out of a ConnectionPool. Cursors created from it
+    send the checkout's configuration overlay with every statement, so the
+    underlying session's own configuration is never changed. close() (or
+    leaving the with block) returns the session to the pool; closing it
+    again does nothing, and each checkout gets a new PooledConnection, so a
+    stale one cannot release the session from under its next user.
+    """
+
+    def __init__(self, pool, connection, configuration, createdAt=None):
+        self.pool = pool
+        self.connection = connection
+        self.configuration = configuration or {}
+        self.createdAt = createdAt
+        self.lastUsed = None
+        self.released = False
+
+    @property
+    def database(self):
+        return self.connection.database
+
+    def cursor(self):
+        return self.connection.cursor(confOverlay=dict(self.configuration))
+
+    def close(self):
+        self.pool.release(self)
+
+    def discard(self):
+        """
+        Return the connection to the pool as broken, closing its session.
+        """
+        self.pool.release(self, broken=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, _exc_value, _traceback):
+        self.pool.release(self, broken=exc_type is not None and issubclass(exc_type, (TException, EnvironmentError)))
+
+
+class ConnectionPool(object):
+    """
+    A thread-safe pool of open HiveServer2 sessions, so the socket, SASL
+    negotiation and OpenSession cost is paid once per session rather than
+    once per request.
+
+    Connections idle for more than idleTimeout seconds or older than
+    maxLifetime seconds are closed instead of reused, and every checkout is
+    preceded by a GetInfo liveness check. Remaining keyword arguments are
+    passed to Connection.
+    """
+
+    def __init__(self, minSize=0, maxSize=10, idleTimeout=600, maxLifetime=3600, timeout=None, **connectArgs):
+        if minSize > maxSize:
+            raise ValueError('minSize cannot exceed maxSize')
+        self.minSize = minSize
+        self.maxSize = maxSize
+        self.idleTimeout = idleTimeout
+        self.maxLifetime = maxLifetime
+        self.timeout = timeout
+        self.connectArgs = connectArgs
+        self.defaultDatabase = connectArgs.get('database')
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Condition()
+        for _ in xrange(minSize):
+            self._size += 1
+            conn = self._create()
+            conn.lastUsed = time.time()
+            self._idle.append(conn)
+
+    def _create(self):
+        """
+        Open a connection for a slot already counted in _size, giving the
+        slot back if that fails.
+        """
+        try:
+            conn = PooledConnection(self, Connection(**self.connectArgs), None)
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        conn.createdAt = time.time()
+        return conn
+
+    def _expired(self, conn, now):
+        if self.maxLifetime is not None and now - conn.createdAt > self.maxLifetime:
+            return True
+        return self.idleTimeout is not None and now - conn.lastUsed > self.idleTimeout
+
+    def _destroy(self, conn):
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+        try:
+            conn.connection.close()
+        except (TException, EnvironmentError):
+            pass
+
+    def _take(self):
+        """
+        Pop an idle connection, reserve room for a new one (returns None,
+        the slot already counted in _size) or wait for one to be released.
+        """
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise Pyhs2Exception(None, 'Connection pool is closed')
+                if self._idle:
+                    # Most recently used first, so surplus connections age out.
+                    return self._idle.pop()
+                if self._size < self.maxSize:
+                    self._size += 1
+                    return None
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise Pyhs2Exception(None, 'Timed out waiting for a pooled connection')
+                self._lock.wait(remaining)
+
+    def acquire(self, database=None, configuration=None):
+        """
+        Check out a connection using database (the pool's default database if
+        None) and sending configuration as an overlay with every statement.
+        """
+        while True:
+            conn = self._take()
+            if conn is None:
+                conn = self._create()
+            elif self._expired(conn, time.time()) or not conn.connection.ping():
+                self._destroy(conn)
+                continue
+            break
+        conn = PooledConnection(self, conn.connection, configuration, conn.createdAt)
+        try:
+            database = database or self.defaultDatabase
+            if database is None and conn.database is not None:
+                # A previous checkout switched databases; undo it.
+                database = 'default'
+            if database is not None and conn.database != database:
+                conn.connection.use(database)
+        except Exception:
+            self._destroy(conn)
+            raise
+        return conn
+
+    def release(self, conn, broken=False):
+        """
+        Return a checked out connection to the pool, or close it if broken.
+        Releasing it again does nothing.
+        """
+        with self._lock:
+            if conn.released:
+                return
+            conn.released = True
+        if broken or self._closed:
+            self._destroy(conn)
+            return
+        conn.lastUsed = time.time()
+        conn.configuration = {}
+        with self._lock:
+            self._idle.append(conn)
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self, database=None, configuration=None):
+        conn = self.acquire(database, configuration)
+        with conn:
+            yield conn
+
+    def prune(self):
+        """
+        Close idle connections past their idle timeout or lifetime, keeping at
+        least minSize connections open.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [conn for conn in self._idle if self._expired(conn, now)]
+            expired = expired[:max(0, self._size - self.minSize)]
+            for conn in expired:
+                self._idle.remove(conn)
+        for conn in expired:
+            self._destroy(conn)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for conn in idle:
+            self._destroy(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        self.close()
@@ -0,0 +1,79 @@
+import sys
+import threading
+from Queue import Queue, Empty, Full
+
+# How often a blocked fetch thread checks whether it has been stopped.
+_CHECK_INTERVAL = 0.1
+
+_PAGE, _DONE, _ERROR = range(3)
+
+
+class PagePrefetcher(object):
+    """
+    Iterates over pages pulled from another iterator on a background thread,
+    keeping up to depth pages fetched ahead of the consumer so the next
+    FetchResults call overlaps with decoding the current page.
+
+    Each page is pulled while holding lock, so other calls on the same
+    client can be serialized with the fetches by taking it too.
+    """
+
+    def __init__(self, pages, depth, lock):
+        self._pages = pages
+        self._lock = lock
+        self._queue = Queue(depth)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, name='pyhs2-prefetch')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=_CHECK_INTERVAL)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                with self._lock:
+                    page = next(self._pages, None)
+                if page is None:
+                    self._put((_DONE, None))
+                    return
+                if not self._put((_PAGE, page)):
+                    return
+        except Exception:
+            self._put((_ERROR, sys.exc_info()))
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._finished:
+            raise StopIteration
+        kind, payload = self._queue.get()
+        if kind == _PAGE:
+            return payload
+        self._finished = True
+        if kind == _ERROR:
+            raise payload[0], payload[1], payload[2]
+        raise StopIteration
+
+    def close(self):
+        """
+        Stop fetching ahead and wait for a request in flight to complete, so
+        the client is free for the next call.
+        """
+        self._finished = True
+        self._stopped.set()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+        self._thread.join()
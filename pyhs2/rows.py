@@ -0,0 +1,103 @@
+import keyword
+import re
+from itertools import izip
+
+# A row factory is called once per result set with the column names and
+# returns the function that turns a tuple of column values into a row.
+# tuple_rows and list_rows are recognized by the decoders, which then build
+# rows of that type directly instead of calling the function per row.
+
+
+def tuple_rows(names):
+    return tuple
+
+
+def list_rows(names):
+    return list
+
+
+def dict_rows(names):
+    """
+    Rows as dicts keyed by column name. Convenient, but the largest and
+    slowest representation.
+    """
+    names = tuple(names)
+
+    def make(values):
+        return dict(izip(names, values))
+    return make
+
+
+def named_rows(names):
+    """
+    Rows as instances of a __slots__ class generated for the result
+    schema, readable by attribute (row.id) and by index (row[0]).
+    """
+    return named_row_class(names)._make
+
+
+def field_names(names):
+    """
+    Turn column names, which HiveServer2 may qualify as table.column, into
+    unique Python identifiers.
+    """
+    fields = []
+    for index, name in enumerate(names):
+        field = re.sub(r'\W', '_', name.rsplit('.', 1)[-1])
+        if not field or field[0].isdigit() or field.startswith('_') or keyword.iskeyword(field):
+            field = 'f%d_%s' % (index, field)
+        while field in fields:
+            field = '%s_%d' % (field, index)
+        fields.append(field)
+    return tuple(fields)
+
+
+class NamedRow(object):
+    """
+    Base class of the generated row classes.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    @classmethod
+    def _make(cls, values):
+        return cls(*values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        return getattr(self, self._fields[index])
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __iter__(self):
+        for field in self._fields:
+            yield getattr(self, field)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return 'Row(%s)' % ', '.join('%s=%r' % (field, value) for field, value in zip(self._fields, self))
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+
+def named_row_class(names):
+    fields = field_names(names)
+    if fields:
+        source = 'def __init__(self, %s):\n    %s\n' % (
+            ', '.join(fields), '\n    '.join('self.%s = %s' % (field, field) for field in fields))
+    else:
+        source = 'def __init__(self):\n    pass\n'
+    namespace = {}
+    exec source in namespace
+    return type('Row', (NamedRow,), {'__slots__': fields, '_fields': fields, '__init__': namespace['__init__']})
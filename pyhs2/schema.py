@@ -0,0 +1,72 @@
+from collections import namedtuple
+
+from TCLIService.ttypes import TTypeId
+
+# One result set column. type is the Hive type name for primitive types and
+# the type entry struct for complex ones (as returned by get_type()); typeId
+# is the TTypeId of the column and qualifiers holds e.g. the precision and
+# scale of a DECIMAL or the length of a VARCHAR. HiveServer2 does not report
+# nullability, and every Hive column may hold NULL.
+ColumnDescriptor = namedtuple('ColumnDescriptor', ['name', 'type', 'typeId', 'qualifiers', 'nullable', 'comment'])
+
+# TTypeId of each complex type entry slot.
+_ENTRY_TYPES = (
+    ('mapEntry', TTypeId.MAP_TYPE),
+    ('unionEntry', TTypeId.UNION_TYPE),
+    ('arrayEntry', TTypeId.ARRAY_TYPE),
+    ('structEntry', TTypeId.STRUCT_TYPE),
+    ('userDefinedTypeEntry', TTypeId.USER_DEFINED_TYPE),
+)
+
+
+def get_type(typeDesc):
+    for ttype in typeDesc.types:
+        if ttype.primitiveEntry is not None:
+            return TTypeId._VALUES_TO_NAMES[ttype.primitiveEntry.type]
+        elif ttype.mapEntry is not None:
+            return ttype.mapEntry
+        elif ttype.unionEntry is not None:
+            return ttype.unionEntry
+        elif ttype.arrayEntry is not None:
+            return ttype.arrayEntry
+        elif ttype.structEntry is not None:
+            return ttype.structEntry
+        elif ttype.userDefinedTypeEntry is not None:
+            return ttype.userDefinedTypeEntry
+
+
+def _type_id(typeDesc):
+    for ttype in typeDesc.types:
+        if ttype.primitiveEntry is not None:
+            return ttype.primitiveEntry.type
+        for slot, typeId in _ENTRY_TYPES:
+            if getattr(ttype, slot) is not None:
+                return typeId
+    return None
+
+
+def _qualifiers(typeDesc):
+    for ttype in typeDesc.types:
+        entry = ttype.primitiveEntry
+        if entry is not None and entry.typeQualifiers is not None and entry.typeQualifiers.qualifiers:
+            return dict((name, value.i32Value if value.i32Value is not None else value.stringValue)
+                        for name, value in entry.typeQualifiers.qualifiers.iteritems())
+        return {}
+    return {}
+
+
+def describe_columns(tableSchema):
+    """
+    Turn a GetResultSetMetadata TTableSchema into a tuple of
+    ColumnDescriptors, parsing each type description once.
+    """
+    return tuple(ColumnDescriptor(c.columnName, get_type(c.typeDesc), _type_id(c.typeDesc),
+                                  _qualifiers(c.typeDesc), True, c.comment)
+                 for c in tableSchema.columns)
+
+
+def schema_dicts(columns):
+    """
+    The column dicts getSchema() has always returned.
+    """
+    return [{'type': col.type, 'columnName': col.name, 'comment': col.comment} for col in columns]
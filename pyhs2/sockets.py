@@ -0,0 +1,91 @@
+"""
+TCP options for the sockets connections open. socketOptions arguments are
+lists of (level, option, value) tuples for socket.setsockopt(), applied
+before connecting so that buffer sizes count in the window negotiation;
+tcp_options() builds one from the usual settings.
+"""
+import socket
+
+from thrift.transport.TSocket import TSocket
+from thrift.transport.TTransport import TTransportException
+
+
+def tcp_options(nodelay=True, keepalive=60, keepaliveInterval=10, keepaliveCount=6, recvBuffer=None,
+                sendBuffer=None):
+    """
+    Socket options for:
+
+    nodelay: disable Nagle's algorithm, so small SASL and Thrift messages
+        are not held back waiting for the ACK of the previous one.
+    keepalive: seconds a connection may idle before keepalive probes are
+        sent (None to leave keepalive off), so NAT gateways and load
+        balancers do not drop connections waiting on a long statement.
+        keepaliveInterval and keepaliveCount space and bound the probes;
+        platforms without per-socket settings use their system ones.
+    recvBuffer, sendBuffer: SO_RCVBUF and SO_SNDBUF in bytes, None for the
+        system default; a large receive buffer helps fetching big pages
+        over high-latency links.
+    """
+    options = []
+    if nodelay:
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if keepalive is not None:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # TCP_KEEPIDLE is Linux's name, TCP_KEEPALIVE macOS's.
+        idle = getattr(socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None))
+        for option, value in [(idle, keepalive), (getattr(socket, 'TCP_KEEPINTVL', None), keepaliveInterval),
+                              (getattr(socket, 'TCP_KEEPCNT', None), keepaliveCount)]:
+            if option is not None and value is not None:
+                options.append((socket.IPPROTO_TCP, option, value))
+    if recvBuffer is not None:
+        options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, recvBuffer))
+    if sendBuffer is not None:
+        options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, sendBuffer))
+    return options
+
+# Used when a connection is given socketOptions=None.
+DEFAULT_SOCKET_OPTIONS = tcp_options()
+
+
+def apply_socket_options(sock, options):
+    for level, option, value in options:
+        sock.setsockopt(level, option, value)
+
+
+class TunedSocket(TSocket):
+    """
+    A TSocket setting socketOptions (DEFAULT_SOCKET_OPTIONS when None) on
+    its socket before connecting.
+    """
+
+    def __init__(self, host='localhost', port=10000, socketOptions=None):
+        TSocket.__init__(self, host, port)
+        self.socketOptions = DEFAULT_SOCKET_OPTIONS if socketOptions is None else list(socketOptions)
+
+    def open(self):
+        error = None
+        try:
+            addresses = self._resolveAddr()
+        except socket.error as e:
+            addresses, error = [], e
+        for family, socktype, _, _, address in addresses:
+            handle = socket.socket(family, socktype)
+            try:
+                apply_socket_options(handle, self.socketOptions)
+                handle.settimeout(self._timeout)
+                handle.connect(address)
+            except socket.error as e:
+                handle.close()
+                error = e
+                continue
+            self.handle = handle
+            return
+        raise TTransportException(type=TTransportException.NOT_OPEN,
+                                  message='Could not connect to %s:%d (%s)' % (self.host, self.port, error))
+
+    def recv_into(self, buff, nbytes):
+        """
+        Receive up to nbytes into buff, returning how many arrived; used by
+        TSaslClientTransport to read frames without copying.
+        """
+        return self.handle.recv_into(buff, nbytes)
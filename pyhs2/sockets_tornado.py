@@ -0,0 +1,58 @@
+"""
+The Tornado counterpart of sockets.TunedSocket.
+"""
+import socket
+
+from thrift.TTornado import TTornadoStreamTransport
+from thrift.transport.TTransport import TTransportException
+from tornado import gen, ioloop, iostream
+
+from sockets import DEFAULT_SOCKET_OPTIONS, apply_socket_options
+
+
+class CountingIOStream(iostream.IOStream):
+    """
+    An IOStream counting the bytes read and written, as
+    instrumentation.CountingSocket does for the sync transports.
+    """
+    bytesRead = 0
+    bytesWritten = 0
+
+    def read_bytes(self, num_bytes, *args, **kwargs):
+        # The transports only ask for exact sizes, so a read is counted
+        # whole when it is requested.
+        self.bytesRead += num_bytes
+        return iostream.IOStream.read_bytes(self, num_bytes, *args, **kwargs)
+
+    def write(self, data, *args, **kwargs):
+        self.bytesWritten += len(data)
+        return iostream.IOStream.write(self, data, *args, **kwargs)
+
+
+class TunedStreamTransport(TTornadoStreamTransport):
+    """
+    A TTornadoStreamTransport setting socketOptions (DEFAULT_SOCKET_OPTIONS
+    when None) on its socket before connecting. With counting=True its
+    stream is a CountingIOStream.
+    """
+
+    def __init__(self, host, port, socketOptions=None, counting=False):
+        TTornadoStreamTransport.__init__(self, host, port)
+        self.socketOptions = DEFAULT_SOCKET_OPTIONS if socketOptions is None else list(socketOptions)
+        self.counting = counting
+
+    @gen.coroutine
+    def open(self, timeout=None):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, 0)
+        apply_socket_options(sock, self.socketOptions)
+        self.stream = CountingIOStream(sock) if self.counting else iostream.IOStream(sock)
+        try:
+            connect = self.stream.connect((self.host, self.port))
+            if timeout is not None:
+                yield self.with_timeout(timeout, connect)
+            else:
+                yield connect
+        except (socket.error, IOError, ioloop.TimeoutError) as e:
+            raise TTransportException(type=TTransportException.NOT_OPEN,
+                                      message='could not connect to %s:%s (%s)' % (self.host, self.port, e))
+        raise gen.Return(self)
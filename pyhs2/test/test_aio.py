@@ -0,0 +1,147 @@
+import unittest
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol, TBinaryProtocolFactory
+from thrift.transport.TTransport import TMemoryBuffer
+from tornado import gen
+from tornado.concurrent import Future
+from tornado.testing import AsyncTestCase, gen_test
+
+from pyhs2.TCLIService import TCLIService
+from pyhs2.TCLIService.ttypes import TOpenSessionReq, TOpenSessionResp, TSessionHandle, THandleIdentifier, TStatus, TStatusCode, \
+    TExecuteStatementResp, TOperationHandle, TOperationType, TFetchResultsResp, TRowSet, TColumn, TI32Column, \
+    TCloseOperationResp
+from pyhs2.aio.client import AsyncClient
+from pyhs2.aio.connection import AsyncConnection
+from pyhs2.aio.cursor import AsyncCursor
+from pyhs2.aio.transport import MessageScanner
+from pyhs2.testing import FakeHiveServer2, Table
+
+
+class Handler(object):
+
+    def __init__(self):
+        self.pages = [[1, 2], [3]]
+
+    def status(self):
+        return TStatus(statusCode=TStatusCode.SUCCESS_STATUS)
+
+    def OpenSession(self, req):
+        handle = TSessionHandle(sessionId=THandleIdentifier(guid='g' * 16, secret='s' * 16))
+        return TOpenSessionResp(status=self.status(), serverProtocolVersion=req.client_protocol,
+                                sessionHandle=handle)
+
+    def ExecuteStatement(self, req):
+        handle = TOperationHandle(operationId=THandleIdentifier(guid='o' * 16, secret='s' * 16),
+                                  operationType=TOperationType.EXECUTE_STATEMENT, hasResultSet=True)
+        return TExecuteStatementResp(status=self.status(), operationHandle=handle)
+
+    def FetchResults(self, req):
+        values = self.pages.pop(0) if self.pages else []
+        columns = [TColumn(i32Val=TI32Column(values=values, nulls=''))]
+        return TFetchResultsResp(status=self.status(), hasMoreRows=bool(self.pages),
+                                 results=TRowSet(startRowOffset=0, rows=[], columns=columns))
+
+    def CloseOperation(self, req):
+        return TCloseOperationResp(status=self.status())
+
+
+class LoopbackTransport(object):
+    """Hands each written frame straight to a TCLIService.Processor."""
+
+    def __init__(self, handler):
+        self.processor = TCLIService.Processor(handler)
+        self.replies = []
+
+    def write_frame(self, payload):
+        out = TMemoryBuffer()
+        self.processor.process(TBinaryProtocol(TMemoryBuffer(payload)), TBinaryProtocol(out))
+        self.replies.append(out.getvalue())
+        future = Future()
+        future.set_result(None)
+        return future
+
+    @gen.coroutine
+    def read_frame(self):
+        raise gen.Return(self.replies.pop(0))
+
+
+class TestAsyncClient(AsyncTestCase):
+
+    def setUp(self):
+        super(TestAsyncClient, self).setUp()
+        self.client = AsyncClient(LoopbackTransport(Handler()), TBinaryProtocolFactory())
+
+    @gen_test
+    def test_open_session_through_generated_client(self):
+        res = yield self.client.OpenSession(TOpenSessionReq())
+        self.assertEqual(res.sessionHandle.sessionId.guid, 'g' * 16)
+        self.assertEqual(res.serverProtocolVersion, TOpenSessionReq().client_protocol)
+
+    def test_unknown_method(self):
+        with self.assertRaises(AttributeError):
+            self.client.NoSuchCall
+
+    @gen_test
+    def test_cursor_execute_and_fetch(self):
+        cursor = AsyncCursor(self.client, TSessionHandle(sessionId=THandleIdentifier(guid='g', secret='s')))
+        yield cursor.execute("SELECT x FROM t")
+        first = yield cursor.fetchone()
+        self.assertEqual(first, [1])
+        rest = yield cursor.fetch()
+        self.assertEqual(rest, [[2], [3]])
+        self.assertEqual(cursor.roundTripsSaved, 1)
+        yield cursor.close()
+
+
+def reply(name, result):
+    out = TMemoryBuffer()
+    protocol = TBinaryProtocol(out)
+    protocol.writeMessageBegin(name, 2, 7)
+    result.write(protocol)
+    protocol.writeMessageEnd()
+    return out.getvalue()
+
+
+class TestMessageScanner(unittest.TestCase):
+
+    def setUp(self):
+        table = Table.synthetic(width=6, rows=20, nullEvery=3)
+        fetch = TCLIService.FetchResults_result(success=TFetchResultsResp(
+            status=TStatus(statusCode=TStatusCode.SUCCESS_STATUS), hasMoreRows=False,
+            results=table.columnar_page(0, 20)))
+        session = TCLIService.OpenSession_result(success=TOpenSessionResp(
+            status=TStatus(statusCode=TStatusCode.SUCCESS_STATUS), serverProtocolVersion=0,
+            configuration={'a': '1', 'bb': '22'}))
+        self.messages = [reply('FetchResults', fetch), reply('OpenSession', session)]
+
+    def test_whole_message(self):
+        for message in self.messages:
+            self.assertEqual(MessageScanner(bytearray(message + 'next')).scan(), len(message))
+
+    def test_message_arriving_byte_by_byte(self):
+        for message in self.messages:
+            scanner = MessageScanner()
+            for index, byte in enumerate(message):
+                self.assertIsNone(scanner.scan())
+                scanner.buff.extend(byte)
+            self.assertEqual(scanner.scan(), len(message))
+
+
+class TestAsyncConnectionNoSasl(AsyncTestCase):
+
+    def setUp(self):
+        super(TestAsyncConnectionNoSasl, self).setUp()
+        self.server = FakeHiveServer2()
+        self.table = self.server.add_table('t', width=4, rows=2500)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    @gen_test(timeout=10)
+    def test_fetch_unframed(self):
+        conn = AsyncConnection(self.server.host, self.server.port, authMechanism='NOSASL')
+        yield conn.open()
+        cursor = conn.cursor()
+        yield cursor.execute('SELECT * FROM t')
+        rows = yield cursor.fetch()
+        yield cursor.close()
+        yield conn.close()
+        self.assertEqual(rows, [list(row) for row in zip(*self.table.data)])
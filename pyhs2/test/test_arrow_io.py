@@ -0,0 +1,58 @@
+import mock
+import tempfile
+import unittest
+from decimal import Decimal
+from pyhs2.TCLIService.ttypes import TSessionHandle, TFetchResultsResp, TRowSet, TColumn, TI64Column, \
+    TStringColumn, TTypeId
+from pyhs2.converters import Converters
+from pyhs2.cursor import Cursor
+from pyhs2.schema import ColumnDescriptor
+from pyhs2.arrow_io import pyarrow
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrowIO(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.cursor = Cursor(self.mock_client, TSessionHandle(sessionId=2))
+        self.cursor.getColumnDescriptors = mock.MagicMock(return_value=(
+            ColumnDescriptor('id', 'BIGINT_TYPE', TTypeId.BIGINT_TYPE, {}, True, None),
+            ColumnDescriptor('name', 'STRING_TYPE', TTypeId.STRING_TYPE, {}, True, None),
+        ))
+        self.cursor.arraysize = 2
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([1, 2], ['a', 'b'], '\x00'),
+            self.create_page([3], ['c'], '\x01'),
+        ]
+
+    def create_page(self, ids, names, nulls):
+        columns = [TColumn(i64Val=TI64Column(values=ids, nulls=nulls)),
+                   TColumn(stringVal=TStringColumn(values=names, nulls=''))]
+        return TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=[], columns=columns))
+
+    def test_one_record_batch_per_page(self):
+        batches = list(self.cursor.iter_record_batches())
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[0].schema.names, ['id', 'name'])
+        self.assertEqual(batches[0].schema.types, [pyarrow.int64(), pyarrow.string()])
+        self.assertEqual(batches[1].column(0).to_pylist(), [None])
+
+    def test_write_arrow_ipc_file(self):
+        with tempfile.NamedTemporaryFile(suffix='.arrow') as sink:
+            self.assertEqual(self.cursor.write_arrow(sink.name), 3)
+            table = pyarrow.ipc.open_file(pyarrow.OSFile(sink.name)).read_all()
+        self.assertEqual(table.column('name').to_pylist(), [u'a', u'b', u'c'])
+
+    def test_decimal_without_qualifiers_is_text(self):
+        self.cursor.converters = Converters()
+        self.cursor.getColumnDescriptors.return_value = (
+            ColumnDescriptor('price', 'DECIMAL_TYPE', TTypeId.DECIMAL_TYPE, {}, True, None),
+            ColumnDescriptor('total', 'DECIMAL_TYPE', TTypeId.DECIMAL_TYPE, {'precision': 10, 'scale': 2}, True, None))
+        self.mock_client.FetchResults.side_effect = [TFetchResultsResp(hasMoreRows=False, results=TRowSet(
+            startRowOffset=0, rows=[], columns=[TColumn(stringVal=TStringColumn(values=['12.5', '3.25'], nulls='')),
+                                                TColumn(stringVal=TStringColumn(values=['1.5', '2'], nulls=''))]))]
+        batch, = self.cursor.iter_record_batches()
+        self.assertEqual(batch.schema.types, [pyarrow.string(), pyarrow.decimal128(10, 2)])
+        self.assertEqual(batch.column(0).to_pylist(), [u'12.5', u'3.25'])
+        self.assertEqual(batch.column(1).to_pylist(), [Decimal('1.50'), Decimal('2.00')])
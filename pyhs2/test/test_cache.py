@@ -0,0 +1,247 @@
+import mock
+import shutil
+import tempfile
+import unittest
+from pyhs2.TCLIService.ttypes import TSessionHandle, TFetchResultsResp, TRowSet, TRow, TColumnValue, TI32Value, \
+    TGetResultSetMetadataResp, TTableSchema, TColumnDesc, TTypeDesc, TTypeEntry, TPrimitiveTypeEntry, TTypeId, \
+    TStringValue, TGetTablesReq, TStatus, TStatusCode
+from pyhs2.cache import ResultCache, MetadataCache, normalize_hql, is_cacheable, like_pattern
+from pyhs2.connections import Connection
+from pyhs2.cursor import Cursor
+from pyhs2.rows import dict_rows, tuple_rows
+from pyhs2.schema import ColumnDescriptor
+from pyhs2.testing import FakeHiveServer2
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_normalize_hql(self):
+        self.assertEqual(normalize_hql("  SELECT *\n  FROM t\tWHERE s = 'a  b' ;"), "SELECT * FROM t WHERE s = 'a  b'")
+        self.assertTrue(is_cacheable('\nwith x as (select 1) select * from x'))
+        self.assertFalse(is_cacheable('INSERT INTO t SELECT 1'))
+
+    def test_key_includes_database_and_overlay(self):
+        key = ResultCache.key('SELECT 1', 'sales', {'a': '1', 'b': '2'})
+        self.assertEqual(key, ResultCache.key('SELECT  1;', 'sales', {'b': '2', 'a': '1'}))
+        self.assertNotEqual(key, ResultCache.key('SELECT 1', 'default', {'a': '1', 'b': '2'}))
+        self.assertNotEqual(key, ResultCache.key('SELECT 1', 'sales'))
+
+    def test_lru_eviction_by_bytes(self):
+        cache = ResultCache(maxBytes=10)
+        cache.put('a', None, ['xxxx'])
+        cache.put('b', None, ['xxxx'])
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('c', None, ['xxxx'])
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+        cache.put('d', None, ['x' * 11])
+        self.assertIsNone(cache.get('d'))
+
+    @mock.patch('pyhs2.cache.time.time')
+    def test_entries_expire(self, mock_time):
+        mock_time.return_value = 1000
+        cache = ResultCache(ttl=60)
+        cache.put('a', None, ['x'])
+        cache.put('b', None, ['x'], ttl=600)
+        mock_time.return_value = 1100
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicted_entries_spill_to_disk(self):
+        cache = ResultCache(maxBytes=4, directory=self.directory)
+        cache.put('a', [{'columnName': 'x'}], ['xxxx'])
+        cache.put('b', None, ['yyyy'])
+        entry = cache.get('a')
+        self.assertEqual((entry.schema, entry.pages), ([{'columnName': 'x'}], ['xxxx']))
+        self.assertEqual(cache.diskHits, 1)
+        self.assertEqual(ResultCache(maxBytes=4, directory=self.directory).get('b').pages, ['yyyy'])
+
+    def test_invalidate(self):
+        cache = ResultCache(maxBytes=4, directory=self.directory)
+        cache.put(ResultCache.key('SELECT 1'), None, ['xxxx'])
+        cache.put(ResultCache.key('SELECT 2'), None, ['xxxx'])
+        cache.invalidate('SELECT 1')
+        cache.invalidate('SELECT 2')
+        self.assertIsNone(cache.get(ResultCache.key('SELECT 1')))
+        self.assertIsNone(cache.get(ResultCache.key('SELECT 2')))
+
+
+class TestCursorResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        self.mock_client.GetResultSetMetadata.return_value = TGetResultSetMetadataResp(
+            status=TStatus(TStatusCode.SUCCESS_STATUS), schema=TTableSchema(columns=[
+                TColumnDesc(columnName='n', position=1, typeDesc=TTypeDesc(types=[
+                    TTypeEntry(primitiveEntry=TPrimitiveTypeEntry(type=TTypeId.INT_TYPE))]))]))
+        self.cache = ResultCache()
+
+    def create_cursor(self, database=None):
+        return Cursor(self.mock_client, TSessionHandle(sessionId=2), resultCache=self.cache, database=database)
+
+    def create_page(self, values, hasMoreRows=False):
+        rows = [TRow(colVals=[TColumnValue(i32Val=TI32Value(i))]) for i in values]
+        return TFetchResultsResp(hasMoreRows=hasMoreRows, results=TRowSet(startRowOffset=0, rows=rows))
+
+    def test_second_execute_is_served_from_cache(self):
+        self.mock_client.FetchResults.side_effect = [self.create_page([1, 2]), self.create_page([])]
+        cursor = self.create_cursor()
+        cursor.arraysize = 2
+        cursor.execute('SELECT n FROM t')
+        self.assertEqual(cursor.fetchall(), [[1], [2]])
+
+        cursor = self.create_cursor()
+        cursor.execute('SELECT n\n  FROM t;')
+        self.assertEqual(cursor.fetchall(), [[1], [2]])
+        self.assertEqual(cursor.getSchema(), [{'type': 'INT_TYPE', 'columnName': 'n', 'comment': None}])
+        self.assertEqual(self.mock_client.ExecuteStatement.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_partly_read_result_is_not_cached(self):
+        self.mock_client.FetchResults.side_effect = [self.create_page([1], hasMoreRows=True), self.create_page([2])]
+        cursor = self.create_cursor()
+        cursor.arraysize = 1
+        cursor.execute('SELECT n FROM t')
+        cursor.fetchone()
+        cursor.execute('SELECT n FROM t')
+        self.assertEqual(self.mock_client.ExecuteStatement.call_count, 2)
+
+    def test_use_changes_cache_key(self):
+        self.mock_client.FetchResults.return_value = self.create_page([1])
+        cursor = self.create_cursor(database='sales')
+        cursor.execute('SELECT n FROM t')
+        cursor.fetchall()
+        cursor.execute('USE marketing')
+        self.assertEqual(cursor.database, 'marketing')
+        cursor.execute('SELECT n FROM t')
+        self.assertEqual(self.mock_client.ExecuteStatement.call_count, 3)
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    TABLES = [[None, 'sales', 'orders', 'TABLE', ''], [None, 'sales', 'order_items', 'TABLE', ''],
+              [None, 'hr', 'people', 'TABLE', '']]
+    COLUMNS = tuple(ColumnDescriptor(name, 'STRING_TYPE', TTypeId.STRING_TYPE, {}, True, None)
+                    for name in ('TABLE_CAT', 'TABLE_SCHEM', 'TABLE_NAME', 'TABLE_TYPE', 'REMARKS'))
+
+    def test_like_pattern(self):
+        self.assertTrue(like_pattern('ord%').match('Orders'))
+        self.assertTrue(like_pattern('order_items').match('orderXitems'))
+        self.assertFalse(like_pattern('order\\_items').match('orderXitems'))
+        self.assertFalse(like_pattern('ord').match('orders'))
+
+    def test_exact_hit(self):
+        cache = MetadataCache()
+        cache.put('tables', {'schemaName': 'sales', 'tableName': '%'}, self.TABLES[:2])
+        self.assertEqual(cache.get('tables', {'schemaName': 'sales', 'tableName': '%'}), (None, self.TABLES[:2]))
+        self.assertIsNone(cache.get('tables', {'schemaName': 'hr', 'tableName': '%'}))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_narrower_pattern_filters_broader_listing(self):
+        cache = MetadataCache()
+        cache.put('tables', {}, self.TABLES, columns=self.COLUMNS)
+        self.assertEqual(cache.get('tables', {'schemaName': 'sales', 'tableName': 'order\\_%'}),
+                         (self.COLUMNS, [self.TABLES[1]]))
+        self.assertEqual(cache.get('tables', {'schemaName': 'HR'}), (self.COLUMNS, [self.TABLES[2]]))
+        self.assertIsNone(cache.get('tables', {}, extra=('VIEW',)))
+        self.assertIsNone(cache.get('columns', {}))
+
+    @mock.patch('pyhs2.cache.time.time')
+    def test_ttl_and_refresh(self, mock_time):
+        mock_time.return_value = 1000
+        cache = MetadataCache(ttl=60)
+        cache.put('tables', {}, self.TABLES)
+        cache.put('schemas', {}, [['sales', None]])
+        cache.refresh('tables')
+        self.assertIsNone(cache.get('tables', {}))
+        self.assertIsNotNone(cache.get('schemas', {}))
+        mock_time.return_value = 1100
+        self.assertIsNone(cache.get('schemas', {}))
+
+
+class TestCursorMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.mock_client.GetTables.return_value.status.errorCode = None
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        rows = [TRow(colVals=[TColumnValue(stringVal=TStringValue(s)) for s in (None, 'sales', name, 'TABLE', '')])
+                for name in ('orders', 'customers')]
+        self.mock_client.FetchResults.side_effect = lambda req: TFetchResultsResp(
+            hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=rows))
+        self.mock_client.GetResultSetMetadata.return_value = TGetResultSetMetadataResp(
+            status=TStatus(TStatusCode.SUCCESS_STATUS), schema=TTableSchema(columns=[
+                TColumnDesc(columnName=column.name, position=i, typeDesc=TTypeDesc(types=[
+                    TTypeEntry(primitiveEntry=TPrimitiveTypeEntry(type=TTypeId.STRING_TYPE))]))
+                for i, column in enumerate(TestMetadataCache.COLUMNS)]))
+        self.cursor = Cursor(self.mock_client, TSessionHandle(sessionId=2), metadataCache=MetadataCache())
+
+    def test_get_tables_is_cached(self):
+        tables = self.cursor.getTables(schemaName='sales')
+        self.assertEqual([row[2] for row in tables], ['orders', 'customers'])
+        self.mock_client.GetTables.assert_called_once_with(TGetTablesReq(TSessionHandle(sessionId=2),
+                                                                         schemaName='sales'))
+        self.assertEqual(self.cursor.getTables(schemaName='sales', tableName='cust%'), [tables[1]])
+        self.assertEqual(self.mock_client.GetTables.call_count, 1)
+        self.cursor.getTables(schemaName='sales', refresh=True)
+        self.assertEqual(self.mock_client.GetTables.call_count, 2)
+
+    def test_row_factory_applies_to_hits(self):
+        self.cursor.rowFactory = dict_rows
+        tables = self.cursor.getTables(schemaName='sales')
+        self.assertEqual([row['TABLE_NAME'] for row in tables], ['orders', 'customers'])
+        self.assertEqual(self.cursor.getTables(schemaName='sales'), tables)
+        self.assertEqual(self.mock_client.GetTables.call_count, 1)
+        # The cache is shared, so a cursor with another factory reads plain values.
+        other = Cursor(self.mock_client, TSessionHandle(sessionId=2), metadataCache=self.cursor.metadataCache)
+        other.rowFactory = tuple_rows
+        self.assertEqual(other.getTables(schemaName='sales', tableName='orders'),
+                         [(None, 'sales', 'orders', 'TABLE', '')])
+        self.assertEqual(self.mock_client.GetTables.call_count, 1)
+
+    def test_ddl_refreshes_cache(self):
+        self.cursor.getTables()
+        self.cursor.execute('CREATE TABLE sales.returns (id INT)')
+        self.cursor.getTables()
+        self.assertEqual(self.mock_client.GetTables.call_count, 2)
+
+
+class TestSessionDatabase(unittest.TestCase):
+
+    def setUp(self):
+        server = FakeHiveServer2()
+        server.add_table('t', width=2, rows=3)
+        server.start()
+        self.addCleanup(server.stop)
+        self.cache = ResultCache()
+        self.conn = Connection(host=server.host, port=server.port, authMechanism='NOSASL', resultCache=self.cache)
+        self.addCleanup(self.conn.close)
+
+    def run_statement(self, hql):
+        with self.conn.cursor() as cursor:
+            cursor.execute(hql)
+            if hql.startswith('SELECT'):
+                cursor.fetchall()
+
+    def test_use_on_one_cursor_applies_to_the_others(self):
+        self.run_statement('USE a')
+        self.run_statement('SELECT * FROM t')
+        self.run_statement('USE b')
+        self.run_statement('SELECT * FROM t')
+        self.assertEqual(self.conn.database, 'b')
+        # Same statement, other database: not answered from the cache.
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.run_statement('USE a')
+        self.run_statement('SELECT * FROM t')
+        self.assertEqual(self.cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,16 @@
 import mock
+import os
+import subprocess
+import sys
 import unittest
 from pyhs2.TCLIService.ttypes import TSessionHandle, TCloseSessionReq
 from pyhs2.connections import Connection
 
+try:
+    from tornado import gen
+except ImportError:
+    gen = None
+
 
 class TestConnection(unittest.TestCase):
 
@@ -32,3 +40,40 @@ class TestConnection(unittest.TestCase):
 
         mock_client.CloseSession.assert_called_once_with(
             TCloseSessionReq(mock_sesh_handle.sessionHandle))
+
+    def loaded_modules(self, statement, modules):
+        """Which of modules a fresh interpreter has loaded after statement."""
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        probe = "import sys; %s; sys.stdout.write(','.join(m for m in %r if sys.modules.get(m)))" % (
+            statement, tuple(modules))
+        return subprocess.check_output([sys.executable, '-c', probe], cwd=root)
+
+    def test_sync_import_does_not_load_tornado_or_sasl(self):
+        self.assertEqual(self.loaded_modules('from pyhs2.connections import Connection',
+                                             ['tornado', 'sasl', 'pyhs2.TCLIServiceTornado']), '')
+
+    def test_optional_features_load_on_first_use(self):
+        self.assertEqual(self.loaded_modules('from pyhs2.connections import Connection',
+                                             ['pyhs2.cache', 'pyhs2.converters', 'pyhs2.prefetch',
+                                              'pyhs2.instrumentation', 'uuid']), '')
+
+    @unittest.skipIf(gen is None, 'tornado is not installed')
+    def test_tornado_connection_shim_is_the_class(self):
+        from pyhs2 import connections
+        from pyhs2.connections_tornado import TornadoConnection
+
+        class Subclass(connections.TornadoConnection):
+            pass
+        self.assertIsInstance(connections.TornadoConnection, type)
+        self.assertTrue(issubclass(Subclass, TornadoConnection))
+        self.assertTrue(issubclass(Subclass, connections.TornadoConnection))
+        self.assertIsInstance(object.__new__(TornadoConnection), connections.TornadoConnection)
+        self.assertEqual(connections.TornadoConnection.AUTH_MECHANISMS, TornadoConnection.AUTH_MECHANISMS)
+        conn = connections.TornadoConnection(host='localhost', authMechanism='NOSASL')
+        self.assertIs(type(conn), TornadoConnection)
+
+    @unittest.skipIf(gen is None, 'tornado is not installed')
+    def test_tornado_import_does_not_load_sync_stack(self):
+        self.assertEqual(self.loaded_modules('from pyhs2.connections_tornado import TornadoConnection',
+                                             ['pyhs2.connections', 'pyhs2.cursor', 'pyhs2.cache',
+                                              'pyhs2.instrumentation', 'pyhs2.TCLIService.TCLIService']), '')
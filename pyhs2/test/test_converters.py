@@ -0,0 +1,77 @@
+import mock
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from pyhs2.TCLIService.ttypes import TSessionHandle, TFetchResultsResp, TRowSet, TColumn, TStringColumn, TI32Column, \
+    TTypeId, TRow, TColumnValue, TStringValue
+from pyhs2.converters import Converters, convert_columns, parse_timestamp
+from pyhs2.cursor import Cursor
+from pyhs2.schema import ColumnDescriptor
+
+
+def column(typeId, qualifiers=None):
+    return ColumnDescriptor('c', TTypeId._VALUES_TO_NAMES[typeId], typeId, qualifiers or {}, True, None)
+
+
+class TestConverters(unittest.TestCase):
+
+    def convert(self, col, values):
+        return Converters().for_columns([col])[0](values)
+
+    def test_timestamps(self):
+        self.assertEqual(parse_timestamp('2015-03-01 12:30:05.123456789'), datetime(2015, 3, 1, 12, 30, 5, 123456))
+        self.assertEqual(self.convert(column(TTypeId.TIMESTAMP_TYPE), ['2015-03-01 12:30:05.5', None]),
+                         [datetime(2015, 3, 1, 12, 30, 5, 500000), None])
+
+    def test_dates(self):
+        self.assertEqual(self.convert(column(TTypeId.DATE_TYPE), ['2015-03-01']), [date(2015, 3, 1)])
+
+    def test_decimals_use_scale(self):
+        col = column(TTypeId.DECIMAL_TYPE, {'precision': 10, 'scale': 2})
+        values = self.convert(col, ['12.5', None])
+        self.assertEqual(values, [Decimal('12.50'), None])
+        self.assertEqual(str(values[0]), '12.50')
+
+    def test_complex_types_decode_json(self):
+        self.assertEqual(self.convert(column(TTypeId.MAP_TYPE), ['{"a":[1,2]}', '{1:"x"}']),
+                         [{'a': [1, 2]}, '{1:"x"}'])
+
+    def test_registry(self):
+        converters = Converters(defaults=False)
+        self.assertIsNone(converters.for_columns([column(TTypeId.TIMESTAMP_TYPE)]))
+        converters.register(TTypeId.STRING_TYPE, lambda col: lambda values: [v.upper() for v in values])
+        funcs = converters.for_columns([column(TTypeId.INT_TYPE), column(TTypeId.STRING_TYPE)])
+        self.assertEqual(convert_columns([[1], ['a']], funcs), [[1], ['A']])
+        self.assertFalse(converters.uses_default(TTypeId.STRING_TYPE))
+        self.assertTrue(Converters().uses_default(TTypeId.TIMESTAMP_TYPE))
+
+
+class TestCursorConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.cursor = Cursor(self.mock_client, TSessionHandle(sessionId=2))
+        self.cursor.getColumnDescriptors = mock.MagicMock(return_value=(
+            ColumnDescriptor('id', 'INT_TYPE', TTypeId.INT_TYPE, {}, True, None),
+            ColumnDescriptor('ts', 'TIMESTAMP_TYPE', TTypeId.TIMESTAMP_TYPE, {}, True, None),
+        ))
+        self.cursor.converters = Converters()
+
+    def test_converts_columnar_pages(self):
+        columns = [TColumn(i32Val=TI32Column(values=[1, 2], nulls='')),
+                   TColumn(stringVal=TStringColumn(values=['2015-03-01 00:00:00', ''], nulls='\x02'))]
+        self.mock_client.FetchResults.side_effect = [
+            TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=[], columns=columns))]
+        self.assertEqual(self.cursor.fetchall(), [[1, datetime(2015, 3, 1)], [2, None]])
+
+    def test_converts_row_pages(self):
+        rows = [TRow(colVals=[TColumnValue(stringVal=TStringValue('1')),
+                              TColumnValue(stringVal=TStringValue('2015-03-01 00:00:01'))])]
+        self.mock_client.FetchResults.side_effect = [
+            TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=rows))]
+        self.assertEqual(self.cursor.fetchall(), [['1', datetime(2015, 3, 1, 0, 0, 1)]])
+        self.assertEqual(self.cursor.getColumnDescriptors.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
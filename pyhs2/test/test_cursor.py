@@ -1,7 +1,12 @@
 import mock
 import unittest
-from pyhs2.TCLIService.ttypes import TSessionHandle, TCloseOperationReq
+from pyhs2.TCLIService.ttypes import TSessionHandle, TCloseOperationReq, TFetchResultsResp, TRowSet, TRow, \
+    TColumnValue, TI32Value, TStringValue, TColumn, TI32Column, TStringColumn, TGetOperationStatusResp, \
+    TOperationState, TStatus, TStatusCode, TGetResultSetMetadataResp, TTableSchema, TColumnDesc, TTypeDesc, \
+    TTypeEntry, TPrimitiveTypeEntry, TTypeId, TTypeQualifiers, TTypeQualifierValue
+from pyhs2.error import Pyhs2Exception
 from pyhs2.cursor import Cursor
+from pyhs2.schema import ColumnDescriptor
 
 
 class TestCursor(unittest.TestCase):
@@ -14,6 +19,11 @@ class TestCursor(unittest.TestCase):
     def create_cursor(self):
         return Cursor(self.mock_client, self.session_handle)
 
+    def create_page(self, values, hasMoreRows=True):
+        rows = [TRow(colVals=[TColumnValue(i32Val=TI32Value(i)), TColumnValue(stringVal=TStringValue(s))])
+                for i, s in values]
+        return TFetchResultsResp(hasMoreRows=hasMoreRows, results=TRowSet(startRowOffset=0, rows=rows))
+
     def test_autocloses_operation_as_context_manager(self):
         mock_op_handle = mock.MagicMock()
         self.mock_client.ExecuteStatement.return_value = mock_op_handle
@@ -22,3 +32,194 @@ class TestCursor(unittest.TestCase):
 
         self.mock_client.CloseOperation.assert_called_once_with(
             TCloseOperationReq(mock_op_handle.operationHandle))
+
+    def test_iter_rows_fetches_pages_lazily(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a'), (2, 'b')]),
+            self.create_page([(3, 'c')]),
+            self.create_page([]),
+        ]
+        cursor = self.create_cursor()
+        rows = cursor.iter_rows()
+        self.assertEqual(self.mock_client.FetchResults.call_count, 0)
+
+        self.assertEqual(next(rows), [1, 'a'])
+        self.assertEqual(self.mock_client.FetchResults.call_count, 1)
+
+        self.assertEqual(list(rows), [[2, 'b'], [3, 'c']])
+        self.assertEqual(self.mock_client.FetchResults.call_count, 3)
+
+    def test_iterating_cursor_yields_rows(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a')]),
+            self.create_page([]),
+        ]
+        self.assertEqual([row for row in self.create_cursor()], [[1, 'a']])
+
+    def test_fetchone_and_fetchmany_share_page_buffer(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a'), (2, 'b'), (3, 'c')]),
+            self.create_page([(4, 'd')]),
+            self.create_page([]),
+        ]
+        cursor = self.create_cursor()
+        self.assertEqual(cursor.fetchone(), [1, 'a'])
+        self.assertEqual(cursor.fetchmany(3), [[2, 'b'], [3, 'c'], [4, 'd']])
+        self.assertEqual(cursor.fetchall(), [])
+        self.assertIsNone(cursor.fetchone())
+
+    def test_arraysize_drives_max_rows(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a')]),
+        ]
+        cursor = self.create_cursor()
+        cursor.arraysize = 100
+        self.assertEqual(cursor.fetchone(), [1, 'a'])
+        fetchReq = self.mock_client.FetchResults.call_args[0][0]
+        self.assertEqual(fetchReq.maxRows, 100)
+
+    def test_short_final_page_skips_empty_fetch(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a'), (2, 'b')], hasMoreRows=False),
+        ]
+        cursor = self.create_cursor()
+        self.assertEqual(cursor.fetch(), [[1, 'a'], [2, 'b']])
+        self.assertEqual(self.mock_client.FetchResults.call_count, 1)
+        self.assertEqual(cursor.roundTripsSaved, 1)
+
+    def test_full_page_without_more_rows_keeps_fetching(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a'), (2, 'b')], hasMoreRows=False),
+            self.create_page([(3, 'c'), (4, 'd')], hasMoreRows=False),
+            self.create_page([], hasMoreRows=False),
+        ]
+        cursor = self.create_cursor()
+        cursor.arraysize = 2
+        self.assertEqual(len(cursor.fetch()), 4)
+        self.assertEqual(self.mock_client.FetchResults.call_count, 3)
+        self.assertEqual(cursor.roundTripsSaved, 0)
+
+    def test_fetch_columnar_pages(self):
+        columns = [TColumn(i32Val=TI32Column(values=[1, 0, 3], nulls='\x02')),
+                   TColumn(stringVal=TStringColumn(values=['a', 'b', 'c'], nulls=''))]
+        self.mock_client.FetchResults.side_effect = [
+            TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=[], columns=columns)),
+        ]
+        cursor = self.create_cursor()
+        self.assertEqual(cursor.fetchone(), [1, 'a'])
+        self.assertEqual(cursor.fetchall(), [[None, 'b'], [3, 'c']])
+        self.assertEqual(self.mock_client.FetchResults.call_count, 1)
+
+    def create_status(self, state, errorMessage=None):
+        return TGetOperationStatusResp(status=TStatus(statusCode=TStatusCode.SUCCESS_STATUS),
+                                       operationState=state, errorMessage=errorMessage)
+
+    @mock.patch('pyhs2.cursor.time.sleep')
+    def test_async_execute_waits_before_fetching(self, mock_sleep):
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        self.mock_client.GetOperationStatus.side_effect = [
+            self.create_status(TOperationState.RUNNING_STATE),
+            self.create_status(TOperationState.RUNNING_STATE),
+            self.create_status(TOperationState.FINISHED_STATE),
+        ]
+        self.mock_client.FetchResults.side_effect = [self.create_page([(1, 'a')], hasMoreRows=False)]
+        cursor = self.create_cursor()
+        cursor.execute(self.to_execute, async_=True)
+        self.assertTrue(self.mock_client.ExecuteStatement.call_args[0][0].runAsync)
+        self.assertEqual(self.mock_client.GetOperationStatus.call_count, 0)
+
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+        self.assertEqual(self.mock_client.GetOperationStatus.call_count, 3)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [0.1, 0.1 * 1.5])
+
+    def test_poll_raises_on_error_state(self):
+        self.mock_client.GetOperationStatus.return_value = self.create_status(
+            TOperationState.ERROR_STATE, errorMessage='boom')
+        with self.assertRaises(Pyhs2Exception):
+            self.create_cursor().poll()
+
+    @mock.patch('pyhs2.cursor.time.sleep')
+    def test_wait_times_out(self, _mock_sleep):
+        self.mock_client.GetOperationStatus.return_value = self.create_status(TOperationState.RUNNING_STATE)
+        cursor = self.create_cursor()
+        self.assertTrue(cursor.is_running())
+        self.assertIsNone(cursor.wait(timeout=0))
+
+    def test_prefetch_reads_ahead(self):
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([(1, 'a'), (2, 'b')]),
+            self.create_page([(3, 'c')]),
+            self.create_page([]),
+        ]
+        cursor = self.create_cursor()
+        cursor.prefetch = 2
+        rows = cursor.iter_rows()
+        self.assertEqual(next(rows), [1, 'a'])
+        cursor._pages._thread.join()
+        self.assertEqual(self.mock_client.FetchResults.call_count, 3)
+        self.assertEqual(list(rows), [[2, 'b'], [3, 'c']])
+
+    def test_prefetch_raises_fetch_errors(self):
+        self.mock_client.FetchResults.side_effect = [self.create_page([(1, 'a')]), IOError('connection reset')]
+        cursor = self.create_cursor()
+        cursor.prefetch = 1
+        with self.assertRaises(IOError):
+            cursor.fetchall()
+
+    def test_execute_stops_prefetching(self):
+        self.mock_client.FetchResults.return_value = self.create_page([(1, 'a')])
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        cursor = self.create_cursor()
+        cursor.prefetch = 1
+        cursor.fetchone()
+        prefetcher = cursor._pages
+        cursor.execute(self.to_execute)
+        self.assertFalse(prefetcher._thread.is_alive())
+        self.assertIsNone(cursor._pages)
+
+    def test_schema_is_fetched_once_per_operation(self):
+        qualifiers = TTypeQualifiers(qualifiers={'precision': TTypeQualifierValue(i32Value=10),
+                                                 'scale': TTypeQualifierValue(i32Value=2)})
+        self.mock_client.GetResultSetMetadata.return_value = TGetResultSetMetadataResp(
+            status=TStatus(TStatusCode.SUCCESS_STATUS), schema=TTableSchema(columns=[
+                TColumnDesc(columnName='price', position=1, comment='net', typeDesc=TTypeDesc(types=[TTypeEntry(
+                    primitiveEntry=TPrimitiveTypeEntry(type=TTypeId.DECIMAL_TYPE, typeQualifiers=qualifiers))]))]))
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        cursor = self.create_cursor()
+        cursor.execute(self.to_execute)
+        self.assertEqual(cursor.getSchema(), [{'columnName': 'price', 'type': 'DECIMAL_TYPE', 'comment': 'net'}])
+        self.assertEqual(cursor.getColumnDescriptors(), (
+            ColumnDescriptor('price', 'DECIMAL_TYPE', TTypeId.DECIMAL_TYPE, {'precision': 10, 'scale': 2}, True, 'net'),))
+        self.assertEqual(self.mock_client.GetResultSetMetadata.call_count, 1)
+
+        cursor.execute(self.to_execute)
+        cursor.getSchema()
+        self.assertEqual(self.mock_client.GetResultSetMetadata.call_count, 2)
+
+    def create_metadata(self, statusCode=TStatusCode.SUCCESS_STATUS, errorMessage=None):
+        return TGetResultSetMetadataResp(
+            status=TStatus(statusCode, errorMessage=errorMessage), schema=TTableSchema(columns=[
+                TColumnDesc(columnName='n', position=1, typeDesc=TTypeDesc(types=[
+                    TTypeEntry(primitiveEntry=TPrimitiveTypeEntry(type=TTypeId.INT_TYPE))]))]))
+
+    @mock.patch('pyhs2.cursor.time.sleep')
+    def test_schema_waits_for_async_execute(self, _mock_sleep):
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        statuses = [self.create_status(TOperationState.RUNNING_STATE),
+                    self.create_status(TOperationState.FINISHED_STATE)]
+        calls = []
+        self.mock_client.GetOperationStatus.side_effect = lambda req: calls.append('status') or statuses.pop(0)
+        self.mock_client.GetResultSetMetadata.side_effect = lambda req: calls.append('metadata') or \
+            self.create_metadata()
+        cursor = self.create_cursor()
+        cursor.execute(self.to_execute, async_=True)
+        self.assertEqual([column.name for column in cursor.getColumnDescriptors()], ['n'])
+        self.assertEqual(calls, ['status', 'status', 'metadata'])
+
+    def test_schema_raises_on_error_status(self):
+        self.mock_client.ExecuteStatement.return_value.status.errorCode = None
+        self.mock_client.GetResultSetMetadata.return_value = self.create_metadata(
+            TStatusCode.ERROR_STATUS, errorMessage='Invalid OperationHandle')
+        cursor = self.create_cursor()
+        cursor.execute(self.to_execute)
+        self.assertRaises(Pyhs2Exception, cursor.getColumnDescriptors)
@@ -0,0 +1,71 @@
+import mock
+import unittest
+from pyhs2.decoders import RowDecoder
+
+try:
+    from tornado import gen
+    from tornado.ioloop import IOLoop
+except ImportError:
+    gen = None
+else:
+    from pyhs2.cursor_tornado import TornadoCursor
+    from pyhs2.TCLIServiceTornado.ttypes import TSessionHandle, TExecuteStatementResp, TFetchResultsResp, \
+        TGetResultSetMetadataResp, TRowSet, TRow, TColumnValue, TI32Value, TStringValue, TStatus, TStatusCode, \
+        TTableSchema, TColumnDesc, TTypeDesc, TTypeEntry, TPrimitiveTypeEntry, TTypeId, TColumn, TI32Column
+
+
+def reply(value):
+    return lambda req, callback: callback(value)
+
+
+@unittest.skipIf(gen is None, 'tornado is not installed')
+class TestTornadoCursor(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.mock_client.ExecuteStatement.side_effect = reply(TExecuteStatementResp(
+            status=TStatus(TStatusCode.SUCCESS_STATUS), operationHandle=mock.MagicMock()))
+        self.mock_client.GetResultSetMetadata.side_effect = reply(TGetResultSetMetadataResp(
+            status=TStatus(TStatusCode.SUCCESS_STATUS), schema=TTableSchema(columns=[
+                TColumnDesc(columnName=name, position=i, typeDesc=TTypeDesc(types=[
+                    TTypeEntry(primitiveEntry=TPrimitiveTypeEntry(type=typeId))]))
+                for i, (name, typeId) in enumerate([('n', TTypeId.INT_TYPE), ('s', TTypeId.STRING_TYPE)])])))
+        # The first row's NULL leaves nothing to learn the slots from.
+        rows = [TRow(colVals=[TColumnValue(), TColumnValue(stringVal=TStringValue('a'))]),
+                TRow(colVals=[TColumnValue(i32Val=TI32Value(2)), TColumnValue(stringVal=TStringValue('b'))])]
+        self.mock_client.FetchResults.side_effect = reply(
+            TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=rows)))
+
+    def test_fetch_decodes_with_schema_slots(self):
+        cursor = TornadoCursor(self.mock_client, TSessionHandle(sessionId=2))
+
+        @gen.coroutine
+        def run():
+            yield gen.Task(cursor.execute, 'SELECT * FROM t')
+            rows = yield gen.Task(cursor.fetch)
+            more = yield gen.Task(cursor.fetch)
+            raise gen.Return(rows + more)
+
+        with mock.patch('pyhs2.cursor_tornado.RowDecoder.from_types', side_effect=RowDecoder.from_types) as from_types:
+            rows = IOLoop.current().run_sync(run)
+        self.assertEqual(rows, [[None, 'a'], [2, 'b']] * 2)
+        from_types.assert_called_once_with(['INT_TYPE', 'STRING_TYPE'])
+        self.assertEqual(self.mock_client.GetResultSetMetadata.call_count, 1)
+
+    def test_columnar_fetch_skips_metadata(self):
+        self.mock_client.FetchResults.side_effect = reply(TFetchResultsResp(hasMoreRows=False, results=TRowSet(
+            startRowOffset=0, rows=[], columns=[TColumn(i32Val=TI32Column(values=[1, 2], nulls=''))])))
+        cursor = TornadoCursor(self.mock_client, TSessionHandle(sessionId=2))
+
+        @gen.coroutine
+        def run():
+            yield gen.Task(cursor.execute, 'SELECT * FROM t')
+            rows = yield gen.Task(cursor.fetch)
+            raise gen.Return(rows)
+
+        self.assertEqual(IOLoop.current().run_sync(run), [[1], [2]])
+        self.assertFalse(self.mock_client.GetResultSetMetadata.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
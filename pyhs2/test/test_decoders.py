@@ -0,0 +1,50 @@
+import mock
+import unittest
+from pyhs2.TCLIService.ttypes import TRow, TColumnValue, TI32Value, TStringValue, TDoubleValue
+from pyhs2.TCLIService.ttypes import TColumn, TI64Column, TRowSet
+from pyhs2.decoders import RowDecoder, get_value, apply_nulls, column_values, count_rows
+
+
+class TestRowDecoder(unittest.TestCase):
+
+    def create_row(self, i, s, d):
+        return TRow(colVals=[TColumnValue(i32Val=TI32Value(i)),
+                             TColumnValue(stringVal=TStringValue(s)),
+                             TColumnValue(doubleVal=TDoubleValue(d))])
+
+    def test_learns_slots_from_first_row(self):
+        decoder = RowDecoder()
+        rows = decoder.decode_rows([self.create_row(1, 'a', 0.5), self.create_row(None, None, None)])
+        self.assertEqual(decoder.slots, ['i32Val', 'stringVal', 'doubleVal'])
+        self.assertEqual(rows, [[1, 'a', 0.5], [None, None, None]])
+
+    def test_slots_from_schema_types(self):
+        decoder = RowDecoder.from_types(['INT_TYPE', 'STRING_TYPE', 'DOUBLE_TYPE'])
+        self.assertEqual(decoder.slots, ['i32Val', 'stringVal', 'doubleVal'])
+        self.assertEqual(decoder.decode_rows([self.create_row(7, 'x', 1.5)]), [[7, 'x', 1.5]])
+
+    def test_falls_back_to_probing_on_mismatched_slots(self):
+        decoder = RowDecoder.from_types(['INT_TYPE', 'STRING_TYPE', 'DOUBLE_TYPE'])
+        row = TRow(colVals=[TColumnValue(), TColumnValue(stringVal=TStringValue('y')),
+                            TColumnValue(doubleVal=TDoubleValue(2.0))])
+        self.assertEqual(decoder.decode_rows([row]), [[None, 'y', 2.0]])
+
+    def test_get_value_probes_slots(self):
+        self.assertEqual(get_value(TColumnValue(stringVal=TStringValue('z'))), 'z')
+        self.assertIsNone(get_value(TColumnValue()))
+
+
+class TestColumnarDecoding(unittest.TestCase):
+
+    def test_apply_nulls_reads_bitmap_lsb_first(self):
+        values = range(10)
+        self.assertEqual(apply_nulls(values, '\x05\x02'), [None, 1, None, 3, 4, 5, 6, 7, 8, None])
+        self.assertIs(apply_nulls(values, '\x00\x00'), values)
+
+    def test_column_values_and_row_count(self):
+        column = TColumn(i64Val=TI64Column(values=[10, 20], nulls='\x01'))
+        self.assertEqual(column_values(column), [None, 20])
+        with mock.patch('pyhs2.decoders.apply_nulls') as mock_apply_nulls:
+            self.assertEqual(count_rows(TRowSet(startRowOffset=0, rows=[], columns=[column])), 2)
+        self.assertFalse(mock_apply_nulls.called)
+        self.assertEqual(count_rows(TRowSet(startRowOffset=0, rows=[], columns=[TColumn()])), 0)
@@ -0,0 +1,70 @@
+import mock
+import unittest
+from pyhs2.TCLIService.ttypes import TSessionHandle, TFetchResultsResp, TRowSet, TColumn, TI32Column, \
+    TDoubleColumn, TStringColumn, TBoolColumn, TTypeId
+from pyhs2.cursor import Cursor
+from pyhs2.schema import ColumnDescriptor
+from pyhs2.frames import numpy, pandas
+from pyhs2.converters import Converters
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestFrames(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.cursor = Cursor(self.mock_client, TSessionHandle(sessionId=2))
+        self.cursor.getColumnDescriptors = mock.MagicMock(return_value=(
+            ColumnDescriptor('id', 'INT_TYPE', TTypeId.INT_TYPE, {}, True, None),
+            ColumnDescriptor('score', 'DOUBLE_TYPE', TTypeId.DOUBLE_TYPE, {}, True, None),
+            ColumnDescriptor('name', 'STRING_TYPE', TTypeId.STRING_TYPE, {}, True, None),
+        ))
+        self.cursor.arraysize = 2
+        self.mock_client.FetchResults.side_effect = [
+            self.create_page([1, 2], [0.5, 1.5], ['a', 'b'], '\x00'),
+            self.create_page([3], [2.5], ['c'], '\x01'),
+        ]
+
+    def create_page(self, ids, scores, names, nulls):
+        columns = [TColumn(i32Val=TI32Column(values=ids, nulls=nulls)),
+                   TColumn(doubleVal=TDoubleColumn(values=scores, nulls='')),
+                   TColumn(stringVal=TStringColumn(values=names, nulls=nulls))]
+        return TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=[], columns=columns))
+
+    def test_fetch_numpy_builds_typed_masked_columns(self):
+        arrays = self.cursor.fetch_numpy()
+        self.assertEqual(list(arrays), ['id', 'score', 'name'])
+        self.assertEqual(arrays['id'].dtype, numpy.int32)
+        self.assertEqual(arrays['id'].mask.tolist(), [False, False, True])
+        self.assertEqual(arrays['id'][:2].tolist(), [1, 2])
+        self.assertEqual(arrays['score'].tolist(), [0.5, 1.5, 2.5])
+        self.assertEqual(arrays['name'].tolist(), ['a', 'b', None])
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_fetch_dataframe(self):
+        self.cursor.getColumnDescriptors.return_value += (
+            ColumnDescriptor('flag', 'BOOLEAN_TYPE', TTypeId.BOOLEAN_TYPE, {}, True, None),)
+        pages = [self.create_page([1, 2], [0.5, 1.5], ['a', 'b'], '\x00'),
+                 self.create_page([3], [2.5], ['c'], '\x01')]
+        for page, flags, nulls in zip(pages, [[True, False], [True]], ['\x01', '']):
+            page.results.columns.append(TColumn(boolVal=TBoolColumn(values=flags, nulls=nulls)))
+        self.mock_client.FetchResults.side_effect = pages
+        frame = self.cursor.fetch_dataframe()
+        self.assertEqual(list(frame.columns), ['id', 'score', 'name', 'flag'])
+        self.assertEqual(len(frame), 3)
+        self.assertTrue(frame['id'].isnull().tolist()[2])
+        self.assertEqual(frame['score'].sum(), 4.5)
+        self.assertEqual(frame['name'].tolist(), ['a', 'b', None])
+        self.assertEqual(frame['flag'].tolist(), [None, False, True])
+
+    def test_converted_timestamps_are_datetime64(self):
+        self.cursor.getColumnDescriptors.return_value = (
+            ColumnDescriptor('ts', 'TIMESTAMP_TYPE', TTypeId.TIMESTAMP_TYPE, {}, True, None),)
+        self.cursor.converters = Converters()
+        self.mock_client.FetchResults.side_effect = [TFetchResultsResp(hasMoreRows=False, results=TRowSet(
+            startRowOffset=0, rows=[], columns=[TColumn(stringVal=TStringColumn(
+                values=['2015-03-01 12:00:00.25', ''], nulls='\x02'))]))]
+        array = self.cursor.fetch_numpy()['ts']
+        self.assertEqual(array.dtype, numpy.dtype('datetime64[us]'))
+        self.assertEqual(array[0], numpy.datetime64('2015-03-01T12:00:00.250000'))
+        self.assertEqual(array.mask.tolist(), [False, True])
@@ -0,0 +1,118 @@
+import mock
+import unittest
+
+from pyhs2.connections import Connection
+from pyhs2.error import Pyhs2Exception
+from pyhs2.instrumentation import Histogram, InstrumentedClient, Metrics, Observer, PrometheusExporter, \
+    StatsdExporter, prometheus_client
+from pyhs2.testing import FakeHiveServer2, PlainConnection
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_buckets_and_quantiles(self):
+        histogram = Histogram([1, 2, 5])
+        for value in [0.5, 1, 1.5, 3, 4, 7]:
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 2, 1])
+        self.assertEqual((histogram.count, histogram.sum, histogram.max), (6, 17, 7))
+        self.assertEqual(histogram.quantile(0.5), 2)
+        self.assertEqual(histogram.quantile(0.99), 7)
+        self.assertEqual(Histogram().quantile(0.5), None)
+
+
+class TestInstrumentedClient(unittest.TestCase):
+
+    def test_reports_calls_and_errors(self):
+        observer = mock.MagicMock(spec=Observer)
+        client = mock.MagicMock()
+        client.CloseOperation.side_effect = IOError('gone')
+        instrumented = InstrumentedClient(client, observer)
+        self.assertEqual(instrumented.FetchResults('req'), client.FetchResults.return_value)
+        self.assertRaises(IOError, instrumented.CloseOperation, 'req')
+        calls = observer.rpc.call_args_list
+        self.assertEqual([call[0][0] for call in calls], ['FetchResults', 'CloseOperation'])
+        self.assertEqual(calls[0][0][2:], (0, 0, None))
+        self.assertIsInstance(calls[1][0][4], IOError)
+        # Anything else is the wrapped client's.
+        self.assertIs(instrumented._iprot, client._iprot)
+
+
+class TestConnectionObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeHiveServer2()
+        self.server.add_table('t', width=4, rows=25)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.metrics = Metrics()
+        self.conn = Connection(host=self.server.host, port=self.server.port, authMechanism='NOSASL',
+                               observer=self.metrics)
+        self.addCleanup(self.conn.close)
+
+    def test_records_rpcs_bytes_and_decoding(self):
+        with self.conn.cursor() as cursor:
+            cursor.arraysize = 10
+            cursor.execute('SELECT * FROM t')
+            self.assertEqual(len(cursor.fetchall()), 25)
+        snapshot = self.metrics.snapshot()
+        rpc = snapshot['rpc']
+        self.assertEqual(rpc['OpenSession']['seconds']['count'], 1)
+        self.assertEqual(rpc['ExecuteStatement']['seconds']['count'], 1)
+        self.assertEqual(rpc['FetchResults']['seconds']['count'], 3)
+        self.assertTrue(rpc['FetchResults']['bytesReceived'] > rpc['FetchResults']['bytesSent'] > 0)
+        self.assertEqual(snapshot['decode']['rows'], 25)
+        self.assertEqual(snapshot['decode']['seconds']['count'], 3)
+
+    def test_counts_errors(self):
+        with self.conn.cursor() as cursor:
+            self.assertRaises(Pyhs2Exception, cursor.execute, 'SELECT * FROM missing')
+        # A failed statement is still a successful call.
+        self.assertEqual(self.metrics.snapshot()['rpc']['ExecuteStatement']['errors'], 0)
+
+    def test_exporters_see_every_event(self):
+        statsd = mock.MagicMock()
+        self.metrics.add_exporter(StatsdExporter(statsd))
+        with self.conn.cursor() as cursor:
+            cursor.execute('SELECT * FROM t')
+            cursor.fetchall()
+        timings = [call[0][0] for call in statsd.timing.call_args_list]
+        self.assertEqual(timings, ['pyhs2.rpc.ExecuteStatement.time', 'pyhs2.rpc.FetchResults.time',
+                                   'pyhs2.decode.time', 'pyhs2.rpc.CloseOperation.time'])
+        statsd.incr.assert_any_call('pyhs2.decode.rows', 25)
+
+    @unittest.skipIf(prometheus_client is None, 'prometheus_client is not installed')
+    def test_prometheus_exporter(self):
+        registry = prometheus_client.CollectorRegistry()
+        self.metrics.add_exporter(PrometheusExporter(registry))
+        self.conn.ping()
+        self.assertEqual(registry.get_sample_value('pyhs2_rpc_seconds_count', {'method': 'GetInfo'}), 1)
+
+
+class TestSaslByteCounts(unittest.TestCase):
+
+    def fetch(self, authMechanism):
+        server = FakeHiveServer2(authMechanism=authMechanism)
+        server.add_table('t', width=4, rows=25)
+        server.start()
+        self.addCleanup(server.stop)
+        metrics = Metrics()
+        with PlainConnection(host=server.host, port=server.port, authMechanism=authMechanism, user='u',
+                             password='p', observer=metrics) as conn:
+            with conn.cursor() as cursor:
+                cursor.arraysize = 10
+                cursor.execute('SELECT * FROM t')
+                cursor.fetchall()
+        return metrics.snapshot()['rpc']['FetchResults']
+
+    def test_sasl_frames_are_counted_in_full(self):
+        plain, nosasl = self.fetch('PLAIN'), self.fetch('NOSASL')
+        self.assertTrue(nosasl['bytesReceived'] > 25 * 4)
+        # The same messages, plus a 4-byte frame header for each of the
+        # three requests and responses.
+        self.assertEqual(plain['bytesReceived'], nosasl['bytesReceived'] + 3 * 4)
+        self.assertEqual(plain['bytesSent'], nosasl['bytesSent'] + 3 * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
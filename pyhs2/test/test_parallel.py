@@ -0,0 +1,129 @@
+import threading
+import unittest
+from pyhs2.connections import Connection
+from pyhs2.error import Pyhs2Exception
+from pyhs2.parallel import execute_sharded
+from pyhs2.testing import FakeHiveServer2
+
+
+class FakeCursor(object):
+    arraysize = 2
+
+    def __init__(self, results, failures):
+        self.results = results
+        self.failures = failures
+        self._pages = iter(())
+
+    def execute(self, hql):
+        failure = self.failures.get(hql)
+        if failure and failure[0] == 'execute':
+            self.failures.pop(hql)
+            raise failure[1]
+        self._hql = hql
+        self._pages = iter(self.results[hql])
+
+    def fetchmany(self, size):
+        # Every page given in results is one fetchmany's worth of rows.
+        failure = self.failures.get(self._hql)
+        for page in self._pages:
+            return page
+        if failure:
+            raise failure[1]
+        return []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        pass
+
+
+class FakeConnection(object):
+
+    def __init__(self, results, failures):
+        self.results = results
+        self.failures = failures
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self.results, self.failures)
+
+    def close(self):
+        self.closed = True
+
+
+class TestExecuteSharded(unittest.TestCase):
+
+    def setUp(self):
+        self.results = {
+            "SELECT * FROM t WHERE p='a'": [[['a', 1], ['a', 2]], [['a', 3]]],
+            "SELECT * FROM t WHERE p='b'": [[['b', 1]]],
+            "SELECT * FROM t WHERE p='c'": [],
+        }
+        self.failures = {}
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def connect(self):
+        conn = FakeConnection(self.results, self.failures)
+        with self.lock:
+            self.connections.append(conn)
+        return conn
+
+    def run_sharded(self, **kwargs):
+        return list(execute_sharded(self.connect, "SELECT * FROM t WHERE p='%s'", ['a', 'b', 'c'], **kwargs))
+
+    def test_ordered_by_shard(self):
+        rows = self.run_sharded(workers=3, maxPages=1)
+        self.assertEqual(rows, [['a', 1], ['a', 2], ['a', 3], ['b', 1]])
+        self.assertTrue(all(conn.closed for conn in self.connections))
+        self.assertTrue(len(self.connections) <= 3)
+
+    def test_unordered_returns_every_row(self):
+        rows = self.run_sharded(workers=2, ordered=False)
+        self.assertEqual(sorted(rows), [['a', 1], ['a', 2], ['a', 3], ['b', 1]])
+
+    def test_retries_shard_on_transport_error(self):
+        self.failures["SELECT * FROM t WHERE p='b'"] = ('execute', IOError('connection reset'))
+        rows = self.run_sharded(workers=1)
+        self.assertEqual(rows, [['a', 1], ['a', 2], ['a', 3], ['b', 1]])
+        self.assertEqual(len(self.connections), 2)
+        self.assertTrue(self.connections[0].closed)
+
+    def test_no_retry_after_rows_returned(self):
+        self.failures["SELECT * FROM t WHERE p='a'"] = ('fetch', IOError('connection reset'))
+        with self.assertRaises(IOError):
+            self.run_sharded(workers=1)
+
+    def test_query_error_is_raised(self):
+        self.failures["SELECT * FROM t WHERE p='c'"] = ('execute', Pyhs2Exception(10001, 'Table not found'))
+        with self.assertRaises(Pyhs2Exception):
+            self.run_sharded(workers=2)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_consumer_can_stop_early(self):
+        rows = execute_sharded(self.connect, "SELECT * FROM t WHERE p='%s'", ['a', 'b', 'c'], maxPages=1)
+        self.assertEqual(next(rows), ['a', 1])
+        rows.close()
+        for conn in self.connections:
+            for _ in xrange(50):
+                if conn.closed:
+                    break
+                threading.Event().wait(0.02)
+            self.assertTrue(conn.closed)
+
+
+class TestExecuteShardedServer(unittest.TestCase):
+
+    def test_rows_through_real_cursors(self):
+        server = FakeHiveServer2()
+        tables = [server.add_table(name, width=3, rows=30) for name in ('a', 'b')]
+        server.start()
+        self.addCleanup(server.stop)
+        connect = lambda: Connection(host=server.host, port=server.port, authMechanism='NOSASL')
+        rows = list(execute_sharded(connect, 'SELECT * FROM %s', ['a', 'b']))
+        self.assertEqual(rows, [list(row) for table in tables for row in zip(*table.data)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import mock
+import threading
+import time
+import unittest
+from pyhs2.error import Pyhs2Exception
+from pyhs2.pool import ConnectionPool
+from pyhs2.testing import FakeHiveServer2
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('pyhs2.pool.Connection', side_effect=self.create_connection)
+        self.mock_connection_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connections = []
+
+    def create_connection(self, **kwargs):
+        conn = mock.MagicMock()
+        conn.database = None
+        conn.ping.return_value = True
+
+        def use(database):
+            conn.database = database
+        conn.use.side_effect = use
+        self.connections.append(conn)
+        return conn
+
+    def test_reuses_released_session(self):
+        pool = ConnectionPool(maxSize=2, host='localhost', authMechanism='NOSASL')
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        self.assertIs(first.connection, second.connection)
+        self.assertEqual(self.mock_connection_class.call_count, 1)
+        self.mock_connection_class.assert_called_with(host='localhost', authMechanism='NOSASL')
+        second.connection.ping.assert_called_once_with()
+
+    def test_prefills_min_size(self):
+        pool = ConnectionPool(minSize=2, maxSize=3)
+        self.assertEqual(len(self.connections), 2)
+        pool.close()
+        for conn in self.connections:
+            conn.close.assert_called_once_with()
+
+    def test_dead_session_is_replaced(self):
+        pool = ConnectionPool(maxSize=1)
+        pool.acquire().close()
+        self.connections[0].ping.return_value = False
+        conn = pool.acquire()
+        self.assertIs(conn.connection, self.connections[1])
+        self.connections[0].close.assert_called_once_with()
+
+    def test_expired_session_is_replaced(self):
+        pool = ConnectionPool(maxSize=1, maxLifetime=60)
+        conn = pool.acquire()
+        conn.createdAt -= 120
+        conn.close()
+        self.assertIs(pool.acquire().connection, self.connections[1])
+
+    def test_overlay_database_and_configuration(self):
+        pool = ConnectionPool(maxSize=1)
+        with pool.connection(database='sales', configuration={'hive.exec.parallel': 'true'}) as conn:
+            conn.cursor()
+            conn.connection.cursor.assert_called_with(confOverlay={'hive.exec.parallel': 'true'})
+            self.assertEqual(conn.database, 'sales')
+        with pool.connection() as conn:
+            self.assertEqual(conn.database, 'default')
+            conn.cursor()
+            conn.connection.cursor.assert_called_with(confOverlay={})
+
+    def test_second_release_is_ignored(self):
+        pool = ConnectionPool(maxSize=2)
+        with pool.connection() as first:
+            first.close()
+        second = pool.acquire()
+        self.assertIs(second.connection, self.connections[0])
+        # A stale reference cannot hand the session back while it is in use.
+        first.close()
+        first.discard()
+        self.assertIs(pool.acquire().connection, self.connections[1])
+        self.assertFalse(self.connections[0].close.called)
+
+    def test_concurrent_checkouts_respect_max_size(self):
+        pool = ConnectionPool(maxSize=2)
+        take = pool._take
+
+        def slow_take():
+            # Let the other threads run between finding room and opening.
+            conn = take()
+            time.sleep(0.01)
+            return conn
+        pool._take = slow_take
+        lock = threading.Lock()
+        checkedOut = [0, 0]
+
+        def worker():
+            with pool.connection():
+                with lock:
+                    checkedOut[0] += 1
+                    checkedOut[1] = max(checkedOut)
+                time.sleep(0.01)
+                with lock:
+                    checkedOut[0] -= 1
+        threads = [threading.Thread(target=worker) for _ in xrange(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(checkedOut[1], 2)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_failed_open_gives_back_its_slot(self):
+        pool = ConnectionPool(maxSize=1, timeout=0)
+        self.mock_connection_class.side_effect = IOError('refused')
+        self.assertRaises(IOError, pool.acquire)
+        self.mock_connection_class.side_effect = self.create_connection
+        self.assertIs(pool.acquire().connection, self.connections[0])
+
+    def test_times_out_when_exhausted(self):
+        pool = ConnectionPool(maxSize=1, timeout=0)
+        pool.acquire()
+        with self.assertRaises(Pyhs2Exception):
+            pool.acquire()
+
+    def test_transport_error_discards_session(self):
+        pool = ConnectionPool(maxSize=1)
+        with self.assertRaises(IOError):
+            with pool.connection():
+                raise IOError('connection reset')
+        self.connections[0].close.assert_called_once_with()
+        self.assertIs(pool.acquire().connection, self.connections[1])
+
+
+class TestConnectionPoolDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeHiveServer2()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def test_cursor_use_does_not_leak_to_next_checkout(self):
+        pool = ConnectionPool(maxSize=1, host=self.server.host, port=self.server.port, authMechanism='NOSASL')
+        self.addCleanup(pool.close)
+        with pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('USE sales')
+            self.assertEqual(conn.database, 'sales')
+        with pool.connection() as conn:
+            self.assertEqual(conn.database, 'default')
@@ -0,0 +1,85 @@
+import mock
+import unittest
+from pyhs2.TCLIService.ttypes import TSessionHandle, TFetchResultsResp, TRowSet, TRow, TColumnValue, TI32Value, \
+    TStringValue, TColumn, TI32Column, TStringColumn, TTypeId
+from pyhs2.cursor import Cursor
+from pyhs2.decoders import RowDecoder
+from pyhs2.rows import dict_rows, field_names, named_rows, tuple_rows
+from pyhs2.schema import ColumnDescriptor
+
+
+class TestRowFactories(unittest.TestCase):
+
+    def test_field_names(self):
+        self.assertEqual(field_names(['t.id', 'class', 'a b', 'id', '_c0', '1x']),
+                         ('id', 'f1_class', 'a_b', 'id_3', 'f4__c0', 'f5_1x'))
+
+    def test_named_rows(self):
+        make = named_rows(['t.id', 't.name'])
+        row = make((1, 'a'))
+        self.assertEqual((row.id, row.name), (1, 'a'))
+        self.assertEqual((row[0], row[-1], row[:1]), (1, 'a', (1,)))
+        self.assertEqual(row, (1, 'a'))
+        self.assertEqual(list(row), [1, 'a'])
+        self.assertEqual(row._asdict(), {'id': 1, 'name': 'a'})
+        self.assertFalse(hasattr(row, '__dict__'))
+        with self.assertRaises(AttributeError):
+            row.other = 1
+
+    def test_decoder_builds_tuples_directly(self):
+        decoder = RowDecoder(['i32Val', 'stringVal'], make=tuple)
+        rows = decoder.decode_rows([TRow(colVals=[TColumnValue(i32Val=TI32Value(1)),
+                                                  TColumnValue(stringVal=TStringValue('a'))])])
+        self.assertEqual(rows, [(1, 'a')])
+
+
+class TestCursorRowFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = mock.MagicMock()
+        self.cursor = Cursor(self.mock_client, TSessionHandle(sessionId=2))
+        self.cursor.getColumnDescriptors = mock.MagicMock(return_value=(
+            ColumnDescriptor('t.id', 'INT_TYPE', TTypeId.INT_TYPE, {}, True, None),
+            ColumnDescriptor('t.name', 'STRING_TYPE', TTypeId.STRING_TYPE, {}, True, None),
+        ))
+
+    def row_page(self):
+        rows = [TRow(colVals=[TColumnValue(i32Val=TI32Value(i)), TColumnValue(stringVal=TStringValue(s))])
+                for i, s in [(1, 'a'), (2, 'b')]]
+        return TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=rows))
+
+    def column_page(self):
+        columns = [TColumn(i32Val=TI32Column(values=[1, 2], nulls='')),
+                   TColumn(stringVal=TStringColumn(values=['a', 'b'], nulls=''))]
+        return TFetchResultsResp(hasMoreRows=False, results=TRowSet(startRowOffset=0, rows=[], columns=columns))
+
+    def test_tuple_rows(self):
+        self.cursor.rowFactory = tuple_rows
+        for page in (self.row_page(), self.column_page()):
+            self.mock_client.FetchResults.side_effect = [page]
+            self.cursor._reset_results()
+            self.assertEqual(self.cursor.fetchall(), [(1, 'a'), (2, 'b')])
+        self.assertEqual(self.cursor.getColumnDescriptors.call_count, 0)
+
+    def test_named_rows(self):
+        self.cursor.rowFactory = named_rows
+        for page in (self.row_page(), self.column_page()):
+            self.mock_client.FetchResults.side_effect = [page]
+            self.cursor._reset_results()
+            rows = self.cursor.fetchall()
+            self.assertEqual([(row.id, row.name) for row in rows], [(1, 'a'), (2, 'b')])
+
+    def test_dict_rows(self):
+        self.cursor.rowFactory = dict_rows
+        self.mock_client.FetchResults.side_effect = [self.row_page()]
+        self.assertEqual(self.cursor.fetchall(), [{'t.id': 1, 't.name': 'a'}, {'t.id': 2, 't.name': 'b'}])
+
+    def test_buffered_dict_rows_become_columns(self):
+        self.cursor.rowFactory = dict_rows
+        self.mock_client.FetchResults.side_effect = [self.column_page()]
+        self.cursor.fetchone()
+        self.assertEqual(list(self.cursor._iter_column_pages()), [[(2,), ('b',)]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import socket
+import unittest
+from thrift.transport.TTransport import TTransportException
+
+from pyhs2.connections import Connection
+from pyhs2.sockets import DEFAULT_SOCKET_OPTIONS, TunedSocket, tcp_options
+from pyhs2.testing import FakeHiveServer2
+
+try:
+    from tornado.ioloop import IOLoop
+except ImportError:
+    IOLoop = None
+
+
+class TestSocketOptions(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeHiveServer2()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def assertTuned(self, sock, recvBuffer):
+        self.assertTrue(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            self.assertEqual(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE), 30)
+        # Linux doubles the requested size for its bookkeeping.
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= recvBuffer)
+
+    def test_tcp_options(self):
+        options = tcp_options(keepalive=None, recvBuffer=1 << 20)
+        self.assertEqual(options, [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                                   (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)])
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), DEFAULT_SOCKET_OPTIONS)
+        self.assertEqual(tcp_options(nodelay=False, keepalive=None), [])
+
+    def test_connection_applies_options(self):
+        options = tcp_options(keepalive=30, recvBuffer=1 << 20)
+        conn = Connection(host=self.server.host, port=self.server.port, authMechanism='NOSASL',
+                          socketOptions=options)
+        self.addCleanup(conn.close)
+        self.assertTrue(conn.ping())
+        self.assertTuned(conn.socket.handle, 1 << 20)
+
+    def test_defaults_and_no_options(self):
+        sock = TunedSocket(self.server.host, self.server.port)
+        sock.open()
+        self.addCleanup(sock.close)
+        self.assertTrue(sock.handle.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        bare = TunedSocket(self.server.host, self.server.port, socketOptions=[])
+        bare.open()
+        self.addCleanup(bare.close)
+        self.assertFalse(bare.handle.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_connect_failure(self):
+        self.server.stop()
+        self.assertRaises(TTransportException, TunedSocket(self.server.host, self.server.port).open)
+
+    @unittest.skipIf(IOLoop is None, 'tornado is not installed')
+    def test_tornado_transport_applies_options(self):
+        from pyhs2.sockets_tornado import TunedStreamTransport
+        transport = TunedStreamTransport(self.server.host, self.server.port,
+                                         tcp_options(keepalive=30, recvBuffer=1 << 20))
+        IOLoop.current().run_sync(transport.open)
+        self.addCleanup(transport.close)
+        self.assertTuned(transport.stream.socket, 1 << 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
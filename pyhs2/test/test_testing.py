@@ -0,0 +1,109 @@
+import time
+import unittest
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.transport.TSocket import TSocket
+from thrift.transport.TTransport import TTransportException
+
+from pyhs2.cloudera.thrift_sasl import TSaslClientTransport
+from pyhs2.connections import Connection
+from pyhs2.error import Pyhs2Exception
+from pyhs2.instrumentation import Observer
+from pyhs2.TCLIService import TCLIService
+from pyhs2.TCLIService.ttypes import TOpenSessionReq, TProtocolVersion, TTypeId, TStatusCode
+from pyhs2.testing import FakeHiveServer2, PlainSaslClient, Table
+
+
+class TestFakeHiveServer2(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeHiveServer2()
+        self.server.add_table('wide', width=6, rows=25, nullEvery=7)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def connect(self, **kwargs):
+        conn = Connection(host=self.server.host, port=self.server.port, authMechanism='NOSASL', **kwargs)
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_select_pages_through_table(self):
+        with self.connect().cursor() as cursor:
+            cursor.arraysize = 10
+            cursor.execute('SELECT * FROM wide')
+            rows = cursor.fetchall()
+            self.assertEqual([col['columnName'] for col in cursor.getSchema()], ['c%d' % i for i in xrange(6)])
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[4], [4, 'value-4', 2.0, 4000012, None, 'value-4'])
+        # Every 7th value of a column is NULL, column i starting at row i.
+        self.assertEqual(rows[0][0], None)
+        self.assertEqual(rows[7][0], None)
+        self.assertEqual(rows[8][1], None)
+        self.assertEqual(rows[1][:2], [1, None])
+
+    def test_row_based_protocol(self):
+        conn = self.connect(clientProtocol=TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V1)
+        self.assertEqual(conn.protocolVersion, TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V1)
+        with conn.cursor() as cursor:
+            cursor.execute('select c0 from wide limit 3')
+            self.assertEqual([row[:2] for row in cursor.fetchall()], [[None, 'value-0'], [1, None],
+                                                                      [2, 'value-2']])
+
+    def test_unknown_table(self):
+        with self.connect().cursor() as cursor:
+            self.assertRaises(Pyhs2Exception, cursor.execute, 'SELECT * FROM missing')
+
+    def test_custom_table_and_databases(self):
+        self.server.add_table('t', table=Table([('n', TTypeId.INT_TYPE)], [[3, 1, 2]]))
+        conn = self.connect(database='default')
+        self.assertTrue(conn.ping())
+        with conn.cursor() as cursor:
+            self.assertEqual(cursor.getDatabases(), [['default', '']])
+            cursor.execute('SELECT n FROM t')
+            self.assertEqual(cursor.fetchall(), [[3], [1], [2]])
+
+    def test_latency_applies_to_every_call(self):
+        self.server.latency = 0.05
+        conn = self.connect()
+        start = time.time()
+        conn.ping()
+        self.assertTrue(time.time() - start >= 0.05)
+
+    def test_counts_bytes_sent(self):
+        conn = self.connect(observer=Observer())
+        sent, read = self.server.bytesSent, conn.socket.bytesRead
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT * FROM wide')
+            cursor.fetchall()
+        self.assertTrue(self.server.bytesSent - sent > 25 * 6)
+        # Every reply the client has read is already counted.
+        for _ in xrange(50):
+            conn.ping()
+            self.assertEqual(self.server.bytesSent - sent, conn.socket.bytesRead - read)
+
+
+class TestFakeHiveServer2Plain(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeHiveServer2(authMechanism='PLAIN', users={'hive': 'secret'})
+        self.server.add_table('t', width=2, rows=3)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def open(self, password):
+        transport = TSaslClientTransport(PlainSaslClient('hive', password), 'PLAIN',
+                                         TSocket(self.server.host, self.server.port))
+        transport.open()
+        self.addCleanup(transport.close)
+        return TCLIService.Client(TBinaryProtocol(transport))
+
+    def test_plain_sasl_session(self):
+        client = self.open('secret')
+        res = client.OpenSession(TOpenSessionReq())
+        self.assertEqual(res.status.statusCode, TStatusCode.SUCCESS_STATUS)
+
+    def test_wrong_password_is_rejected(self):
+        self.assertRaises(TTransportException, self.open, 'wrong')
+
+
+if __name__ == "__main__":
+    unittest.main()
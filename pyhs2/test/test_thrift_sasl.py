@@ -0,0 +1,62 @@
+import socket
+import struct
+import unittest
+
+from thrift.protocol import TBinaryProtocol
+from thrift.transport.TSocket import TSocket
+
+from pyhs2.cloudera.thrift_sasl import TSaslClientTransport
+
+
+def frame(payload):
+    return struct.pack('>I', len(payload)) + payload
+
+
+class TestSaslFraming(unittest.TestCase):
+
+    def setUp(self):
+        self.server, client = socket.socketpair()
+        sock = TSocket()
+        sock.handle = client
+        self.transport = TSaslClientTransport(None, 'PLAIN', sock)
+        # Negotiated a QOP of auth: frames carry plain payloads.
+        self.transport.encode = False
+
+    def tearDown(self):
+        self.server.close()
+        self.transport.close()
+
+    def test_flush_writes_one_plain_frame(self):
+        self.transport.write('abc')
+        self.transport.write(bytearray('def'))
+        self.transport.flush()
+        self.transport.write('g')
+        self.transport.flush()
+        self.assertEqual(self.server.recv(100), frame('abcdef') + frame('g'))
+
+    def test_reads_across_frames(self):
+        self.server.sendall(frame('hello') + frame('world!'))
+        self.assertEqual(self.transport.read(3), 'hel')
+        self.assertEqual(self.transport.read(10), 'lo')
+        self.assertEqual(self.transport.read(10), 'world!')
+
+    def test_refill_joins_prefix_and_frames(self):
+        self.server.sendall(frame('cd') + frame('efgh'))
+        buf = self.transport.cstringio_refill('ab', 5)
+        self.assertEqual(buf.read(), 'abcdefgh')
+
+    def test_accelerated_protocol_reads_split_frames(self):
+        payload = struct.pack('>i', 7) + struct.pack('>i', 5) + 'hello'
+        self.server.sendall(frame(payload[:3]) + frame(payload[3:6]) + frame(payload[6:]))
+        protocol = TBinaryProtocol.TBinaryProtocolAccelerated(self.transport)
+        self.assertEqual(protocol.readI32(), 7)
+        self.assertEqual(protocol.readString(), 'hello')
+
+    def test_closed_socket_raises(self):
+        self.server.sendall(struct.pack('>I', 10) + 'short')
+        self.server.close()
+        self.assertRaises(Exception, self.transport.read, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+
+from pyhs2.connections import Connection
+from pyhs2.TCLIService import TCLIService
+from pyhs2.testing import FakeHiveServer2, PlainConnection, PlainSasl
+from pyhs2.tracing import NULL_SPAN, RecordingTracer, start_span
+
+try:
+    from tornado import gen
+    from tornado.ioloop import IOLoop
+except ImportError:
+    gen = None
+
+
+def sasl_reply_size(res):
+    """Bytes of a FetchResults reply in a SASL frame, as the server sends it."""
+    buff = TMemoryBuffer()
+    protocol = TBinaryProtocol(buff)
+    protocol.writeMessageBegin('FetchResults', TMessageType.REPLY, 0)
+    TCLIService.FetchResults_result(success=res).write(protocol)
+    protocol.writeMessageEnd()
+    return 4 + len(buff.getvalue())
+
+
+class TestTracing(unittest.TestCase):
+
+    def start(self, authMechanism):
+        server = FakeHiveServer2(authMechanism=authMechanism)
+        server.add_table('t', width=3, rows=25)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_disabled_spans_do_nothing(self):
+        with start_span(None, 'pyhs2.execute') as span:
+            span.set_attribute('pyhs2.rows', 1)
+        self.assertIs(span, NULL_SPAN)
+
+    def test_sync_spans(self):
+        server = self.start('PLAIN')
+        tracer = RecordingTracer()
+        responses = []
+        with PlainConnection(host=server.host, port=server.port, authMechanism='PLAIN', user='u', password='p',
+                             tracer=tracer) as conn:
+            fetch = conn.client.client.FetchResults
+            conn.client.client.FetchResults = lambda req: responses.append(fetch(req)) or responses[-1]
+            with conn.cursor() as cursor:
+                cursor.arraysize = 10
+                cursor.execute('SELECT * FROM t')
+                self.assertEqual(len(cursor.fetchall()), 25)
+        connect, = tracer.find('pyhs2.connect')
+        children = [span.name for span in tracer.spans if span.parent is connect]
+        self.assertEqual(children, ['pyhs2.tcp_connect', 'pyhs2.sasl_negotiate', 'pyhs2.open_session'])
+        self.assertEqual(connect.attributes['pyhs2.auth_mechanism'], 'PLAIN')
+        execute, = tracer.find('pyhs2.execute')
+        self.assertEqual(execute.attributes['db.statement'], 'SELECT * FROM t')
+        pages = tracer.find('pyhs2.fetch_page')
+        self.assertEqual([page.attributes['pyhs2.rows'] for page in pages], [10, 10, 5])
+        # Whole SASL frames, not just their headers.
+        self.assertEqual([page.attributes['net.bytes_received'] for page in pages],
+                         [sasl_reply_size(res) for res in responses])
+        self.assertEqual(set(page.attributes['pyhs2.operation_id'] for page in pages),
+                         set([execute.attributes['pyhs2.operation_id']]))
+
+    def test_nosasl_has_no_sasl_span(self):
+        server = self.start('NOSASL')
+        tracer = RecordingTracer()
+        Connection(host=server.host, port=server.port, authMechanism='NOSASL', tracer=tracer).close()
+        self.assertEqual([span.name for span in tracer.spans],
+                         ['pyhs2.tcp_connect', 'pyhs2.open_session', 'pyhs2.connect'])
+
+    @unittest.skipIf(gen is None, 'tornado is not installed')
+    def test_tornado_spans(self):
+        from pyhs2.connections_tornado import TornadoConnection
+
+        class PlainTornadoConnection(PlainSasl, TornadoConnection):
+            pass
+
+        server = self.start('PLAIN')
+        tracer = RecordingTracer()
+        responses = []
+
+        @gen.coroutine
+        def run():
+            conn = PlainTornadoConnection(host=server.host, port=server.port, authMechanism='PLAIN', user='u',
+                                          password='p', tracer=tracer)
+            fetch = conn.client.FetchResults
+            conn.client.FetchResults = lambda req, callback: fetch(
+                req, callback=lambda res: callback(responses.append(res) or res))
+            yield gen.Task(conn.connect, database=None, configuration=None)
+            cursor = conn.cursor()
+            yield gen.Task(cursor.execute, 'SELECT * FROM t')
+            rows = yield gen.Task(cursor.fetch)
+            yield gen.Task(cursor.close)
+            yield gen.Task(conn.close)
+            raise gen.Return(rows)
+
+        rows = IOLoop.current().run_sync(run)
+        self.assertEqual(len(rows), 25)
+        self.assertEqual([span.name for span in tracer.spans],
+                         ['pyhs2.tcp_connect', 'pyhs2.sasl_negotiate', 'pyhs2.open_session', 'pyhs2.connect',
+                          'pyhs2.execute', 'pyhs2.fetch_page'])
+        page, = tracer.find('pyhs2.fetch_page')
+        self.assertEqual(page.attributes['pyhs2.rows'], 25)
+        self.assertEqual(page.attributes['net.bytes_received'], sasl_reply_size(responses[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
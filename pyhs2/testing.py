@@ -0,0 +1,473 @@
+"""
+An in-process HiveServer2 stand-in for tests and benchmarks.
+
+FakeHiveServer2 serves the generated TCLIService.Processor on a local socket
+with synthetic in-memory tables, so the real client code paths (sockets,
+NOSASL or PLAIN SASL framing, Thrift encoding, paging) can be exercised and
+timed without a cluster:
+
+    server = FakeHiveServer2(latency=0.001)
+    server.add_table('wide', width=50, rows=100000)
+    with server:
+        conn = pyhs2.connect(host=server.host, port=server.port, authMechanism='NOSASL')
+        conn.cursor().execute('SELECT * FROM wide')
+
+The server runs on threads of the calling process and shares its GIL, so
+it is meant for relative measurements.
+"""
+import itertools
+import re
+import socket
+import struct
+import threading
+import time
+
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol, TBinaryProtocolAccelerated
+from thrift.transport.TSocket import TSocket
+from thrift.transport.TTransport import TBufferedTransport, TFramedTransport, TTransportException
+try:
+    from thrift.protocol import fastbinary
+except ImportError:
+    fastbinary = None
+
+from TCLIService import TCLIService
+from connections import Connection
+from TCLIService.ttypes import TOpenSessionResp, TCloseSessionResp, TGetInfoResp, TGetInfoValue, \
+    TExecuteStatementResp, TGetOperationStatusResp, TCancelOperationResp, TCloseOperationResp, \
+    TGetResultSetMetadataResp, TFetchResultsResp, TGetSchemasResp, TStatus, TStatusCode, TSessionHandle, \
+    TOperationHandle, THandleIdentifier, TOperationType, TOperationState, TProtocolVersion, TTableSchema, \
+    TColumnDesc, TTypeDesc, TTypeEntry, TPrimitiveTypeEntry, TTypeId, TRowSet, TRow, TColumn, TColumnValue, \
+    TBoolColumn, TByteColumn, TI16Column, TI32Column, TI64Column, TDoubleColumn, TStringColumn, \
+    TBoolValue, TByteValue, TI16Value, TI32Value, TI64Value, TDoubleValue, TStringValue
+
+# SASL negotiation status bytes, as in cloudera.thrift_sasl.
+SASL_START, SASL_OK, SASL_BAD, SASL_ERROR, SASL_COMPLETE = 1, 2, 3, 4, 5
+
+# For each supported type: TColumn slot and class, TColumnValue slot and class,
+# and the generator of the value in row i.
+COLUMN_TYPES = {
+    TTypeId.BOOLEAN_TYPE: ('boolVal', TBoolColumn, 'boolVal', TBoolValue, lambda i: i % 2 == 0),
+    TTypeId.TINYINT_TYPE: ('byteVal', TByteColumn, 'byteVal', TByteValue, lambda i: i % 128),
+    TTypeId.SMALLINT_TYPE: ('i16Val', TI16Column, 'i16Val', TI16Value, lambda i: i % 32768),
+    TTypeId.INT_TYPE: ('i32Val', TI32Column, 'i32Val', TI32Value, lambda i: i),
+    TTypeId.BIGINT_TYPE: ('i64Val', TI64Column, 'i64Val', TI64Value, lambda i: i * 1000003),
+    TTypeId.FLOAT_TYPE: ('doubleVal', TDoubleColumn, 'doubleVal', TDoubleValue, lambda i: i * 0.25),
+    TTypeId.DOUBLE_TYPE: ('doubleVal', TDoubleColumn, 'doubleVal', TDoubleValue, lambda i: i * 0.5),
+    TTypeId.STRING_TYPE: ('stringVal', TStringColumn, 'stringVal', TStringValue, lambda i: 'value-%d' % i),
+    TTypeId.TIMESTAMP_TYPE: ('stringVal', TStringColumn, 'stringVal', TStringValue,
+                             lambda i: '2015-01-01 00:%02d:%02d.%03d' % (i / 60 % 60, i % 60, i % 1000)),
+    TTypeId.DATE_TYPE: ('stringVal', TStringColumn, 'stringVal', TStringValue,
+                        lambda i: '2015-01-%02d' % (i % 28 + 1)),
+    TTypeId.DECIMAL_TYPE: ('stringVal', TStringColumn, 'stringVal', TStringValue, lambda i: '%d.%02d' % (i, i % 100)),
+}
+
+# Column types used, in turn, by tables created with only a width.
+DEFAULT_TYPES = (TTypeId.INT_TYPE, TTypeId.STRING_TYPE, TTypeId.DOUBLE_TYPE, TTypeId.BIGINT_TYPE)
+
+_SELECT = re.compile(r'\s*select\s+.+?\s+from\s+(?:`?\w+`?\.)?`?(\w+)`?(?:\s+limit\s+(\d+))?\s*;?\s*$',
+                     re.I | re.S)
+
+
+def _status():
+    return TStatus(statusCode=TStatusCode.SUCCESS_STATUS)
+
+
+def _error(message, errorCode=10001, sqlState='42S02'):
+    return TStatus(statusCode=TStatusCode.ERROR_STATUS, errorCode=errorCode, errorMessage=message,
+                   sqlState=sqlState)
+
+
+def _nulls(values):
+    # TColumn null bitmap: bit i of byte i / 8, least significant bit first.
+    bitmap = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is None:
+            bitmap[index >> 3] |= 1 << (index & 7)
+    return str(bitmap)
+
+
+class Table(object):
+    """
+    An in-memory result set: (name, TTypeId) columns and one list of values
+    per column.
+    """
+
+    def __init__(self, columns, data):
+        self.columns = list(columns)
+        self.data = data
+
+    @classmethod
+    def synthetic(cls, width=10, rows=1000, types=None, nullEvery=0):
+        """
+        Generate rows rows of width columns, cycling through types (a list
+        of TTypeIds). With nullEvery=N every Nth value of a column is NULL.
+        """
+        types = types or DEFAULT_TYPES
+        columns = [('c%d' % index, types[index % len(types)]) for index in xrange(width)]
+        data = []
+        for index, (_, typeId) in enumerate(columns):
+            generate = COLUMN_TYPES[typeId][4]
+            values = [generate(i) for i in xrange(rows)]
+            if nullEvery:
+                for i in xrange(index % nullEvery, rows, nullEvery):
+                    values[i] = None
+            data.append(values)
+        return cls(columns, data)
+
+    def __len__(self):
+        return len(self.data[0]) if self.data else 0
+
+    def schema(self):
+        return TTableSchema(columns=[
+            TColumnDesc(columnName=name, position=position + 1,
+                        typeDesc=TTypeDesc(types=[TTypeEntry(primitiveEntry=TPrimitiveTypeEntry(type=typeId))]))
+            for position, (name, typeId) in enumerate(self.columns)])
+
+    def columnar_page(self, start, end):
+        page = []
+        for (_, typeId), values in zip(self.columns, self.data):
+            columnSlot, columnClass = COLUMN_TYPES[typeId][:2]
+            values = values[start:end]
+            nulls = _nulls(values) if None in values else ''
+            if nulls:
+                zero = COLUMN_TYPES[typeId][4](0)
+                values = [zero if value is None else value for value in values]
+            page.append(TColumn(**{columnSlot: columnClass(values=values, nulls=nulls)}))
+        return TRowSet(startRowOffset=start, rows=[], columns=page)
+
+    def row_page(self, start, end):
+        makers = []
+        for _, typeId in self.columns:
+            valueSlot, valueClass = COLUMN_TYPES[typeId][2:4]
+            makers.append((valueSlot, valueClass))
+        rows = []
+        for values in itertools.izip(*[values[start:end] for values in self.data]):
+            rows.append(TRow(colVals=[TColumnValue(**{slot: valueClass(value)})
+                                      for (slot, valueClass), value in zip(makers, values)]))
+        return TRowSet(startRowOffset=start, rows=rows)
+
+
+class _Operation(object):
+
+    def __init__(self, table, limit=None):
+        self.table = table
+        self.offset = 0
+        self.end = len(table) if table is not None else 0
+        if limit is not None:
+            self.end = min(self.end, limit)
+
+
+class FakeHandler(TCLIService.Iface):
+    """
+    TCLIService handler backing FakeHiveServer2.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.sessions = {}
+        self.operations = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _identifier(self):
+        with self._lock:
+            guid = struct.pack('>QQ', 0, next(self._ids))
+        return THandleIdentifier(guid=guid, secret='\x00' * 16)
+
+    def _operation(self, sessionHandle, operation, operationType):
+        handle = TOperationHandle(operationId=self._identifier(), operationType=operationType,
+                                  hasResultSet=operation.table is not None)
+        with self._lock:
+            self.operations[handle.operationId.guid] = (sessionHandle.sessionId.guid, operation)
+        return handle
+
+    def _lookup(self, operationHandle):
+        with self._lock:
+            entry = self.operations.get(operationHandle.operationId.guid)
+        return entry[1] if entry is not None else None
+
+    def OpenSession(self, req):
+        protocol = min(req.client_protocol, self.server.protocolVersion)
+        handle = TSessionHandle(sessionId=self._identifier())
+        with self._lock:
+            self.sessions[handle.sessionId.guid] = protocol
+        return TOpenSessionResp(status=_status(), serverProtocolVersion=protocol, sessionHandle=handle,
+                                configuration={})
+
+    def CloseSession(self, req):
+        guid = req.sessionHandle.sessionId.guid
+        with self._lock:
+            self.sessions.pop(guid, None)
+            for key in [key for key, (session, _) in self.operations.iteritems() if session == guid]:
+                del self.operations[key]
+        return TCloseSessionResp(status=_status())
+
+    def GetInfo(self, req):
+        return TGetInfoResp(status=_status(), infoValue=TGetInfoValue(stringValue='FakeHiveServer2'))
+
+    def ExecuteStatement(self, req):
+        select = _SELECT.match(req.statement)
+        if select is None:
+            operation = _Operation(None)
+        else:
+            table = self.server.tables.get(select.group(1).lower())
+            if table is None:
+                return TExecuteStatementResp(status=_error('Table not found %s' % select.group(1)))
+            operation = _Operation(table, int(select.group(2)) if select.group(2) else None)
+        handle = self._operation(req.sessionHandle, operation, TOperationType.EXECUTE_STATEMENT)
+        return TExecuteStatementResp(status=_status(), operationHandle=handle)
+
+    def GetSchemas(self, req):
+        table = Table([('TABLE_SCHEM', TTypeId.STRING_TYPE), ('TABLE_CATALOG', TTypeId.STRING_TYPE)],
+                      [['default'], ['']])
+        handle = self._operation(req.sessionHandle, _Operation(table), TOperationType.GET_SCHEMAS)
+        return TGetSchemasResp(status=_status(), operationHandle=handle)
+
+    def GetOperationStatus(self, req):
+        if self._lookup(req.operationHandle) is None:
+            return TGetOperationStatusResp(status=_error('Invalid OperationHandle', 0, 'HY000'))
+        return TGetOperationStatusResp(status=_status(), operationState=TOperationState.FINISHED_STATE)
+
+    def CancelOperation(self, req):
+        return TCancelOperationResp(status=_status())
+
+    def CloseOperation(self, req):
+        with self._lock:
+            self.operations.pop(req.operationHandle.operationId.guid, None)
+        return TCloseOperationResp(status=_status())
+
+    def GetResultSetMetadata(self, req):
+        operation = self._lookup(req.operationHandle)
+        if operation is None or operation.table is None:
+            return TGetResultSetMetadataResp(status=_error('Invalid OperationHandle', 0, 'HY000'))
+        return TGetResultSetMetadataResp(status=_status(), schema=operation.table.schema())
+
+    def FetchResults(self, req):
+        operation = self._lookup(req.operationHandle)
+        if operation is None or operation.table is None:
+            return TFetchResultsResp(status=_error('Invalid OperationHandle', 0, 'HY000'))
+        with self._lock:
+            protocol = self.sessions.get(self.operations[req.operationHandle.operationId.guid][0])
+            start = operation.offset
+            end = min(operation.end, start + max(req.maxRows, 0))
+            operation.offset = end
+        if protocol is not None and protocol >= TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V6:
+            results = operation.table.columnar_page(start, end)
+        else:
+            results = operation.table.row_page(start, end)
+        return TFetchResultsResp(status=_status(), hasMoreRows=end < operation.end, results=results)
+
+
+class _DelayedHandler(object):
+    """
+    Sleeps for the server's latency before every call.
+    """
+
+    def __init__(self, handler, server):
+        self._handler = handler
+        self._server = server
+
+    def __getattr__(self, name):
+        method = getattr(self._handler, name)
+
+        def call(*args):
+            self._server._delay()
+            return method(*args)
+        return call
+
+
+class PlainSaslClient(object):
+    """
+    The part of a sasl.Client that TSaslClientTransport uses, for PLAIN
+    only: lets clients talk to a PLAIN FakeHiveServer2 without libsasl.
+    """
+
+    def __init__(self, user, password):
+        self.response = '\x00%s\x00%s' % (user, password)
+
+    def start(self, mechanism):
+        return True, mechanism, self.response
+
+    def step(self, challenge):
+        return True, ''
+
+    def encode(self, data):
+        return True, data
+
+    def decode(self, data):
+        return True, data
+
+    def getError(self):
+        return 'error'
+
+
+class PlainSasl(object):
+    """
+    Mixed into a connection class (Connection, TornadoConnection,
+    AsyncConnection) to do PLAIN with PlainSaslClient instead of libsasl.
+    """
+
+    def _get_sasl_client(self, host, authMechanism, user, password, configuration):
+        return PlainSaslClient(user, password), 'PLAIN'
+
+
+class PlainConnection(PlainSasl, Connection):
+    pass
+
+
+class _CountingSocket(TSocket):
+    """
+    A server-side TSocket adding what it writes to server.bytesSent. Bytes
+    are counted before they are sent, so a client that has read a reply
+    sees it counted.
+    """
+
+    def __init__(self, server):
+        TSocket.__init__(self)
+        self.server = server
+
+    def write(self, buff):
+        with self.server._lock:
+            self.server.bytesSent += len(buff)
+        TSocket.write(self, buff)
+
+
+class FakeHiveServer2(object):
+    """
+    Serves synthetic tables over the HiveServer2 Thrift protocol on a local
+    port (an ephemeral one when port is 0).
+
+    authMechanism is 'NOSASL' (buffered transport) or 'PLAIN' (SASL PLAIN
+    handshake, then length-framed messages); PLAIN accepts any user whose
+    password matches users.get(user), or anyone when users is None. latency
+    seconds are slept before answering every call and every SASL message,
+    to stand in for a network round trip. Statements of the form
+    SELECT ... FROM table [LIMIT n] read the named table; anything else
+    succeeds without a result set. bytesSent counts the bytes written to
+    clients, SASL framing included, and already includes every reply a
+    client has received.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, authMechanism='NOSASL', latency=0, users=None,
+                 protocolVersion=TProtocolVersion.HIVE_CLI_SERVICE_PROTOCOL_V6, accelerated=True):
+        if authMechanism not in ('NOSASL', 'PLAIN'):
+            raise NotImplementedError('FakeHiveServer2 supports NOSASL and PLAIN')
+        self.host = host
+        self.port = port
+        self.authMechanism = authMechanism
+        self.latency = latency
+        self.users = users
+        self.protocolVersion = protocolVersion
+        self.accelerated = accelerated and fastbinary is not None
+        self.tables = {}
+        self.handler = FakeHandler(self)
+        self.connections = 0
+        self.bytesSent = 0
+        self._lock = threading.Lock()
+        self._socket = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def add_table(self, name, width=10, rows=1000, types=None, nullEvery=0, table=None):
+        """
+        Register a synthetic table (see Table.synthetic), or the given Table.
+        """
+        self.tables[name.lower()] = table or Table.synthetic(width, rows, types, nullEvery)
+        return self.tables[name.lower()]
+
+    def _delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def start(self):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.host, self.port))
+        listener.listen(16)
+        listener.settimeout(0.1)
+        self.port = listener.getsockname()[1]
+        self._socket = listener
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._serve, name='fake-hiveserver2')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def __enter__(self):
+        if self._thread is None:
+            self.start()
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        self.stop()
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                client, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except socket.error:
+                return
+            client.settimeout(None)
+            self.connections += 1
+            thread = threading.Thread(target=self._handle, args=(client,), name='fake-hiveserver2-client')
+            thread.daemon = True
+            thread.start()
+
+    def _handle(self, client):
+        sock = _CountingSocket(self)
+        sock.setHandle(client)
+        try:
+            if self.authMechanism == 'PLAIN':
+                if not self._negotiate(sock):
+                    return
+                transport = TFramedTransport(sock)
+            else:
+                transport = TBufferedTransport(sock)
+            protocol = TBinaryProtocolAccelerated(transport) if self.accelerated else TBinaryProtocol(transport)
+            processor = TCLIService.Processor(_DelayedHandler(self.handler, self))
+            while not self._stopped.is_set():
+                processor.process(protocol, protocol)
+        except (TTransportException, EOFError, socket.error):
+            pass
+        finally:
+            sock.close()
+
+    def _send_sasl(self, sock, status, body=''):
+        self._delay()
+        sock.write(struct.pack('>BI', status, len(body)) + body)
+        sock.flush()
+
+    def _recv_sasl(self, sock):
+        status, length = struct.unpack('>BI', sock.readAll(5))
+        return status, sock.readAll(length) if length else ''
+
+    def _negotiate(self, sock):
+        """
+        Server side of the SASL PLAIN exchange: START carrying the mechanism,
+        OK carrying authzid NUL user NUL password, answered by COMPLETE.
+        """
+        status, mechanism = self._recv_sasl(sock)
+        if status != SASL_START or mechanism != 'PLAIN':
+            self._send_sasl(sock, SASL_BAD, 'Unsupported mechanism %s' % mechanism)
+            return False
+        status, response = self._recv_sasl(sock)
+        if status != SASL_OK or response.count('\x00') != 2:
+            self._send_sasl(sock, SASL_BAD, 'Malformed PLAIN response')
+            return False
+        _, user, password = response.split('\x00')
+        if self.users is not None and self.users.get(user) != password:
+            self._send_sasl(sock, SASL_BAD, 'Authentication failed for %s' % user)
+            return False
+        self._send_sasl(sock, SASL_COMPLETE)
+        return True
@@ -0,0 +1,128 @@
+"""
+Optional tracing spans for connect, execute and each FetchResults page.
+
+Pass a tracer to Connection(tracer=...) or TornadoConnection(tracer=...).
+Any object with OpenTelemetry's start_as_current_span(name, attributes=None)
+works: a context manager yielding a span with set_attribute(key, value).
+Spans:
+
+    pyhs2.connect           Connection.__init__ / TornadoConnection.connect
+      pyhs2.tcp_connect     opening the socket
+      pyhs2.sasl_negotiate  the SASL exchange (not for NOSASL)
+      pyhs2.open_session    the OpenSession call
+    pyhs2.execute           Cursor.execute, with the operation handle GUID
+    pyhs2.fetch_page        each FetchResults call, with rows and bytes
+
+Without a tracer no spans are made and nothing is added per row: the cost
+is one None check per call above.
+
+RecordingTracer keeps finished spans in memory, for tests and debugging.
+"""
+import threading
+import time
+
+
+class _NullSpan(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+NULL_SPAN = _NullSpan()
+
+
+def start_span(tracer, name, attributes=None):
+    """
+    tracer.start_as_current_span(name, attributes), or a span that does
+    nothing when tracer is None.
+    """
+    if tracer is None:
+        return NULL_SPAN
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def operation_id(operationHandle):
+    """
+    The GUID of an operation handle as HiveServer2 logs it, or None.
+    """
+    if operationHandle is None:
+        return None
+    guid = operationHandle.operationId.guid
+    if len(guid) == 16:
+        # uuid is slow to import on Python 2 and only needed with a tracer.
+        import uuid
+        return str(uuid.UUID(bytes=guid))
+    return guid.encode('hex')
+
+
+class RecordedSpan(object):
+
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.start = time.time()
+        self.end = None
+        self.error = None
+
+    @property
+    def duration(self):
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __repr__(self):
+        return '<RecordedSpan %s %r>' % (self.name, self.attributes)
+
+
+class _ActiveSpan(object):
+
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self):
+        self.tracer._stack().append(self.span)
+        return self.span
+
+    def __exit__(self, _exc_type, exc_value, _traceback):
+        self.span.end = time.time()
+        self.span.error = exc_value
+        stack = self.tracer._stack()
+        if stack and stack[-1] is self.span:
+            stack.pop()
+        with self.tracer._lock:
+            self.tracer.spans.append(self.span)
+        return False
+
+
+class RecordingTracer(object):
+    """
+    Records finished spans in spans, in the order they end. The parent of a
+    span is the one current on the same thread when it started; coroutines
+    interleaved on one IOLoop can therefore attach spans to each other.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start_as_current_span(self, name, attributes=None):
+        stack = self._stack()
+        return _ActiveSpan(self, RecordedSpan(name, attributes, stack[-1] if stack else None))
+
+    def find(self, name):
+        return [span for span in self.spans if span.name == name]